@@ -12,13 +12,50 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
-# Importación de módulos o clases
-from .algorithm import Algorithm
-from .epsilon_greedy import EpsilonGreedy
-from .ucb1 import UCB1
-from .ucb2 import UCB2
-from .softmax import Softmax
-from .gradiente import Gradiente
+from importlib import import_module
+
+# Submódulo de cada módulo o clase pública
+_SUBMODULES = {
+    'Algorithm': '.algorithm',
+    'EpsilonGreedy': '.epsilon_greedy',
+    'UCB1': '.ucb1',
+    'LazyUCB1': '.ucb1_lazy',
+    'UCB2': '.ucb2',
+    'Softmax': '.softmax',
+    'Gradiente': '.gradiente',
+    'BatchedAlgorithm': '.batched',
+    'BatchedEpsilonGreedy': '.batched',
+    'BatchedUCB1': '.batched',
+    'BatchedUCB2': '.batched',
+    'BatchedSoftmax': '.batched',
+    'BatchedGradiente': '.batched',
+    'SlidingWindowUCB1': '.nonstationary',
+    'DiscountedUCB1': '.nonstationary',
+    'SlidingWindowEpsilonGreedy': '.nonstationary',
+    'DiscountedEpsilonGreedy': '.nonstationary',
+    'BanditPool': '.pool',
+    'EpsilonGreedyPool': '.pool',
+    'UCB1Pool': '.pool',
+}
 
 # Lista de módulos o clases públicas
-__all__ = ['Algorithm', 'EpsilonGreedy', 'UCB1', 'UCB2', 'Softmax', 'Gradiente']
+__all__ = ['Algorithm', 'EpsilonGreedy', 'UCB1', 'LazyUCB1', 'UCB2', 'Softmax', 'Gradiente',
+           'BatchedAlgorithm', 'BatchedEpsilonGreedy', 'BatchedUCB1', 'BatchedUCB2', 'BatchedSoftmax', 'BatchedGradiente',
+           'SlidingWindowUCB1', 'DiscountedUCB1', 'SlidingWindowEpsilonGreedy', 'DiscountedEpsilonGreedy',
+           'BanditPool', 'EpsilonGreedyPool', 'UCB1Pool']
+
+
+def __getattr__(name: str):
+    """
+    Importación diferida (PEP 562): el submódulo de cada nombre público se carga la primera vez
+    que se usa, de modo que importar el paquete no carga módulos que no se necesitan.
+    """
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_SUBMODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
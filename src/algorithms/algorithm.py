@@ -14,16 +14,26 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 
 
 from abc import ABC, abstractmethod
+from typing import Dict
+
 import numpy as np
 
+from randomness import make_rng
+
 class Algorithm(ABC):
-    def __init__(self, k: int):
+    # Atributos que forman el estado del algoritmo (ver get_state / set_state)
+    STATE = ('counts', 'values')
+
+    def __init__(self, k: int, rng=None):
         """
         Inicializa el algoritmo con k brazos.
         :param k: Número de brazos.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
         """
         # Número de brazos
         self.k: int = k
+        # Generador aleatorio (None utiliza el estado global de np.random)
+        self.rng = make_rng(rng)
         # Número de veces que se ha seleccionado cada brazo
         self.counts: np.ndarray = np.zeros(k, dtype=int)
         # Recompensa promedio estimada de cada brazo
@@ -53,6 +63,81 @@ class Algorithm(ABC):
 
         self.values[chosen_arm] = value + (reward - value) / n
 
+    def update_batch(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        """
+        Registra un lote de observaciones (p.e. recompensas diferidas o registros históricos) con
+        una sola actualización agregada: el número de tiradas y la suma de recompensas de cada brazo
+        se obtienen con np.bincount y la media de cada brazo se actualiza de una vez. Equivale a
+        llamar a update con cada observación, en cualquier orden, salvo por el redondeo.
+        :param chosen_arms: Índice del brazo de cada observación.
+        :param rewards: Recompensa de cada observación.
+        """
+        chosen_arms = np.asarray(chosen_arms, dtype=np.intp)
+        n = np.bincount(chosen_arms, minlength=self.k)
+        totals = np.bincount(chosen_arms, weights=np.asarray(rewards, dtype=float), minlength=self.k)
+
+        arms = np.flatnonzero(n)
+        self.counts[arms] += n[arms]
+        self.values[arms] += (totals[arms] - n[arms] * self.values[arms]) / self.counts[arms]
+
+    def next_arm(self, t: int) -> int:
+        """
+        Protocolo uniforme de paso: selecciona el brazo a tirar en el instante t.
+        Las subclases cuya selección depende de t, o que eligen brazos por épocas, lo redefinen.
+        :param t: Instante de tiempo en el que nos encontramos.
+        :return: Índice del brazo seleccionado.
+        """
+        return self.select_arm()
+
+    def observe(self, chosen_arm: int, reward: float, t: int):
+        """
+        Protocolo uniforme de paso: registra la recompensa obtenida en el instante t.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        :param t: Instante de tiempo en el que nos encontramos.
+        """
+        self.update(chosen_arm, reward)
+
+    def next_epoch(self, t: int) -> (int, int):
+        """
+        Protocolo uniforme por épocas: selecciona un brazo y el número de tiradas consecutivas
+        durante las cuales la decisión no cambia. Por defecto, una sola tirada.
+        :param t: Instante de tiempo en el que nos encontramos.
+        :return: Índice del brazo seleccionado y número de veces que se debe tirar de él.
+        """
+        return self.next_arm(t), 1
+
+    def observe_epoch(self, chosen_arm: int, total_reward: float, n: int, t: int):
+        """
+        Protocolo uniforme por épocas: registra la suma de las recompensas de una época.
+        Las subclases que devuelven épocas de varios pasos en next_epoch deben redefinirlo.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param total_reward: Suma de las recompensas obtenidas en la época.
+        :param n: Número de tiradas de la época.
+        :param t: Instante de tiempo en el que empezó la época.
+        """
+        if n != 1:
+            raise NotImplementedError("Las épocas de varios pasos deben ser registradas por la subclase.")
+        self.observe(chosen_arm, total_reward, t)
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        Obtiene una copia del estado del algoritmo para guardarlo en un punto de control.
+        El estado del generador aleatorio se guarda aparte.
+        :return: Diccionario con el valor de cada atributo de STATE.
+        """
+        return {name: np.array(getattr(self, name)) for name in self.STATE if hasattr(self, name)}
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """
+        Restaura el estado obtenido con get_state.
+        :param state: Diccionario con el valor de cada atributo de STATE.
+        """
+        for name in self.STATE:
+            if name in state:
+                value = np.array(state[name])
+                setattr(self, name, value if value.ndim else value.item())
+
     def reset(self):
         """
         Reinicia el estado del algoritmo (opcional).
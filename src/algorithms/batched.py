@@ -0,0 +1,396 @@
+"""
+Module: algorithms/batched.py
+Description: Versiones por lotes de los algoritmos de selección de brazos. Cada instancia simula
+             R ejecuciones independientes guardando el estado en matrices (ejecuciones x brazos).
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from abc import ABC, abstractmethod
+import math
+
+import numpy as np
+
+from algorithms.algorithm import Algorithm
+from algorithms.epsilon_greedy import EpsilonGreedy
+from algorithms.ucb1 import UCB1
+from algorithms.ucb2 import UCB2, tau_table
+from algorithms.softmax import Softmax
+from algorithms.gradiente import Gradiente
+from algorithms.nonstationary import SlidingWindow, Discounted
+from algorithms.sampling import softmax, sample_categorical
+from randomness import make_rng, get_rng, randint
+
+
+class BatchedAlgorithm(ABC):
+    def __init__(self, k: int, runs: int, rng=None):
+        """
+        Inicializa el algoritmo con k brazos para runs ejecuciones simultáneas.
+        :param k: Número de brazos.
+        :param runs: Número de ejecuciones independientes.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
+        """
+        # Número de brazos
+        self.k: int = k
+        # Número de ejecuciones simuladas a la vez
+        self.runs: int = runs
+        # Generador aleatorio (None utiliza el estado global de np.random)
+        self.rng = make_rng(rng)
+        # Índices de fila para acceder al brazo elegido en cada ejecución
+        self.rows: np.ndarray = np.arange(runs)
+        # Número de veces que se ha seleccionado cada brazo en cada ejecución
+        self.counts: np.ndarray = np.zeros((runs, k), dtype=int)
+        # Recompensa promedio estimada de cada brazo en cada ejecución
+        self.values: np.ndarray = np.zeros((runs, k), dtype=float)
+
+    def per_run(self, param) -> np.ndarray:
+        """
+        Convierte un parámetro escalar o con un valor por ejecución en un array de tamaño runs.
+        :param param: Valor del parámetro.
+        :return: Array con el valor del parámetro para cada ejecución.
+        """
+        return np.broadcast_to(np.asarray(param, dtype=float), (self.runs,)).copy()
+
+    @abstractmethod
+    def select_arms(self, t: int) -> np.ndarray:
+        """
+        Selecciona un brazo en cada ejecución basado en la política del algoritmo.
+        :param t: Instante de tiempo en el que nos encontramos.
+        :return: Array con el índice del brazo seleccionado en cada ejecución.
+        """
+        raise NotImplementedError("Este método debe ser implementado por la subclase.")
+
+    def update_batch(self, arms: np.ndarray, rewards: np.ndarray):
+        """
+        Actualiza las recompensas promedio estimadas del brazo tirado en cada ejecución.
+        :param arms: Índice del brazo tirado en cada ejecución.
+        :param rewards: Recompensa obtenida en cada ejecución.
+        """
+        self.counts[self.rows, arms] += 1
+
+        n = self.counts[self.rows, arms]
+        value = self.values[self.rows, arms]
+
+        # Actualización incremental de la recompensa promedio
+        self.values[self.rows, arms] = value + (rewards - value) / n
+
+    def reset(self):
+        """
+        Reinicia el estado del algoritmo en todas las ejecuciones.
+        """
+        self.counts = np.zeros((self.runs, self.k), dtype=int)
+        self.values = np.zeros((self.runs, self.k), dtype=float)
+
+    @staticmethod
+    def sample_categorical(probs: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """
+        Muestrea un índice por fila mediante la inversa de la función de distribución.
+        :param probs: Matriz de probabilidades (filas x brazos).
+        :param u: Uniforme en [0, 1) para cada fila.
+        :return: Índice muestreado en cada fila.
+        """
+        return sample_categorical(probs, u)
+
+    @staticmethod
+    def from_algorithm(algo: Algorithm, runs: int, rng=None) -> 'BatchedAlgorithm':
+        """
+        Construye la versión por lotes de un algoritmo con sus mismos parámetros.
+        :param algo: Instancia de un algoritmo.
+        :param runs: Número de ejecuciones independientes.
+        :param rng: Generador aleatorio o semilla. Por defecto el del algoritmo.
+        :return: Algoritmo por lotes equivalente.
+        :raises ValueError: Si el algoritmo no tiene versión por lotes.
+        """
+        rng = algo.rng if rng is None else rng
+        if isinstance(algo, (SlidingWindow, Discounted)):
+            # Sus estadísticas son las de las observaciones recientes, no las de toda la ejecución
+            raise ValueError(f"El algoritmo {type(algo).__name__} no tiene versión por lotes.")
+        elif isinstance(algo, EpsilonGreedy):
+            return BatchedEpsilonGreedy(algo.k, runs, epsilon=algo.epsilon, rng=rng)
+        elif isinstance(algo, UCB1):
+            return BatchedUCB1(algo.k, runs, c=algo.c, rng=rng)
+        elif isinstance(algo, UCB2):
+            return BatchedUCB2(algo.k, runs, alfa=algo.alfa, rng=rng)
+        elif isinstance(algo, Softmax):
+            return BatchedSoftmax(algo.k, runs, tau=algo.tau, rng=rng)
+        elif isinstance(algo, Gradiente):
+            return BatchedGradiente(algo.k, runs, alfa=algo.alfa, rng=rng)
+        raise ValueError(f"El algoritmo {type(algo).__name__} no tiene versión por lotes.")
+
+
+class BatchedEpsilonGreedy(BatchedAlgorithm):
+
+    def __init__(self, k: int, runs: int, epsilon=0.1, rng=None):
+        """
+        Inicializa el algoritmo epsilon-greedy por lotes.
+
+        :param k: Número de brazos.
+        :param runs: Número de ejecuciones independientes.
+        :param epsilon: Probabilidad de exploración. Escalar o un valor por ejecución.
+        :param rng: Generador aleatorio. Por defecto el estado global de np.random.
+        """
+        super().__init__(k, runs, rng)
+        self.epsilon = self.per_run(epsilon)
+        assert np.all((0 <= self.epsilon) & (self.epsilon <= 1)), "El parámetro epsilon debe estar entre 0 y 1."
+
+    def select_arms(self, t: int = None) -> np.ndarray:
+        """
+        Selecciona un brazo en cada ejecución basado en la política epsilon-greedy.
+        :param t: Instante de tiempo (no se utiliza).
+        :return: Array con el índice del brazo seleccionado en cada ejecución.
+        """
+        explore = get_rng(self.rng).random(self.runs) < self.epsilon
+
+        # Brazo con la recompensa promedio estimada más alta en cada ejecución
+        chosen_arms = np.argmax(self.values, axis=1)
+
+        # Brazo al azar en las ejecuciones que exploran
+        num_explore = int(explore.sum())
+        if num_explore:
+            chosen_arms[explore] = randint(self.rng, self.k, size=num_explore)
+
+        return chosen_arms
+
+
+class BatchedUCB1(BatchedAlgorithm):
+
+    def __init__(self, k: int, runs: int, c=1, rng=None):
+        """
+        Inicializa el algoritmo UCB1 por lotes.
+
+        :param k: Número de brazos.
+        :param runs: Número de ejecuciones independientes.
+        :param c: Parámetro de ajuste de exploración. Escalar o un valor por ejecución.
+        :param rng: Generador aleatorio. Por defecto el estado global de np.random.
+        """
+        super().__init__(k, runs, rng)
+        self.c = self.per_run(c)
+        assert np.all((0 <= self.c) & (self.c <= 1)), "El parámetro c debe estar entre 0 y 1."
+        self.all_pulled = False
+
+    def select_arms(self, t: int) -> np.ndarray:
+        """
+        Selecciona un brazo en cada ejecución basado en la política UCB1.
+        :param t: Instante de tiempo en el que nos encontramos.
+        :return: Array con el índice del brazo seleccionado en cada ejecución.
+        """
+        # Primero seleccionamos todos los brazos para tener las recompensas
+        if not self.all_pulled:
+            unpulled = self.counts == 0
+            pending = unpulled.any(axis=1)
+            if pending.any():
+                first_unpulled = np.argmax(unpulled, axis=1)
+                counts = np.maximum(self.counts, 1)
+            else:
+                self.all_pulled = True
+                counts = self.counts
+        else:
+            counts = self.counts
+
+        uas = np.sqrt(2 * np.log(t + 1) / counts)
+        ucbs = self.values + self.c[:, None] * uas
+        chosen_arms = np.argmax(ucbs, axis=1)
+
+        if not self.all_pulled:
+            chosen_arms = np.where(pending, first_unpulled, chosen_arms)
+
+        return chosen_arms
+
+    def reset(self):
+        """
+        Reinicia el estado del algoritmo en todas las ejecuciones.
+        """
+        super().reset()
+        self.all_pulled = False
+
+
+class BatchedUCB2(BatchedAlgorithm):
+    # Mayor valor de tau(ka) de las tablas
+    MAX_TAU = 2.0 ** 62
+
+    def __init__(self, k: int, runs: int, alfa=0.1, rng=None):
+        """
+        Inicializa el algoritmo UCB2 por lotes. Cada ejecución mantiene su época en curso: el
+        brazo elegido se repite hasta agotar el número de veces asignado por la época.
+
+        :param k: Número de brazos.
+        :param runs: Número de ejecuciones independientes.
+        :param alfa: Parámetro de ajuste entre exploración y explotación. Escalar o un valor por ejecución.
+        :param rng: Generador aleatorio. Por defecto el estado global de np.random.
+        """
+        super().__init__(k, runs, rng)
+        self.alfa = self.per_run(alfa)
+        self.kas: np.ndarray = np.zeros((runs, k), dtype=int)
+        # Brazo de la época en curso y número de tiradas que le quedan en cada ejecución
+        self.current_arms: np.ndarray = np.zeros(runs, dtype=int)
+        self.remaining: np.ndarray = np.zeros(runs, dtype=int)
+
+    @property
+    def alfa(self) -> np.ndarray:
+        return self._alfa
+
+    @alfa.setter
+    def alfa(self, alfa: np.ndarray):
+        """
+        Asigna alfa y reconstruye las tablas de tau, que dependen de él (run_sweep asigna un
+        valor por fila después de crear el algoritmo).
+        """
+        assert np.all((0 < alfa) & (alfa < 1)), "El parámetro alfa debe estar entre 0 y 1."
+
+        self._alfa = alfa
+        # Tablas de ceil(tau(ka)) y de la duración de la época ka (las de UCB2), una fila por cada
+        # valor distinto de alfa; alfa_rows indica la fila de cada ejecución
+        self.alfa_values, self.alfa_rows = np.unique(alfa, return_inverse=True)
+        self.ceil_taus: np.ndarray = np.zeros((len(self.alfa_values), 0), dtype=float)
+        self.epoch_lengths: np.ndarray = np.zeros((len(self.alfa_values), 0), dtype=int)
+        self.extend_tau_table(64)
+
+    def extend_tau_table(self, size: int):
+        """
+        Amplía las tablas de tau para que cubran las épocas 0 a size-1 (ver UCB2.extend_tau_table).
+        :param size: Número mínimo de épocas cubiertas.
+        """
+        size = max(size, 2 * self.epoch_lengths.shape[1])
+        ceil_taus, epoch_lengths = [], []
+        for alfa in self.alfa_values:
+            # Las épocas con tau mayor que MAX_TAU no se alcanzan (y tau desbordaría): las filas
+            # de alfa grande repiten su última época hasta el tamaño de la tabla
+            reachable = min(size, int(math.log(self.MAX_TAU) / math.log1p(alfa)))
+            row_taus, row_lengths = tau_table(float(alfa), reachable)
+            ceil_taus.append(np.pad(row_taus, (0, size - reachable), mode='edge'))
+            epoch_lengths.append(np.pad(row_lengths, (0, size - reachable), mode='edge'))
+        self.ceil_taus = np.array(ceil_taus)
+        self.epoch_lengths = np.array(epoch_lengths)
+
+    def select_arms(self, t: int) -> np.ndarray:
+        """
+        Selecciona un brazo en cada ejecución basado en la política UCB2.
+        :param t: Instante de tiempo en el que nos encontramos.
+        :return: Array con el índice del brazo seleccionado en cada ejecución.
+        """
+        new_epoch = np.flatnonzero(self.remaining == 0)
+
+        if len(new_epoch):
+            alfa = self.alfa[new_epoch]
+            rows = self.alfa_rows[new_epoch]
+            counts = self.counts[new_epoch]
+            kas = self.kas[new_epoch]
+            if kas.max() + 1 >= self.epoch_lengths.shape[1]:
+                self.extend_tau_table(int(kas.max()) + 2)
+
+            # Primero seleccionamos todos los brazos para tener las recompensas
+            unpulled = counts == 0
+            pending = unpulled.any(axis=1)
+            first_unpulled = np.argmax(unpulled, axis=1)
+
+            valor_tau = self.ceil_taus[rows[:, None], kas]
+            uas = np.sqrt(((1 + alfa[:, None]) * np.log(math.e * (t + 1) / valor_tau)) / (2 * valor_tau))
+            ucbs = self.values[new_epoch] + uas
+            chosen_arms = np.where(pending, first_unpulled, np.argmax(ucbs, axis=1))
+
+            ka = kas[np.arange(len(new_epoch)), chosen_arms]
+            num_veces = self.epoch_lengths[rows, ka]
+            self.kas[new_epoch, chosen_arms] += 1
+
+            self.current_arms[new_epoch] = chosen_arms
+            self.remaining[new_epoch] = num_veces
+
+        self.remaining -= 1
+        return self.current_arms.copy()
+
+    def reset(self):
+        """
+        Reinicia el estado del algoritmo en todas las ejecuciones.
+        """
+        super().reset()
+        self.kas = np.zeros((self.runs, self.k), dtype=int)
+        self.current_arms = np.zeros(self.runs, dtype=int)
+        self.remaining = np.zeros(self.runs, dtype=int)
+
+
+class BatchedSoftmax(BatchedAlgorithm):
+
+    def __init__(self, k: int, runs: int, tau=1, rng=None):
+        """
+        Inicializa el algoritmo Softmax por lotes.
+
+        :param k: Número de brazos.
+        :param runs: Número de ejecuciones independientes.
+        :param tau: Parámetro del algoritmo. Escalar o un valor por ejecución.
+        :param rng: Generador aleatorio. Por defecto el estado global de np.random.
+        """
+        super().__init__(k, runs, rng)
+        self.tau = self.per_run(tau)
+        assert np.all(0 < self.tau), "El parámetro tau debe se mayor que 0."
+
+    def select_arms(self, t: int = None) -> np.ndarray:
+        """
+        Selecciona un brazo en cada ejecución basado en la política Softmax.
+        :param t: Instante de tiempo (no se utiliza).
+        :return: Array con el índice del brazo seleccionado en cada ejecución.
+        """
+        prob = softmax(self.values / self.tau[:, None])
+
+        return self.sample_categorical(prob, get_rng(self.rng).random(self.runs))
+
+
+class BatchedGradiente(BatchedAlgorithm):
+
+    def __init__(self, k: int, runs: int, alfa=0.1, rng=None):
+        """
+        Inicializa el algoritmo de gradiente de preferencias por lotes.
+
+        :param k: Número de brazos.
+        :param runs: Número de ejecuciones independientes.
+        :param alfa: Tasa de aprendizaje para actualizar las Hs. Escalar o un valor por ejecución.
+        :param rng: Generador aleatorio. Por defecto el estado global de np.random.
+        """
+        super().__init__(k, runs, rng)
+        self.alfa = self.per_run(alfa)
+        assert np.all(0 <= self.alfa), "El parámetro alfa debe se mayor que 0."
+        self.hs: np.ndarray = np.zeros((runs, k), dtype=float)
+        self.probs: np.ndarray = np.full((runs, k), 1 / k, dtype=float)
+        self.average_rewards: np.ndarray = np.zeros(runs, dtype=float)
+        # Número de actualizaciones realizadas (paso de tiempo)
+        self.t: int = 0
+
+    def select_arms(self, t: int = None) -> np.ndarray:
+        """
+        Selecciona un brazo en cada ejecución según las preferencias Hs.
+        :param t: Instante de tiempo (no se utiliza).
+        :return: Array con el índice del brazo seleccionado en cada ejecución.
+        """
+        self.probs = softmax(self.hs)
+
+        return self.sample_categorical(self.probs, get_rng(self.rng).random(self.runs))
+
+    def update_batch(self, arms: np.ndarray, rewards: np.ndarray):
+        """
+        Actualiza las preferencias y las recompensas promedio estimadas de cada ejecución.
+        :param arms: Índice del brazo tirado en cada ejecución.
+        :param rewards: Recompensa obtenida en cada ejecución.
+        """
+        self.average_rewards += (rewards - self.average_rewards) / (self.t + 1)
+        delta = self.alfa * (rewards - self.average_rewards)
+        self.hs -= delta[:, None] * self.probs
+        self.hs[self.rows, arms] += delta
+        self.t += 1
+
+        super().update_batch(arms, rewards)
+
+    def reset(self):
+        """
+        Reinicia el estado del algoritmo en todas las ejecuciones.
+        """
+        super().reset()
+        self.hs = np.zeros((self.runs, self.k), dtype=float)
+        self.probs = np.full((self.runs, self.k), 1 / self.k, dtype=float)
+        self.average_rewards = np.zeros(self.runs, dtype=float)
+        self.t = 0
@@ -12,24 +12,42 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
+import heapq
+
 import numpy as np
 
 from algorithms.algorithm import Algorithm
+from randomness import get_rng, randint
 
 class EpsilonGreedy(Algorithm):
 
-    def __init__(self, k: int, epsilon: float = 0.1):
+    def __init__(self, k: int, epsilon: float = 0.1, rng=None):
         """
         Inicializa el algoritmo epsilon-greedy.
 
         :param k: Número de brazos.
         :param epsilon: Probabilidad de exploración (seleccionar un brazo al azar).
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
         :raises ValueError: Si epsilon no está en [0, 1].
         """
         assert 0 <= epsilon <= 1, "El parámetro epsilon debe estar entre 0 y 1."
 
-        super().__init__(k)
+        super().__init__(k, rng)
         self.epsilon = epsilon
+        self.rebuild_index()
+
+    def rebuild_index(self):
+        """
+        Reconstruye el montículo de (-valor estimado, brazo, versión) a partir de values.
+
+        Como update solo cambia el valor de un brazo, el mejor brazo se mantiene de forma
+        incremental: cada actualización añade la nueva entrada del brazo y las entradas antiguas
+        (con otra versión) se descartan al llegar a la cima. Los empates se resuelven a favor del
+        menor índice, igual que np.argmax.
+        """
+        self.versions: np.ndarray = np.zeros(self.k, dtype=int)
+        self.heap: list = list(zip((-self.values).tolist(), range(self.k), self.versions.tolist()))
+        heapq.heapify(self.heap)
 
     def select_arm(self) -> int:
         """
@@ -37,14 +55,62 @@ class EpsilonGreedy(Algorithm):
         :return: índice del brazo seleccionado.
         """
 
-        if np.random.random() < self.epsilon:
+        if get_rng(self.rng).random() < self.epsilon:
             # Selecciona un brazo al azar
-            chosen_arm = np.random.choice(self.k)
+            chosen_arm = randint(self.rng, self.k)
         else:
-            # Selecciona el brazo con la recompensa promedio estimada más alta
-            chosen_arm = np.argmax(self.values)
+            # Selecciona el brazo con la recompensa promedio estimada más alta (cima del montículo)
+            heap = self.heap
+            while heap[0][2] != self.versions[heap[0][1]]:
+                heapq.heappop(heap)
+            chosen_arm = heap[0][1]
 
         return chosen_arm
 
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Actualiza la recompensa promedio estimada del brazo y su entrada en el montículo.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        super().update(chosen_arm, reward)
+
+        self.versions[chosen_arm] += 1
+        heapq.heappush(self.heap, (-self.values[chosen_arm], chosen_arm, self.versions[chosen_arm]))
+
+        # Se limpia el montículo cuando acumula demasiadas entradas antiguas
+        if len(self.heap) > 4 * self.k:
+            self.rebuild_index()
+
+    def update_batch(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        """
+        Registra un lote de observaciones (ver Algorithm.update_batch) y añade al montículo la
+        nueva entrada de cada brazo actualizado.
+        :param chosen_arms: Índice del brazo de cada observación.
+        :param rewards: Recompensa de cada observación.
+        """
+        super().update_batch(chosen_arms, rewards)
+
+        for arm in np.unique(chosen_arms).tolist():
+            self.versions[arm] += 1
+            heapq.heappush(self.heap, (-self.values[arm], arm, self.versions[arm]))
+
+        if len(self.heap) > 4 * self.k:
+            self.rebuild_index()
+
+    def set_state(self, state):
+        """
+        Restaura el estado obtenido con get_state y reconstruye el montículo.
+        """
+        super().set_state(state)
+        self.rebuild_index()
+
+    def reset(self):
+        """
+        Reinicia el estado del algoritmo (opcional).
+        """
+        super().reset()
+        self.rebuild_index()
+
 
 
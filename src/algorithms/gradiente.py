@@ -16,24 +16,28 @@ import numpy as np
 import math
 
 from algorithms.algorithm import Algorithm
+from algorithms.sampling import softmax, sample_categorical
+from randomness import get_rng
 
 class Gradiente(Algorithm):
+    STATE = Algorithm.STATE + ('hs', 'probs', 'average_rewards')
 
-    def __init__(self, k: int, alfa: float):
+    def __init__(self, k: int, alfa: float, rng=None):
         """
         Inicializa el algoritmo UCB.
 
         :param k: Número de brazos.
         :param alfa: Tasa de aprendizaje para actualizar las Hs.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
         :raises ValueError: Si tau no es mayor que 0.
         """
         assert 0 <= alfa, "El parámetro tau debe se mayor que 0."
 
-        super().__init__(k)
+        super().__init__(k, rng)
         self.alfa = alfa
-        self.prob : np.ndarray = np.zeros(k, dtype=float)
+        self.probs : np.ndarray = np.full(k, 1 / k, dtype=float)
         self.hs : np.ndarray = np.zeros(k, dtype=float)
-        self.average_reward = 0.0
+        self.average_rewards = 0.0
 
     def select_arm(self) -> int:
         """
@@ -41,8 +45,8 @@ class Gradiente(Algorithm):
         :return: índice del brazo seleccionado.
         """
 
-        self.probs = np.exp(self.hs) / np.sum(np.exp(self.hs))
-        chosen_arm = np.random.choice(self.k, p = self.probs)
+        softmax(self.hs, out=self.probs)
+        chosen_arm = sample_categorical(self.probs, get_rng(self.rng).random())
         return chosen_arm
 
     def update(self, chosen_arm: int, reward: float, t: int):
@@ -54,19 +58,56 @@ class Gradiente(Algorithm):
         """
 
         self.average_rewards += (reward - self.average_rewards) / (t+1)
-        for i in range(self.k):
-            is_chosen_arm = int(i == chosen_arm)
-            self.hs[i] += self.alfa * (reward - self.average_rewards) * (is_chosen_arm - self.probs[i])
 
+        # hs[i] += alfa * (reward - average) * (1[i == chosen_arm] - probs[i]) para todos los brazos
+        delta = self.alfa * (reward - self.average_rewards)
+        self.hs -= delta * self.probs
+        self.hs[chosen_arm] += delta
 
         super().update(chosen_arm, reward)
 
+    def update_batch(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        """
+        Registra un lote de observaciones con una sola actualización de las preferencias.
+
+        Con las probabilidades de la última selección fijas, la actualización secuencial de cada
+        observación i (con t = número de observaciones previas) tiene forma cerrada: el promedio de
+        las recompensas tras cada observación es una media acumulada (np.cumsum), y las preferencias
+        cambian en -sum(delta_i) * probs más la suma de los delta_i de cada brazo (np.bincount),
+        con delta_i = alfa * (r_i - promedio_i). El resultado coincide con llamar a update con cada
+        observación en el mismo orden, salvo por el redondeo.
+        :param chosen_arms: Índice del brazo de cada observación.
+        :param rewards: Recompensa de cada observación.
+        """
+        chosen_arms = np.asarray(chosen_arms, dtype=np.intp)
+        rewards = np.asarray(rewards, dtype=float)
+        if len(rewards) == 0:
+            return
+
+        t = int(np.sum(self.counts))
+        averages = (t * self.average_rewards + np.cumsum(rewards)) / (t + 1 + np.arange(len(rewards)))
+        deltas = self.alfa * (rewards - averages)
+        self.hs -= np.sum(deltas) * self.probs
+        self.hs += np.bincount(chosen_arms, weights=deltas, minlength=self.k)
+        self.average_rewards = float(averages[-1])
+
+        super().update_batch(chosen_arms, rewards)
+
+    def observe(self, chosen_arm: int, reward: float, t: int):
+        """
+        Protocolo uniforme de paso: registra la recompensa obtenida en el instante t.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        :param t: Instante de tiempo en el que nos encontramos.
+        """
+        self.update(chosen_arm, reward, t)
+
     def reset(self):
         """
         Reinicia el estado del algoritmo (opcional).
         """
         self.counts = np.zeros(self.k, dtype=int)
         self.values = np.zeros(self.k, dtype=float)
-        self.prob = np.zeros(self.k, dtype=float)
+        self.probs = np.full(self.k, 1 / self.k, dtype=float)
         self.hs = np.zeros(self.k, dtype=float)
         self.average_rewards = 0.0
@@ -0,0 +1,325 @@
+"""
+Module: algorithms/nonstationary.py
+Description: Variantes de UCB1 y epsilon-greedy para brazos no estacionarios, que estiman la
+             recompensa de cada brazo solo con las observaciones recientes: con una ventana
+             deslizante de las últimas observaciones (búfer circular de tamaño fijo) o con sumas
+             descontadas exponencialmente. El coste por paso y la memoria no dependen del horizonte.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import heapq
+
+import numpy as np
+
+from algorithms.epsilon_greedy import EpsilonGreedy
+from algorithms.ucb1 import UCB1
+
+
+class SlidingWindow:
+    """
+    Estadísticas de las últimas window observaciones, para combinar con un algoritmo.
+
+    Las observaciones se guardan en un búfer circular de window posiciones (brazo y recompensa);
+    cada nueva observación sustituye a la más antigua, cuya contribución se resta de counts y de
+    sums. Así counts es el número de tiradas de cada brazo dentro de la ventana y values la media
+    de sus recompensas, con coste O(1) por observación. Cada vez que el búfer da una vuelta las
+    sumas se recalculan desde el búfer para que no se acumulen errores de redondeo.
+    """
+    STATE = ('window_arms', 'window_rewards', 'position', 'sums')
+
+    def init_window(self, window: int):
+        """
+        :param window: Número de observaciones recientes que se tienen en cuenta.
+        """
+        assert window > 0, "El tamaño de la ventana debe ser mayor que 0."
+
+        self.window = window
+        # Búfer circular: brazo (-1 si la posición está vacía) y recompensa de cada observación
+        self.window_arms: np.ndarray = np.full(window, -1, dtype=int)
+        self.window_rewards: np.ndarray = np.zeros(window, dtype=float)
+        # Posición de la observación más antigua, que se sustituye en la siguiente
+        self.position: int = 0
+        # Suma de las recompensas de cada brazo dentro de la ventana
+        self.sums: np.ndarray = np.zeros(self.k, dtype=float)
+
+    def slide(self, chosen_arm: int, reward: float) -> int:
+        """
+        Añade una observación a la ventana y retira la más antigua.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        :return: Brazo de la observación retirada, o -1 si la ventana no estaba llena.
+        """
+        position = self.position
+        evicted = int(self.window_arms[position])
+        if evicted >= 0:
+            self.counts[evicted] -= 1
+            self.sums[evicted] -= self.window_rewards[position]
+            self.values[evicted] = self.sums[evicted] / self.counts[evicted] if self.counts[evicted] else 0.0
+
+        self.window_arms[position] = chosen_arm
+        self.window_rewards[position] = reward
+        self.counts[chosen_arm] += 1
+        self.sums[chosen_arm] += reward
+        self.values[chosen_arm] = self.sums[chosen_arm] / self.counts[chosen_arm]
+
+        self.position = (position + 1) % self.window
+        if self.position == 0:
+            self.sums = np.bincount(self.window_arms, weights=self.window_rewards, minlength=self.k)
+            pulled = self.counts > 0
+            self.values[pulled] = self.sums[pulled] / self.counts[pulled]
+        return evicted
+
+    def update_batch(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        """
+        Registra un lote de observaciones en orden: la ventana depende del orden, por lo que no
+        se pueden agregar como en Algorithm.update_batch.
+        :param chosen_arms: Índice del brazo de cada observación.
+        :param rewards: Recompensa de cada observación.
+        """
+        for chosen_arm, reward in zip(np.asarray(chosen_arms).tolist(), np.asarray(rewards, dtype=float).tolist()):
+            self.update(chosen_arm, reward)
+
+
+class Discounted:
+    """
+    Estadísticas descontadas exponencialmente, para combinar con un algoritmo.
+
+    Tras cada observación el peso de las anteriores se multiplica por gamma, de modo que la
+    recompensa estimada de cada brazo es la media ponderada de sus recompensas con pesos gamma^edad.
+    En lugar de multiplicar todos los pesos en cada paso (O(k)), cada observación se suma con el
+    peso scale = gamma^-t, que crece con t; los pesos relativos son los mismos y solo cambian las
+    sumas del brazo tirado. Cuando scale se hace muy grande, pesos y sumas se dividen por scale.
+
+    counts sigue siendo el número total de tiradas de cada brazo y values la media descontada.
+    """
+    STATE = ('weights', 'sums', 'scale')
+    # Valor de scale a partir del cual se renormalizan pesos y sumas
+    MAX_SCALE = 1e100
+
+    def init_discount(self, gamma: float):
+        """
+        :param gamma: Factor de descuento por paso, entre 0 y 1 (memoria efectiva de 1 / (1 - gamma) pasos).
+        """
+        assert 0 < gamma < 1, "El factor de descuento gamma debe estar entre 0 y 1."
+
+        self.gamma = gamma
+        # Número descontado de tiradas y suma descontada de recompensas de cada brazo, multiplicados por scale
+        self.weights: np.ndarray = np.zeros(self.k, dtype=float)
+        self.sums: np.ndarray = np.zeros(self.k, dtype=float)
+        self.scale: float = 1.0
+
+    def discount(self, chosen_arm: int, reward: float):
+        """
+        Añade una observación con peso 1, descontando las anteriores.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        self.scale /= self.gamma
+        self.counts[chosen_arm] += 1
+        self.weights[chosen_arm] += self.scale
+        self.sums[chosen_arm] += self.scale * reward
+        self.values[chosen_arm] = self.sums[chosen_arm] / self.weights[chosen_arm]
+
+        if self.scale > self.MAX_SCALE:
+            self.weights /= self.scale
+            self.sums /= self.scale
+            self.scale = 1.0
+
+    def discounted_counts(self) -> np.ndarray:
+        """
+        Número descontado de tiradas de cada brazo: suma de gamma^edad de sus observaciones.
+        """
+        return self.weights / self.scale
+
+    def update_batch(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        """
+        Registra un lote de observaciones en orden: el descuento depende del orden, por lo que no
+        se pueden agregar como en Algorithm.update_batch.
+        :param chosen_arms: Índice del brazo de cada observación.
+        :param rewards: Recompensa de cada observación.
+        """
+        for chosen_arm, reward in zip(np.asarray(chosen_arms).tolist(), np.asarray(rewards, dtype=float).tolist()):
+            self.update(chosen_arm, reward)
+
+
+class SlidingWindowUCB1(SlidingWindow, UCB1):
+    STATE = UCB1.STATE + SlidingWindow.STATE
+
+    def __init__(self, k: int, c: float = 1, window: int = 1000, rng=None):
+        """
+        Inicializa el algoritmo UCB1 con ventana deslizante (SW-UCB): las medias y los contadores
+        son los de las últimas window observaciones y el término de exploración usa
+        log(min(t, window)). Un brazo sin tiradas dentro de la ventana se vuelve a seleccionar.
+
+        :param k: Número de brazos.
+        :param c: Parámetro de ajuste de exploración.
+        :param window: Número de observaciones recientes que se tienen en cuenta.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
+        """
+        super().__init__(k, c, rng)
+        self.init_window(window)
+
+    def select_arm(self, t: int) -> int:
+        """
+        Selecciona un brazo basado en la política UCB1 sobre la ventana.
+        :param t: Instante de tiempo en el que nos encontramos.
+        :return: Índice del brazo seleccionado.
+        """
+        return super().select_arm(min(t, self.window))
+
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Añade la observación a la ventana y actualiza las medias de los brazos afectados.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        self.slide(chosen_arm, reward)
+
+    def reset(self):
+        """
+        Reinicia el estado del algoritmo (opcional).
+        """
+        super().reset()
+        self.init_window(self.window)
+
+
+class DiscountedUCB1(Discounted, UCB1):
+    STATE = UCB1.STATE + Discounted.STATE
+
+    def __init__(self, k: int, c: float = 1, gamma: float = 0.99, rng=None):
+        """
+        Inicializa el algoritmo UCB1 descontado (D-UCB): las medias y los contadores del término
+        de exploración son sumas descontadas con factor gamma, por lo que el término de un brazo
+        que no se tira crece hasta que se vuelve a seleccionar.
+
+        :param k: Número de brazos.
+        :param c: Parámetro de ajuste de exploración.
+        :param gamma: Factor de descuento por paso, entre 0 y 1.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
+        """
+        super().__init__(k, c, rng)
+        self.init_discount(gamma)
+
+    def select_arm(self, t: int) -> int:
+        """
+        Selecciona un brazo basado en la política UCB1 con contadores descontados.
+        :param t: Instante de tiempo (no se utiliza: el tiempo efectivo es la suma de los contadores descontados).
+        :return: Índice del brazo seleccionado.
+        """
+        # Primero seleccionamos todos los brazos para tener las recompensas
+        unpulled = np.flatnonzero(self.counts == 0)
+        if len(unpulled):
+            return int(unpulled[0])
+
+        # Los pesos de los brazos que no se tiran hace mucho pueden llegar a 0
+        counts = np.maximum(self.discounted_counts(), np.finfo(float).tiny)
+        np.sqrt(2 * np.log(counts.sum() + 1) / counts, out=self.uas)
+        np.add(self.values, self.c * self.uas, out=self.ucbs)
+
+        return int(np.argmax(self.ucbs))
+
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Añade la observación a las sumas descontadas.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        self.discount(chosen_arm, reward)
+
+    def reset(self):
+        """
+        Reinicia el estado del algoritmo (opcional).
+        """
+        super().reset()
+        self.init_discount(self.gamma)
+
+
+class SlidingWindowEpsilonGreedy(SlidingWindow, EpsilonGreedy):
+    STATE = EpsilonGreedy.STATE + SlidingWindow.STATE
+
+    def __init__(self, k: int, epsilon: float = 0.1, window: int = 1000, rng=None):
+        """
+        Inicializa el algoritmo epsilon-greedy con ventana deslizante: explota el brazo con mayor
+        media de sus recompensas dentro de las últimas window observaciones.
+
+        :param k: Número de brazos.
+        :param epsilon: Probabilidad de exploración (seleccionar un brazo al azar).
+        :param window: Número de observaciones recientes que se tienen en cuenta.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
+        """
+        super().__init__(k, epsilon, rng)
+        self.init_window(window)
+
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Añade la observación a la ventana y actualiza en el montículo los brazos afectados: el
+        tirado y el de la observación retirada.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        evicted = self.slide(chosen_arm, reward)
+        if self.position == 0:
+            # Se han recalculado todas las medias
+            self.rebuild_index()
+            return
+
+        for arm in {chosen_arm, evicted} - {-1}:
+            self.versions[arm] += 1
+            heapq.heappush(self.heap, (-self.values[arm], arm, self.versions[arm]))
+
+        if len(self.heap) > 4 * self.k:
+            self.rebuild_index()
+
+    def reset(self):
+        """
+        Reinicia el estado del algoritmo (opcional).
+        """
+        super().reset()
+        self.init_window(self.window)
+
+
+class DiscountedEpsilonGreedy(Discounted, EpsilonGreedy):
+    STATE = EpsilonGreedy.STATE + Discounted.STATE
+
+    def __init__(self, k: int, epsilon: float = 0.1, gamma: float = 0.99, rng=None):
+        """
+        Inicializa el algoritmo epsilon-greedy descontado: explota el brazo con mayor media
+        descontada de sus recompensas.
+
+        :param k: Número de brazos.
+        :param epsilon: Probabilidad de exploración (seleccionar un brazo al azar).
+        :param gamma: Factor de descuento por paso, entre 0 y 1.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
+        """
+        super().__init__(k, epsilon, rng)
+        self.init_discount(gamma)
+
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Añade la observación a las sumas descontadas y la nueva media del brazo al montículo.
+        Las medias de los demás brazos no cambian: el descuento afecta por igual a sus pesos y sumas.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        self.discount(chosen_arm, reward)
+
+        self.versions[chosen_arm] += 1
+        heapq.heappush(self.heap, (-self.values[chosen_arm], chosen_arm, self.versions[chosen_arm]))
+
+        if len(self.heap) > 4 * self.k:
+            self.rebuild_index()
+
+    def reset(self):
+        """
+        Reinicia el estado del algoritmo (opcional).
+        """
+        super().reset()
+        self.init_discount(self.gamma)
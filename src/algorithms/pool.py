@@ -0,0 +1,276 @@
+"""
+Module: algorithms/pool.py
+Description: Conjuntos de muchos bandidos independientes y pequeños (p.e. una política por usuario
+             o segmento) con el estado de todas las instancias en matrices contiguas (instancias x
+             brazos) de tipos compactos. La selección y la actualización son vectorizadas sobre un
+             lote de identificadores, y el estado se guarda y se carga como ficheros .npy que se
+             pueden abrir proyectados en memoria.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from abc import ABC, abstractmethod
+import json
+import os
+
+import numpy as np
+
+from algorithms.algorithm import Algorithm
+from algorithms.epsilon_greedy import EpsilonGreedy
+from algorithms.ucb1 import UCB1
+from randomness import make_rng, get_rng, randint
+
+
+class BanditPool(ABC):
+    """
+    Conjunto de n instancias independientes de un algoritmo con k brazos.
+
+    Una instancia de EpsilonGreedy o UCB1 ocupa del orden de kilobytes (el objeto de Python y
+    varios arrays reservados por separado). En el conjunto cada instancia ocupa solo su fila de
+    counts y de values: k * (4 + 4) bytes con los tipos por defecto (uint32 y float32). Los
+    vectores auxiliares (uas, ucbs) se calculan al seleccionar solo para las filas del lote, y el
+    instante t de cada instancia es su número total de tiradas.
+    """
+    # Parámetros del algoritmo que se guardan con el estado (además de k)
+    PARAMS = ()
+    # Algoritmo escalar equivalente a cada instancia
+    algorithm_class: type = None
+
+    def __init__(self, n: int, k: int, count_dtype=np.uint32, value_dtype=np.float32, rng=None):
+        """
+        :param n: Número de instancias.
+        :param k: Número de brazos de cada instancia.
+        :param count_dtype: Tipo entero sin signo de los contadores de tiradas.
+        :param value_dtype: Tipo real de las recompensas promedio estimadas.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
+        """
+        assert n > 0 and k > 0, "El número de instancias y de brazos debe ser mayor que 0."
+
+        self.n: int = n
+        self.k: int = k
+        self.rng = make_rng(rng)
+        # Número de veces que se ha seleccionado cada brazo en cada instancia
+        self.counts: np.ndarray = np.zeros((n, k), dtype=count_dtype)
+        # Recompensa promedio estimada de cada brazo en cada instancia
+        self.values: np.ndarray = np.zeros((n, k), dtype=value_dtype)
+
+    @abstractmethod
+    def select(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Selecciona un brazo en cada instancia del lote.
+        :param ids: Identificadores (índices) de las instancias. Pueden repetirse.
+        :return: Índice del brazo seleccionado para cada identificador.
+        """
+        raise NotImplementedError("Este método debe ser implementado por la subclase.")
+
+    def update(self, ids: np.ndarray, arms: np.ndarray, rewards: np.ndarray):
+        """
+        Registra un lote de recompensas. Las observaciones de un mismo par (instancia, brazo) se
+        agregan con np.bincount y se aplican en una sola actualización, como en
+        Algorithm.update_batch.
+        :param ids: Identificador de la instancia de cada observación.
+        :param arms: Índice del brazo de cada observación.
+        :param rewards: Recompensa de cada observación.
+        """
+        cells = np.asarray(ids, dtype=np.intp) * self.k + np.asarray(arms, dtype=np.intp)
+        cells, inverse = np.unique(cells, return_inverse=True)
+        n = np.bincount(inverse)
+        totals = np.bincount(inverse, weights=np.asarray(rewards, dtype=float))
+
+        rows, cols = np.divmod(cells, self.k)
+        counts = self.counts[rows, cols] + n
+        value = self.values[rows, cols].astype(float)
+        self.counts[rows, cols] = counts
+        self.values[rows, cols] = value + (totals - n * value) / counts
+
+    def reset(self, ids: np.ndarray = None):
+        """
+        Reinicia el estado de las instancias indicadas, o de todas.
+        :param ids: Identificadores de las instancias. Por defecto todas.
+        """
+        ids = slice(None) if ids is None else ids
+        self.counts[ids] = 0
+        self.values[ids] = 0
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memoria ocupada por el estado de todas las instancias, en bytes.
+        """
+        return self.counts.nbytes + self.values.nbytes
+
+    @property
+    def bytes_per_instance(self) -> float:
+        return self.nbytes / self.n
+
+    def params(self) -> dict:
+        """
+        Parámetros del algoritmo, comunes a todas las instancias.
+        """
+        return {name: getattr(self, name) for name in self.PARAMS}
+
+    def get_algorithm(self, i: int) -> Algorithm:
+        """
+        Copia el estado de una instancia en un algoritmo escalar equivalente, p.e. para inspeccionarla.
+        :param i: Identificador de la instancia.
+        """
+        algo = self.algorithm_class(self.k, **self.params(), rng=self.rng)
+        algo.counts[:] = self.counts[i]
+        algo.values[:] = self.values[i]
+        return algo
+
+    def save(self, path: str):
+        """
+        Guarda el estado en el directorio path: counts.npy, values.npy y pool.json (clase,
+        número de brazos y parámetros).
+        :param path: Directorio. Se crea si no existe.
+        """
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, 'counts.npy'), self.counts)
+        np.save(os.path.join(path, 'values.npy'), self.values)
+        with open(os.path.join(path, 'pool.json'), 'w') as f:
+            json.dump({'class': type(self).__name__, 'k': self.k, 'params': self.params()}, f, indent=2)
+
+    def flush(self):
+        """
+        Escribe en disco las actualizaciones pendientes de un conjunto cargado con mmap_mode='r+'.
+        """
+        for array in (self.counts, self.values):
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    @staticmethod
+    def load(path: str, mmap_mode: str = 'r+', rng=None) -> 'BanditPool':
+        """
+        Carga un conjunto guardado con save. Con mmap_mode los ficheros .npy se proyectan en
+        memoria (np.load(..., mmap_mode=...)) en lugar de leerse: solo se cargan las páginas de
+        las instancias que se usan y, con 'r+', las actualizaciones se escriben en los ficheros.
+
+        :param path: Directorio del conjunto.
+        :param mmap_mode: Modo de np.load: 'r+', 'r', 'c' o None para cargar los arrays en memoria.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
+        :return: Conjunto de bandidos.
+        :raises ValueError: Si la clase guardada no existe.
+        """
+        with open(os.path.join(path, 'pool.json')) as f:
+            meta = json.load(f)
+        pool_class = {cls.__name__: cls for cls in BanditPool.__subclasses__()}.get(meta['class'])
+        if pool_class is None:
+            raise ValueError(f"Clase de conjunto de bandidos desconocida: {meta['class']}.")
+
+        counts = np.load(os.path.join(path, 'counts.npy'), mmap_mode=mmap_mode)
+        values = np.load(os.path.join(path, 'values.npy'), mmap_mode=mmap_mode)
+        # Se construye con una sola instancia y su estado se sustituye por los arrays cargados
+        pool = pool_class(1, meta['k'], **meta['params'], count_dtype=counts.dtype,
+                          value_dtype=values.dtype, rng=rng)
+        pool.n, pool.counts, pool.values = len(counts), counts, values
+        return pool
+
+    @staticmethod
+    def from_algorithm(algo: Algorithm, n: int, count_dtype=np.uint32, value_dtype=np.float32,
+                       rng=None) -> 'BanditPool':
+        """
+        Construye un conjunto de n instancias con los parámetros de un algoritmo.
+        :param algo: Instancia de un algoritmo.
+        :param n: Número de instancias.
+        :param rng: Generador aleatorio o semilla. Por defecto el del algoritmo.
+        :return: Conjunto de bandidos equivalente.
+        :raises ValueError: Si el algoritmo no tiene versión en conjunto.
+        """
+        rng = algo.rng if rng is None else rng
+        if type(algo) is EpsilonGreedy:
+            return EpsilonGreedyPool(n, algo.k, epsilon=algo.epsilon, count_dtype=count_dtype,
+                                     value_dtype=value_dtype, rng=rng)
+        elif type(algo) is UCB1:
+            return UCB1Pool(n, algo.k, c=algo.c, count_dtype=count_dtype, value_dtype=value_dtype, rng=rng)
+        raise ValueError(f"El algoritmo {type(algo).__name__} no tiene versión en conjunto.")
+
+
+class EpsilonGreedyPool(BanditPool):
+    PARAMS = ('epsilon',)
+    algorithm_class = EpsilonGreedy
+
+    def __init__(self, n: int, k: int, epsilon: float = 0.1, count_dtype=np.uint32, value_dtype=np.float32,
+                 rng=None):
+        """
+        Inicializa n instancias de epsilon-greedy.
+
+        :param n: Número de instancias.
+        :param k: Número de brazos de cada instancia.
+        :param epsilon: Probabilidad de exploración.
+        :param count_dtype: Tipo entero sin signo de los contadores de tiradas.
+        :param value_dtype: Tipo real de las recompensas promedio estimadas.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
+        """
+        assert 0 <= epsilon <= 1, "El parámetro epsilon debe estar entre 0 y 1."
+
+        super().__init__(n, k, count_dtype, value_dtype, rng)
+        self.epsilon = epsilon
+
+    def select(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Selecciona un brazo en cada instancia del lote con la política epsilon-greedy.
+        :param ids: Identificadores de las instancias.
+        :return: Índice del brazo seleccionado para cada identificador.
+        """
+        ids = np.asarray(ids, dtype=np.intp)
+        explore = get_rng(self.rng).random(len(ids)) < self.epsilon
+
+        # Brazo con la recompensa promedio estimada más alta en cada instancia
+        chosen_arms = np.argmax(self.values[ids], axis=1)
+
+        # Brazo al azar en las instancias que exploran
+        num_explore = int(explore.sum())
+        if num_explore:
+            chosen_arms[explore] = randint(self.rng, self.k, size=num_explore)
+
+        return chosen_arms
+
+
+class UCB1Pool(BanditPool):
+    PARAMS = ('c',)
+    algorithm_class = UCB1
+
+    def __init__(self, n: int, k: int, c: float = 1, count_dtype=np.uint32, value_dtype=np.float32,
+                 rng=None):
+        """
+        Inicializa n instancias de UCB1.
+
+        :param n: Número de instancias.
+        :param k: Número de brazos de cada instancia.
+        :param c: Parámetro de ajuste de exploración.
+        :param count_dtype: Tipo entero sin signo de los contadores de tiradas.
+        :param value_dtype: Tipo real de las recompensas promedio estimadas.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
+        """
+        assert 0 <= c <= 1, "El parámetro c debe estar entre 0 y 1."
+
+        super().__init__(n, k, count_dtype, value_dtype, rng)
+        self.c = c
+
+    def select(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Selecciona un brazo en cada instancia del lote con la política UCB1. El instante t de cada
+        instancia es su número total de tiradas.
+        :param ids: Identificadores de las instancias.
+        :return: Índice del brazo seleccionado para cada identificador.
+        """
+        ids = np.asarray(ids, dtype=np.intp)
+        counts = self.counts[ids].astype(float)
+        t = counts.sum(axis=1, keepdims=True)
+
+        # Primero seleccionamos todos los brazos para tener las recompensas
+        unpulled = counts == 0
+        pending = unpulled.any(axis=1)
+        first_unpulled = np.argmax(unpulled, axis=1)
+
+        uas = np.sqrt(2 * np.log(t + 1) / np.maximum(counts, 1))
+        ucbs = self.values[ids] + self.c * uas
+        return np.where(pending, first_unpulled, np.argmax(ucbs, axis=1))
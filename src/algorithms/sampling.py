@@ -0,0 +1,53 @@
+"""
+Module: algorithms/sampling.py
+Description: Motor de muestreo de las políticas basadas en preferencias (Softmax, Gradiente):
+             probabilidades softmax numéricamente estables y muestreo categórico por la inversa
+             de la función de distribución, sin la validación de np.random.choice en cada paso.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+
+
+def softmax(logits: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    Calcula exp(logits) / sum(exp(logits)) restando antes el máximo (log-sum-exp), de modo que
+    la exponencial nunca desborda aunque los logits sean grandes (p.e. valores / tau con tau pequeño).
+
+    :param logits: Logits de cada brazo (brazos) o de cada fila (filas x brazos).
+    :param out: Array en el que escribir el resultado. Puede ser el propio logits.
+    :return: Probabilidades de cada brazo, con la misma forma que logits.
+    """
+    out = np.subtract(logits, np.max(logits, axis=-1, keepdims=True), out=out)
+    np.exp(out, out=out)
+    out /= np.sum(out, axis=-1, keepdims=True)
+    return out
+
+
+def sample_categorical(probs: np.ndarray, u):
+    """
+    Muestrea un índice (o uno por fila) mediante la inversa de la función de distribución.
+
+    Con una uniforme u = rng.random() el resultado coincide con rng.choice(k, p=probs), que
+    consume también una sola uniforme, por lo que los resultados con semilla no cambian.
+
+    :param probs: Probabilidades (brazos) o matriz de probabilidades (filas x brazos).
+    :param u: Uniforme en [0, 1), o una por fila.
+    :return: Índice muestreado, o array con el índice muestreado en cada fila.
+    """
+    cdf = np.cumsum(probs, axis=-1)
+    if cdf.ndim == 1:
+        cdf /= cdf[-1]
+        return int(min(cdf.searchsorted(u, side='right'), len(cdf) - 1))
+
+    u = u * cdf[:, -1]
+    arms = np.sum(cdf <= u[:, None], axis=1)
+    return np.minimum(arms, probs.shape[1] - 1)
@@ -16,21 +16,26 @@ import numpy as np
 import math
 
 from algorithms.algorithm import Algorithm
+from algorithms.sampling import softmax, sample_categorical
+from randomness import get_rng
 
 class Softmax(Algorithm):
 
-    def __init__(self, k: int, tau: float = 1):
+    def __init__(self, k: int, tau: float = 1, rng=None):
         """
         Inicializa el algoritmo UCB.
 
         :param k: Número de brazos.
         :param tau: Parámetro del algoritmo.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
         :raises ValueError: Si tau no es mayor que 0.
         """
         assert 0 < tau, "El parámetro tau debe se mayor que 0."
 
-        super().__init__(k)
+        super().__init__(k, rng)
         self.tau = tau
+        # Array auxiliar para los logits y las probabilidades de cada brazo
+        self.logits: np.ndarray = np.zeros(k, dtype=float)
 
     def select_arm(self) -> int:
         """
@@ -38,10 +43,9 @@ class Softmax(Algorithm):
         :return: índice del brazo seleccionado.
         """
 
-        numerador = np.exp(self.values / self.tau)
-        denominador = np.sum(numerador)
-        prob = numerador / denominador
-        
-        chosen_arm = np.random.choice(self.k, p=prob)
+        # Probabilidades estables (se resta el máximo antes de la exponencial)
+        prob = softmax(np.divide(self.values, self.tau, out=self.logits), out=self.logits)
+
+        chosen_arm = sample_categorical(prob, get_rng(self.rng).random())
 
         return chosen_arm
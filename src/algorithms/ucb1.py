@@ -17,18 +17,20 @@ import numpy as np
 from algorithms.algorithm import Algorithm
 
 class UCB1(Algorithm):
+    STATE = Algorithm.STATE + ('uas', 'ucbs')
 
-    def __init__(self, k: int, c: float = 1):
+    def __init__(self, k: int, c: float = 1, rng=None):
         """
         Inicializa el algoritmo UCB.
 
         :param k: Número de brazos.
         :param c: Parámetro de ajuste de exploración.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
         :raises ValueError: Si c no está en [0, 1].
         """
         assert 0 <= c <= 1, "El parámetro c debe estar entre 0 y 1."
 
-        super().__init__(k)
+        super().__init__(k, rng)
         self.c = c
         self.uas: np.ndarray = np.zeros(k, dtype=float)
         self.ucbs: np.ndarray = np.zeros(k, dtype=float)
@@ -41,20 +43,25 @@ class UCB1(Algorithm):
         """
 
         # Primero seleccionamos todos los brazos para tener las recompensas
-        for i in range(self.k):
-            if self.counts[i] == 0:
-                return i
-        
-        for i in range(self.k):
-            self.uas[i] = np.sqrt(2 * np.log(t+1) / self.counts[i])
-        
-        for i in range(self.k):
-            self.ucbs[i] = self.values[i] + self.c * self.uas[i]
+        unpulled = np.flatnonzero(self.counts == 0)
+        if len(unpulled):
+            return int(unpulled[0])
+
+        np.sqrt(2 * np.log(t+1) / self.counts, out=self.uas)
+        np.add(self.values, self.c * self.uas, out=self.ucbs)
 
         chosen_arm = np.argmax(self.ucbs)
 
         return chosen_arm
 
+    def next_arm(self, t: int) -> int:
+        """
+        Protocolo uniforme de paso: selecciona el brazo a tirar en el instante t.
+        :param t: Instante de tiempo en el que nos encontramos.
+        :return: Índice del brazo seleccionado.
+        """
+        return self.select_arm(t)
+
     def reset(self):
         """
         Reinicia el estado del algoritmo (opcional).
@@ -0,0 +1,175 @@
+"""
+Module: algorithms/ucb1_lazy.py
+Description: Implementación del algoritmo ucb1 para un número muy grande de brazos, con selección
+             sublineal en k mediante un montículo de cotas superiores evaluado de forma perezosa.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import heapq
+import math
+from typing import Dict
+
+import numpy as np
+
+from algorithms.ucb1 import UCB1
+
+class LazyUCB1(UCB1):
+    STATE = UCB1.STATE + ('versions', 'horizon')
+
+    def __init__(self, k: int, c: float = 1, growth: float = 0.01, rng=None):
+        """
+        Inicializa el algoritmo UCB1 para muchos brazos.
+
+        Los brazos sin tirar se guardan en una pila en lugar de buscarse en counts. Para el argmax
+        se aprovecha que en cada paso solo cambian la media y el conteo del brazo elegido y que el
+        término log(t) crece con t: el índice de cada brazo evaluado en un horizonte H >= t es una
+        cota superior de su índice en t. El montículo se ordena por esas cotas y solo se evalúan
+        los brazos cuya cota supera al mejor índice exacto encontrado. Al alcanzar el horizonte se
+        amplía en un factor (1 + growth) y se reconstruye el montículo en O(k): un growth pequeño da
+        cotas más ajustadas (menos candidatos por paso) a cambio de reconstrucciones más frecuentes.
+
+        Los empates entre brazos pueden resolverse de forma distinta a UCB1.
+
+        :param k: Número de brazos.
+        :param c: Parámetro de ajuste de exploración.
+        :param growth: Crecimiento relativo del horizonte en cada reconstrucción.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
+        :raises ValueError: Si c no está en [0, 1].
+        """
+        assert growth > 0, "El parámetro growth debe ser mayor que 0."
+
+        super().__init__(k, c, rng)
+        self.growth = growth
+        self.reset_index()
+
+    def reset_index(self):
+        """
+        Reinicia las estructuras auxiliares de la selección.
+        """
+        # Pila de brazos sin tirar; el de menor índice queda en la cima
+        self.unpulled: list = list(range(self.k - 1, -1, -1))
+        # Montículo de (-cota superior, brazo, versión) y versión vigente de cada brazo
+        self.heap: list = []
+        self.versions: np.ndarray = np.zeros(self.k, dtype=int)
+        # Instante hasta el que las cotas del montículo son válidas
+        self.horizon: int = 0
+
+    def bound(self, arm: int, log_t: float) -> float:
+        """
+        Índice UCB1 de un brazo para un valor dado de log(t+1).
+        :param arm: Índice del brazo.
+        :param log_t: Logaritmo del instante de tiempo.
+        :return: Índice UCB1 del brazo.
+        """
+        return self.values[arm] + self.c * math.sqrt(2 * log_t / self.counts[arm])
+
+    def rebuild(self, t: int):
+        """
+        Reconstruye el montículo con las cotas de todos los brazos en un nuevo horizonte.
+        :param t: Instante de tiempo en el que nos encontramos.
+        """
+        self.horizon = int((t + 1) * (1 + self.growth)) + 1
+        bounds = self.values + self.c * np.sqrt(2 * math.log(self.horizon) / self.counts)
+        self.heap = list(zip((-bounds).tolist(), range(self.k), self.versions.tolist()))
+        heapq.heapify(self.heap)
+
+    def select_arm(self, t: int) -> int:
+        """
+        Selecciona un brazo basado en la política UCB1.
+        :param t: instante de tiempo en el que nos encontramos
+        :return: índice del brazo seleccionado.
+        """
+
+        # Primero seleccionamos todos los brazos para tener las recompensas
+        while self.unpulled and self.counts[self.unpulled[-1]] > 0:
+            self.unpulled.pop()
+        if self.unpulled:
+            return self.unpulled[-1]
+
+        # Las cotas caducan al superar el horizonte; el montículo también se limpia si acumula
+        # demasiadas entradas obsoletas
+        if t + 1 > self.horizon or len(self.heap) > 4 * self.k:
+            self.rebuild(t)
+
+        log_t = math.log(t + 1)
+        chosen_arm, best = -1, -math.inf
+        candidates = []
+
+        while self.heap:
+            neg_bound, arm, version = self.heap[0]
+            if version != self.versions[arm]:
+                heapq.heappop(self.heap)
+                continue
+            # Ningún brazo restante puede superar al mejor índice exacto
+            if best >= -neg_bound:
+                break
+            candidates.append(heapq.heappop(self.heap))
+
+            ucb = self.bound(arm, log_t)
+            if ucb > best or (ucb == best and arm < chosen_arm):
+                chosen_arm, best = arm, ucb
+
+        for candidate in candidates:
+            heapq.heappush(self.heap, candidate)
+
+        return chosen_arm
+
+    def update(self, chosen_arm: int, reward: float):
+        """
+        Actualiza la recompensa promedio estimada del brazo y su cota en el montículo.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param reward: Recompensa obtenida.
+        """
+        super().update(chosen_arm, reward)
+
+        self.versions[chosen_arm] += 1
+        if self.horizon:
+            bound = self.bound(chosen_arm, math.log(self.horizon))
+            heapq.heappush(self.heap, (-bound, chosen_arm, self.versions[chosen_arm]))
+
+    def update_batch(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        """
+        Registra un lote de observaciones (ver Algorithm.update_batch) y añade al montículo la
+        nueva cota de cada brazo actualizado.
+        :param chosen_arms: Índice del brazo de cada observación.
+        :param rewards: Recompensa de cada observación.
+        """
+        super().update_batch(chosen_arms, rewards)
+
+        log_horizon = math.log(self.horizon) if self.horizon else None
+        for arm in np.unique(chosen_arms).tolist():
+            self.versions[arm] += 1
+            if log_horizon is not None:
+                heapq.heappush(self.heap, (-self.bound(arm, log_horizon), arm, self.versions[arm]))
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        Obtiene una copia del estado, incluidos la pila de brazos sin tirar y el montículo.
+        """
+        state = super().get_state()
+        state['unpulled'] = np.array(self.unpulled, dtype=int)
+        state['heap'] = np.array(self.heap, dtype=float).reshape(-1, 3)
+        return state
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """
+        Restaura el estado obtenido con get_state.
+        """
+        super().set_state(state)
+        self.unpulled = state['unpulled'].tolist()
+        self.heap = [(bound, int(arm), int(version)) for bound, arm, version in state['heap'].tolist()]
+
+    def reset(self):
+        """
+        Reinicia el estado del algoritmo (opcional).
+        """
+        super().reset()
+        self.reset_index()
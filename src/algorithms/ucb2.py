@@ -16,27 +16,71 @@ import numpy as np
 import math
 from algorithms.algorithm import Algorithm
 
+
+def tau_table(alfa: float, size: int) -> (np.ndarray, np.ndarray):
+    """
+    Calcula las tablas de ceil(tau(ka)) y de la duración ceil(tau(ka + 1) - tau(ka)) de las
+    épocas ka = 0, ..., size-1, con tau(ka) = (1 + alfa)^ka.
+    :param alfa: Parámetro de UCB2.
+    :param size: Número de épocas.
+    :return: Tablas de ceil(tau) (float) y de la duración de cada época (int).
+    """
+    taus = [(1 + alfa)**ka for ka in range(size + 1)]
+    ceil_taus = np.array([math.ceil(tau) for tau in taus[:-1]], dtype=float)
+    epoch_lengths = np.array([math.ceil(taus[ka + 1] - taus[ka]) for ka in range(size)], dtype=int)
+    return ceil_taus, epoch_lengths
+
+
 class UCB2(Algorithm):
+    STATE = Algorithm.STATE + ('uas', 'ucbs', 'kas', 'epoch_arm', 'epoch_remaining')
 
-    def __init__(self, k: int, alfa: float = 0.1):
+    def __init__(self, k: int, alfa: float = 0.1, rng=None):
         """
         Inicializa el algoritmo UCB.
 
         :param k: Número de brazos.
         :param alfa: Parámetro de ajuste entre exploración y explotación.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
         :raises ValueError: Si alfa no está en (0, 1).
         """
         assert 0 < alfa < 1, "El parámetro alfa debe estar entre 0 y 1."
 
-        super().__init__(k)
+        super().__init__(k, rng)
         self.alfa = alfa
         self.uas: np.ndarray = np.zeros(k, dtype=float)
         self.ucbs: np.ndarray = np.zeros(k, dtype=float)
         self.kas: np.darray = np.zeros(k, dtype=int)
+        # Brazo de la época en curso y número de tiradas que le quedan
+        self.epoch_arm: int = 0
+        self.epoch_remaining: int = 0
+        # Tablas precalculadas de ceil(tau(ka)) y de la duración de la época ka
+        self.ceil_taus: np.ndarray = np.zeros(0, dtype=float)
+        self.epoch_lengths: np.ndarray = np.zeros(0, dtype=int)
+        self.extend_tau_table(64)
 
     def tau(self, ka: int) -> float:
         return (1 + self.alfa)**ka
 
+    def extend_tau_table(self, size: int):
+        """
+        Amplía las tablas de tau para que cubran las épocas 0 a size-1.
+        :param size: Número mínimo de épocas cubiertas.
+        """
+        size = max(size, 2 * len(self.epoch_lengths))
+        self.ceil_taus, self.epoch_lengths = tau_table(self.alfa, size)
+
+    def start_epoch(self, chosen_arm: int) -> int:
+        """
+        Inicia una nueva época del brazo elegido.
+        :param chosen_arm: Índice del brazo seleccionado.
+        :return: Número de veces que se debe tirar del brazo en la época.
+        """
+        ka = self.kas[chosen_arm]
+        if ka + 1 >= len(self.epoch_lengths):
+            self.extend_tau_table(ka + 2)
+        self.kas[chosen_arm] += 1
+        return int(self.epoch_lengths[ka])
+
     def select_arm(self, t: int) -> (int, int):
         """
         Selecciona un brazo basado en la política UCB1.
@@ -45,26 +89,80 @@ class UCB2(Algorithm):
         """
 
         # Primero seleccionamos todos los brazos para tener las recompensas
-        for i in range(self.k):
-            if self.counts[i] == 0:
-                chosen_arm = i
-                num_veces = math.ceil(self.tau(self.kas[chosen_arm] + 1) - self.tau(self.kas[chosen_arm]))
-                self.kas[chosen_arm] += 1
-                return chosen_arm, num_veces
-        
-        for i in range(self.k):
-            valor_tau = math.ceil(self.tau(self.kas[i]))
-            self.uas[i] = np.sqrt(((1 + self.alfa) * np.log(math.e * (t+1) / valor_tau)) / (2 * valor_tau))
-        
-        for i in range(self.k):
-            self.ucbs[i] = self.values[i] + self.uas[i]
+        unpulled = np.flatnonzero(self.counts == 0)
+        if len(unpulled):
+            chosen_arm = int(unpulled[0])
+            return chosen_arm, self.start_epoch(chosen_arm)
+
+        valor_tau = self.ceil_taus[self.kas]
+        self.uas = np.sqrt(((1 + self.alfa) * np.log(math.e * (t+1) / valor_tau)) / (2 * valor_tau))
+        self.ucbs = self.values + self.uas
 
         chosen_arm = np.argmax(self.ucbs)
-        num_veces = math.ceil(self.tau(self.kas[chosen_arm] + 1) - self.tau(self.kas[chosen_arm]))
-        self.kas[chosen_arm] += 1
-        
+        num_veces = self.start_epoch(chosen_arm)
+
         return chosen_arm, num_veces
 
+    def next_arm(self, t: int) -> int:
+        """
+        Protocolo uniforme de paso: devuelve el brazo de la época en curso y, cuando ésta
+        se agota, inicia una nueva época con select_arm.
+        :param t: Instante de tiempo en el que nos encontramos.
+        :return: Índice del brazo seleccionado.
+        """
+        if self.epoch_remaining == 0:
+            self.epoch_arm, self.epoch_remaining = self.select_arm(t)
+        self.epoch_remaining -= 1
+        return self.epoch_arm
+
+    def next_epoch(self, t: int) -> (int, int):
+        """
+        Protocolo uniforme por épocas: devuelve el brazo de la época y el número de tiradas que
+        quedan en ella, durante las cuales la decisión no cambia.
+        :param t: Instante de tiempo en el que nos encontramos.
+        :return: Índice del brazo seleccionado y número de veces que se debe tirar de él.
+        """
+        if self.epoch_remaining == 0:
+            self.epoch_arm, self.epoch_remaining = self.select_arm(t)
+        num_veces, self.epoch_remaining = self.epoch_remaining, 0
+        return self.epoch_arm, num_veces
+
+    def observe_epoch(self, chosen_arm: int, total_reward: float, n: int, t: int):
+        """
+        Protocolo uniforme por épocas: registra las recompensas de una época con una sola
+        actualización agregada.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param total_reward: Suma de las recompensas obtenidas en la época.
+        :param n: Número de tiradas de la época.
+        :param t: Instante de tiempo en el que empezó la época.
+        """
+        self.update_epoch(chosen_arm, total_reward, n)
+
+    def update_epoch(self, chosen_arm: int, total_reward: float, n: int):
+        """
+        Actualiza la recompensa promedio estimada del brazo con la suma de n recompensas.
+        :param chosen_arm: Índice del brazo que fue tirado.
+        :param total_reward: Suma de las recompensas obtenidas.
+        :param n: Número de tiradas.
+        """
+        self.counts[chosen_arm] += n
+
+        value = self.values[chosen_arm]
+        self.values[chosen_arm] = value + (total_reward - n * value) / self.counts[chosen_arm]
+
+    def update_batch(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        """
+        Registra un lote de observaciones con una actualización agregada (update_epoch) por brazo.
+        Las épocas (kas y la época en curso) no cambian: avanzan al seleccionar, no al observar.
+        :param chosen_arms: Índice del brazo de cada observación.
+        :param rewards: Recompensa de cada observación.
+        """
+        chosen_arms = np.asarray(chosen_arms, dtype=np.intp)
+        n = np.bincount(chosen_arms, minlength=self.k)
+        totals = np.bincount(chosen_arms, weights=np.asarray(rewards, dtype=float), minlength=self.k)
+        for arm in np.flatnonzero(n).tolist():
+            self.update_epoch(arm, totals[arm], int(n[arm]))
+
     def reset(self):
         """
         Reinicia el estado del algoritmo (opcional).
@@ -74,4 +172,6 @@ class UCB2(Algorithm):
         self.uas = np.zeros(self.k, dtype=float)
         self.ucbs = np.zeros(self.k, dtype=float)
         self.kas = np.zeros(self.k, dtype=int)
+        self.epoch_arm = 0
+        self.epoch_remaining = 0
         
@@ -14,13 +14,38 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
+from importlib import import_module
 
-# Importación de módulos o clases
-from .arm import Arm
-from .armnormal import ArmNormal
-from .bandit import Bandit
-from .armbernoulli import ArmBernoulli
-from .armbinomial import ArmBinomial
+# Submódulo de cada módulo o clase pública
+_SUBMODULES = {
+    'Arm': '.arm',
+    'ArmNormal': '.armnormal',
+    'Bandit': '.bandit',
+    'ArmBernoulli': '.armbernoulli',
+    'ArmBinomial': '.armbinomial',
+    'VectorBandit': '.vectorbandit',
+    'CommonRandomBandit': '.commonbandit',
+    'ArmNormalDrift': '.armnormaldrift',
+    'ArmBernoulliPiecewise': '.armbernoullipiecewise',
+    'NonStationaryBandit': '.nonstationarybandit',
+}
 
 # Lista de módulos o clases públicas
-__all__ = ['Arm', 'ArmNormal', 'Bandit', 'ArmBernoulli', 'ArmBinomial']
+__all__ = ['Arm', 'ArmNormal', 'Bandit', 'ArmBernoulli', 'ArmBinomial', 'VectorBandit', 'CommonRandomBandit',
+           'ArmNormalDrift', 'ArmBernoulliPiecewise', 'NonStationaryBandit']
+
+
+def __getattr__(name: str):
+    """
+    Importación diferida (PEP 562): el submódulo de cada nombre público se carga la primera vez
+    que se usa, de modo que importar el paquete no carga módulos que no se necesitan.
+    """
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_SUBMODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -16,8 +16,19 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from randomness import make_rng
+
 
 class Arm(ABC):
+    # Number of rewards pre-drawn per block in buffered mode (0 disables the buffer)
+    block_size: int = 0
+    # Pre-drawn rewards and position of the next one to serve
+    _buffer: np.ndarray = None
+    _buffer_pos: int = 0
+    # Random generator of the arm (None uses the global state of np.random)
+    rng = None
 
     @classmethod
     def generate_arms(cls, k: int):
@@ -29,17 +40,127 @@ class Arm(ABC):
         """
         raise NotImplementedError("This method must be implemented by the subclass.")
 
-    @abstractmethod
+    def sample(self, size: int = None):
+        """
+        Draws rewards directly from the arm's distribution.
+
+        This method must be implemented by derived classes that rely on the default pull().
+
+        :param size: Number of rewards to draw. None to draw a single reward.
+        :return: A reward, or an array of rewards if size is given.
+        :raises NotImplementedError: If not implemented in the subclass.
+        """
+        raise NotImplementedError("This method must be implemented by the subclass.")
+
     def pull(self):
         """
         Generates a reward based on the arm's distribution.
 
-        This method must be implemented by derived classes.
+        In buffered mode the reward is served from a block of pre-drawn rewards that is
+        refilled lazily when exhausted.
+
+        :return: Reward obtained from the arm.
+        """
+        if not self.block_size:
+            return self.sample()
+
+        if self._buffer is None or self._buffer_pos >= len(self._buffer):
+            self._buffer = self.sample(self.block_size)
+            self._buffer_pos = 0
+
+        reward = self._buffer[self._buffer_pos]
+        self._buffer_pos += 1
+        return reward
+
+    def pull_many(self, n: int) -> np.ndarray:
+        """
+        Generates n rewards at once.
+
+        In buffered mode the pending rewards of the buffer are served first, so that the
+        sequence of rewards does not depend on how they are requested.
+
+        :param n: Number of rewards to generate.
+        :return: Array with the rewards obtained from the arm.
+        """
+        if type(self).sample is Arm.sample:
+            # Subclass that only implements pull()
+            return np.array([self.pull() for _ in range(n)])
+
+        if not self.block_size or self._buffer is None:
+            return self.sample(n)
+
+        pending = self.drain_buffer(n)
+        if len(pending) == n:
+            return pending.copy()
+        return np.concatenate([pending, self.sample(n - len(pending))])
+
+    def drain_buffer(self, n: int) -> np.ndarray:
+        """
+        Serves up to n pending rewards of the buffer in buffered mode.
+
+        :param n: Maximum number of rewards.
+        :return: View of the rewards served (empty if the buffer is disabled or exhausted).
+        """
+        if not self.block_size or self._buffer is None:
+            return np.zeros(0)
+
+        pending = self._buffer[self._buffer_pos:self._buffer_pos + n]
+        self._buffer_pos += len(pending)
+        return pending
+
+    def sample_total(self, n: int) -> float:
+        """
+        Draws the sum of n rewards directly from its distribution (a sufficient statistic).
 
+        This method may be implemented by derived classes to speed up pull_total.
+
+        :param n: Number of rewards.
+        :return: Sum of the n rewards.
         :raises NotImplementedError: If not implemented in the subclass.
         """
         raise NotImplementedError("This method must be implemented by the subclass.")
 
+    def pull_total(self, n: int) -> float:
+        """
+        Generates the sum of n rewards, for callers that only need the total.
+
+        In buffered mode the pending rewards of the buffer are served first, as in pull_many, and
+        only the rest is drawn with sample_total when the subclass implements it.
+
+        :param n: Number of rewards.
+        :return: Sum of the n rewards.
+        """
+        if type(self).sample_total is Arm.sample_total:
+            return float(np.sum(self.pull_many(n)))
+
+        pending = self.drain_buffer(n)
+        total = float(np.sum(pending))
+        if len(pending) < n:
+            total += self.sample_total(n - len(pending))
+        return total
+
+    def set_block_size(self, block_size: int = 4096):
+        """
+        Enables (block_size > 0) or disables (block_size = 0) the buffered sampling mode.
+
+        :param block_size: Number of rewards pre-drawn per block.
+        """
+        assert block_size >= 0, "The block size must be non-negative."
+
+        self.block_size = block_size
+        self._buffer = None
+        self._buffer_pos = 0
+
+    def set_rng(self, rng):
+        """
+        Injects the random generator used to draw the rewards.
+
+        :param rng: Generator, seed (creates a Philox stream) or None for the global state of np.random.
+        """
+        self.rng = make_rng(rng)
+        self._buffer = None
+        self._buffer_pos = 0
+
     @abstractmethod
     def get_expected_value(self) -> float:
         """
@@ -18,29 +18,41 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 import numpy as np
 
 from arms import Arm
+from randomness import make_rng, get_rng
 
 
 class ArmBernoulli(Arm):
-    def __init__(self, p: float):
+    def __init__(self, p: float, rng=None):
         """
         Inicializa el brazo con distribución bernoulli.
 
         :param p: Probabilidad de acierto.
-        :param sigma: Desviación estándar de la distribución.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
         """
         assert 0 <= p <= 1, "La probabilidad p debe estar en el intervalo [0,1]."
 
         self.p = p
+        self.rng = make_rng(rng)
 
-    def pull(self):
+    def sample(self, size: int = None):
         """
-        Genera una recompensa siguiendo una distribución normal.
+        Genera recompensas siguiendo una distribución Bernoulli.
 
-        :return: Recompensa obtenida del brazo.
+        :param size: Número de recompensas a generar. None para generar una sola.
+        :return: Recompensa obtenida del brazo, o array de recompensas si se indica size.
         """
-        reward = np.random.binomial(1, self.p)
+        reward = get_rng(self.rng).binomial(1, self.p, size)
         return reward
 
+    def sample_total(self, n: int) -> float:
+        """
+        Genera la suma de n recompensas con una sola extracción de su distribución, binomial de parámetros (n, p).
+
+        :param n: Número de recompensas.
+        :return: Suma de las n recompensas.
+        """
+        return float(get_rng(self.rng).binomial(n, self.p))
+
     def get_expected_value(self) -> float:
         """
         Devuelve el valor esperado de la distribución normal.
@@ -58,19 +70,21 @@ class ArmBernoulli(Arm):
         return f"ArmBernoulli(p={self.p})"
 
     @classmethod
-    def generate_arms(cls, k: int):
+    def generate_arms(cls, k: int, rng=None):
         """
         Genera k brazos con probabilidades p únicas.
 
         :param k: Número de brazos a generar.
+        :param rng: Generador aleatorio o semilla para generar los parámetros. Por defecto el estado global de np.random.
         :return: Lista de brazos generados.
         """
         assert k > 0, "El número de brazos k debe ser mayor que 0."
 
         # Generar k- valores únicos de p con decimales
+        generator = get_rng(make_rng(rng))
         p_values = set()
         while len(p_values) < k:
-            p = np.random.rand()
+            p = generator.random()
             p = round(p, 2)
             p_values.add(p)
                 
@@ -0,0 +1,108 @@
+"""
+Module: arms/armbernoullipiecewise.py
+Description: Contains the implementation of the ArmBernoulliPiecewise class, a Bernoulli arm whose
+             success probability is piecewise constant and changes at random instants
+             (piecewise-stationary arm).
+
+Author: Jesús Verdú Chacón
+        Jorge López Abad
+Email: jesus.v.c@um.es
+       jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+
+import numpy as np
+
+from arms.armbernoulli import ArmBernoulli
+from randomness import make_rng, get_rng, randint, stream
+
+
+class ArmBernoulliPiecewise(ArmBernoulli):
+    def __init__(self, p: float, hazard: float = 0.001, rng=None, change_rng=None):
+        """
+        Inicializa el brazo Bernoulli estacionario a trozos: en cada paso de tiempo, con
+        probabilidad hazard, la probabilidad de acierto se sustituye por una nueva uniforme en [0, 1].
+
+        El instante de tiempo lo fija quien usa el brazo con set_time (ver NonStationaryBandit).
+        La probabilidad se actualiza de forma perezosa: en n pasos solo importa si ha habido algún
+        cambio, con probabilidad 1 - (1 - hazard)^n, y en ese caso el valor del último, por lo que
+        el coste no depende del tiempo transcurrido.
+
+        :param p: Probabilidad de acierto inicial.
+        :param hazard: Probabilidad de cambio en cada paso.
+        :param rng: Generador aleatorio o semilla de las recompensas. Por defecto el estado global de np.random.
+        :param change_rng: Generador aleatorio o semilla de los cambios, independiente de las recompensas
+                           para que la evolución de p no dependa de las tiradas. Con una semilla, cada
+                           ejecución tiene su propio flujo (ver reset). Por defecto el estado global.
+        """
+        assert 0 <= hazard <= 1, "La probabilidad de cambio hazard debe estar en el intervalo [0,1]."
+
+        super().__init__(p, rng)
+        self.initial_p = p
+        self.hazard = hazard
+        # Con una semilla, el flujo de los cambios de cada ejecución se regenera en reset
+        self.change_seed = int(change_rng) if isinstance(change_rng, (int, np.integer)) else None
+        self.change_rng = make_rng(change_rng) if self.change_seed is None else stream(self.change_seed, 0)
+        self.t = 0
+
+    def set_time(self, t: int):
+        """
+        Avanza la probabilidad de acierto del brazo hasta el instante t.
+
+        :param t: Instante de tiempo (no anterior al actual).
+        """
+        steps = t - self.t
+        if steps <= 0:
+            return
+        self.t = t
+        generator = get_rng(self.change_rng)
+        if self.hazard > 0 and generator.random() < 1 - (1 - self.hazard) ** steps:
+            self.p = round(float(generator.random()), 2)
+            # Las recompensas extraídas por adelantado corresponden a la probabilidad anterior
+            self._buffer = None
+
+    def reset(self, run: int = 0):
+        """
+        Vuelve a la probabilidad inicial y al instante 0 al empezar una nueva ejecución. Si los
+        cambios tienen semilla, la evolución de p en la ejecución run es siempre la misma, de modo
+        que todos los algoritmos se comparan sobre los mismos caminos.
+
+        :param run: Índice de la ejecución.
+        """
+        if self.change_seed is not None:
+            self.change_rng = stream(self.change_seed, run)
+        self.p = self.initial_p
+        self.t = 0
+        self._buffer = None
+
+    def __str__(self):
+        """
+        Representación en cadena del brazo Bernoulli estacionario a trozos.
+
+        :return: Descripción detallada del brazo.
+        """
+        return f"ArmBernoulliPiecewise(p={self.p}, hazard={self.hazard})"
+
+    @classmethod
+    def generate_arms(cls, k: int, hazard: float = 0.001, rng=None):
+        """
+        Genera k brazos con probabilidades iniciales únicas (ver ArmBernoulli.generate_arms).
+
+        :param k: Número de brazos a generar.
+        :param hazard: Probabilidad de cambio de cada brazo en cada paso.
+        :param rng: Generador aleatorio o semilla para generar los parámetros y los cambios de cada brazo.
+                    Por defecto el estado global de np.random.
+        :return: Lista de brazos generados.
+        """
+        generator = make_rng(rng)
+        arms = ArmBernoulli.generate_arms(k, rng=generator)
+        # Cada brazo evoluciona con su propio flujo, identificado por una semilla del generador
+        seeds = randint(generator, 2 ** 63, size=k)
+
+        return [ArmBernoulliPiecewise(arm.p, hazard, change_rng=int(seed)) for arm, seed in zip(arms, seeds)]
@@ -18,32 +18,44 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 import numpy as np
 
 from arms import Arm
+from randomness import make_rng, get_rng, randint
 
 
 class ArmBinomial(Arm):
-    def __init__(self, n: int, p: float):
+    def __init__(self, n: int, p: float, rng=None):
         """
         Inicializa el brazo con distribución binomial.
 
         :param n: Número de repeticiones del experimento
         :param p: Probabilidad de acierto.
-        :param sigma: Desviación estándar de la distribución.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
         """
         assert 0 <= n, "El valor n debe ser mayor o igual que cero."
         assert 0 <= p <= 1, "La probabilidad p debe estar en el intervalo [0,1]."
         
         self.n = n
         self.p = p
+        self.rng = make_rng(rng)
 
-    def pull(self):
+    def sample(self, size: int = None):
         """
-        Genera una recompensa siguiendo una distribución binomial.
+        Genera recompensas siguiendo una distribución binomial.
 
-        :return: Recompensa obtenida del brazo.
+        :param size: Número de recompensas a generar. None para generar una sola.
+        :return: Recompensa obtenida del brazo, o array de recompensas si se indica size.
         """
-        reward = np.random.binomial(self.n, self.p)
+        reward = get_rng(self.rng).binomial(self.n, self.p, size)
         return reward
 
+    def sample_total(self, n: int) -> float:
+        """
+        Genera la suma de n recompensas con una sola extracción de su distribución, binomial de parámetros (n*self.n, p).
+
+        :param n: Número de recompensas.
+        :return: Suma de las n recompensas.
+        """
+        return float(get_rng(self.rng).binomial(n * self.n, self.p))
+
     def get_expected_value(self) -> float:
         """
         Devuelve el valor esperado de la distribución normal.
@@ -61,24 +73,26 @@ class ArmBinomial(Arm):
         return f"ArmBinomial(n={self.n}, p={self.p})"
 
     @classmethod
-    def generate_arms(cls, k: int, n_min: int = 1, n_max: int = 10):
+    def generate_arms(cls, k: int, n_min: int = 1, n_max: int = 10, rng=None):
         """
         Genera k brazos con probabilidades p únicas.
 
         :param k: Número de brazos a generar.
         :param n_min: Número mínimo de experimentos.
         :param n_max: Número máximo de experimentos.
+        :param rng: Generador aleatorio o semilla para generar los parámetros. Por defecto el estado global de np.random.
         :return: Lista de brazos generados.
         """
         assert k > 0, "El número de brazos k debe ser mayor que 0."
         assert n_min < n_max, "El valor de n_min debe ser menor que n_max."
         
         # Generar k- valores únicos de p con decimales
+        generator = make_rng(rng)
         arms = []
         for _ in range(k):
-            n = np.random.randint(n_min, n_max + 1)
+            n = n_min + randint(generator, n_max + 1 - n_min)
             n = round(n, 2)
-            p = np.random.rand()
+            p = get_rng(generator).random()
             p = round(p, 2)
             arms.append(ArmBinomial(n,p))
 
@@ -18,30 +18,43 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 import numpy as np
 
 from arms import Arm
+from randomness import make_rng, get_rng
 
 
 class ArmNormal(Arm):
-    def __init__(self, mu: float, sigma: float):
+    def __init__(self, mu: float, sigma: float, rng=None):
         """
         Inicializa el brazo con distribución normal.
 
         :param mu: Media de la distribución.
         :param sigma: Desviación estándar de la distribución.
+        :param rng: Generador aleatorio o semilla. Por defecto el estado global de np.random.
         """
         assert sigma > 0, "La desviación estándar sigma debe ser positiva."
 
         self.mu = mu
         self.sigma = sigma
+        self.rng = make_rng(rng)
 
-    def pull(self):
+    def sample(self, size: int = None):
         """
-        Genera una recompensa siguiendo una distribución normal.
+        Genera recompensas siguiendo una distribución normal.
 
-        :return: Recompensa obtenida del brazo.
+        :param size: Número de recompensas a generar. None para generar una sola.
+        :return: Recompensa obtenida del brazo, o array de recompensas si se indica size.
         """
-        reward = np.random.normal(self.mu, self.sigma)
+        reward = get_rng(self.rng).normal(self.mu, self.sigma, size)
         return reward
 
+    def sample_total(self, n: int) -> float:
+        """
+        Genera la suma de n recompensas con una sola extracción de su distribución, normal de media n*mu y desviación sqrt(n)*sigma.
+
+        :param n: Número de recompensas.
+        :return: Suma de las n recompensas.
+        """
+        return float(get_rng(self.rng).normal(n * self.mu, np.sqrt(n) * self.sigma))
+
     def get_expected_value(self) -> float:
         """
         Devuelve el valor esperado de la distribución normal.
@@ -60,22 +73,24 @@ class ArmNormal(Arm):
         return f"ArmNormal(mu={self.mu}, sigma={self.sigma})"
 
     @classmethod
-    def generate_arms(cls, k: int, mu_min: float = 1, mu_max: float = 10.0):
+    def generate_arms(cls, k: int, mu_min: float = 1, mu_max: float = 10.0, rng=None):
         """
         Genera k brazos con medias únicas en el rango [mu_min, mu_max].
 
         :param k: Número de brazos a generar.
         :param mu_min: Valor mínimo de la media.
         :param mu_max: Valor máximo de la media.
+        :param rng: Generador aleatorio o semilla para generar los parámetros. Por defecto el estado global de np.random.
         :return: Lista de brazos generados.
         """
         assert k > 0, "El número de brazos k debe ser mayor que 0."
         assert mu_min < mu_max, "El valor de mu_min debe ser menor que mu_max."
 
         # Generar k- valores únicos de mu con decimales
+        generator = get_rng(make_rng(rng))
         mu_values = set()
         while len(mu_values) < k:
-            mu = np.random.uniform(mu_min, mu_max)
+            mu = generator.uniform(mu_min, mu_max)
             mu = round(mu, 2)
             mu_values.add(mu)
 
@@ -0,0 +1,108 @@
+"""
+Module: arms/armnormaldrift.py
+Description: Contains the implementation of the ArmNormalDrift class, a normal distribution arm
+             whose mean follows a Gaussian random walk (non-stationary arm).
+
+Author: Jesús Verdú Chacón
+        Jorge López Abad
+Email: jesus.v.c@um.es
+       jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+
+import numpy as np
+
+from arms.armnormal import ArmNormal
+from randomness import make_rng, get_rng, randint, stream
+
+
+class ArmNormalDrift(ArmNormal):
+    def __init__(self, mu: float, sigma: float, drift: float = 0.01, rng=None, drift_rng=None):
+        """
+        Inicializa el brazo normal con deriva: en cada paso de tiempo la media cambia en una
+        cantidad normal de media 0 y desviación drift (paseo aleatorio gaussiano).
+
+        El instante de tiempo lo fija quien usa el brazo con set_time (ver NonStationaryBandit).
+        La media se actualiza de forma perezosa: avanzar n pasos equivale a una sola extracción
+        normal de desviación drift * sqrt(n), por lo que el coste no depende del tiempo transcurrido.
+
+        :param mu: Media inicial de la distribución.
+        :param sigma: Desviación estándar de la distribución.
+        :param drift: Desviación estándar del cambio de la media en cada paso.
+        :param rng: Generador aleatorio o semilla de las recompensas. Por defecto el estado global de np.random.
+        :param drift_rng: Generador aleatorio o semilla de la deriva, independiente de las recompensas para
+                          que la evolución de la media no dependa de las tiradas. Con una semilla, cada
+                          ejecución tiene su propio flujo (ver reset). Por defecto el estado global.
+        """
+        assert drift >= 0, "La desviación estándar de la deriva debe ser no negativa."
+
+        super().__init__(mu, sigma, rng)
+        self.initial_mu = mu
+        self.drift = drift
+        # Con una semilla, el flujo de la deriva de cada ejecución se regenera en reset
+        self.drift_seed = int(drift_rng) if isinstance(drift_rng, (int, np.integer)) else None
+        self.drift_rng = make_rng(drift_rng) if self.drift_seed is None else stream(self.drift_seed, 0)
+        self.t = 0
+
+    def set_time(self, t: int):
+        """
+        Avanza la media del brazo hasta el instante t.
+
+        :param t: Instante de tiempo (no anterior al actual).
+        """
+        steps = t - self.t
+        if steps <= 0:
+            return
+        self.t = t
+        if self.drift > 0:
+            self.mu += float(get_rng(self.drift_rng).normal(0, self.drift * np.sqrt(steps)))
+            # Las recompensas extraídas por adelantado corresponden a la media anterior
+            self._buffer = None
+
+    def reset(self, run: int = 0):
+        """
+        Vuelve a la media inicial y al instante 0 al empezar una nueva ejecución. Si la deriva tiene
+        semilla, la evolución de la media en la ejecución run es siempre la misma, de modo que todos
+        los algoritmos se comparan sobre los mismos caminos.
+
+        :param run: Índice de la ejecución.
+        """
+        if self.drift_seed is not None:
+            self.drift_rng = stream(self.drift_seed, run)
+        self.mu = self.initial_mu
+        self.t = 0
+        self._buffer = None
+
+    def __str__(self):
+        """
+        Representación en cadena del brazo normal con deriva.
+
+        :return: Descripción detallada del brazo.
+        """
+        return f"ArmNormalDrift(mu={self.mu}, sigma={self.sigma}, drift={self.drift})"
+
+    @classmethod
+    def generate_arms(cls, k: int, mu_min: float = 1, mu_max: float = 10.0, drift: float = 0.01, rng=None):
+        """
+        Genera k brazos con medias iniciales únicas en el rango [mu_min, mu_max] (ver ArmNormal.generate_arms).
+
+        :param k: Número de brazos a generar.
+        :param mu_min: Valor mínimo de la media inicial.
+        :param mu_max: Valor máximo de la media inicial.
+        :param drift: Desviación estándar del cambio de la media en cada paso.
+        :param rng: Generador aleatorio o semilla para generar los parámetros y la deriva de cada brazo.
+                    Por defecto el estado global de np.random.
+        :return: Lista de brazos generados.
+        """
+        generator = make_rng(rng)
+        arms = ArmNormal.generate_arms(k, mu_min, mu_max, rng=generator)
+        # Cada brazo evoluciona con su propio flujo, identificado por una semilla del generador
+        seeds = randint(generator, 2 ** 63, size=k)
+
+        return [ArmNormalDrift(arm.mu, arm.sigma, drift, drift_rng=int(seed)) for arm, seed in zip(arms, seeds)]
@@ -16,23 +16,45 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 
 
 # bandit.py
+import copy
 from typing import List
 
 import numpy as np
 
 from arms import Arm
+from arms.vectorbandit import VectorBandit
+from randomness import make_rng, jumped_streams
 
 
 class Bandit:
-    def __init__(self, arms: List[Arm]):
+    # Las recompensas esperadas de los brazos no cambian con el tiempo
+    stationary = True
+
+    def __init__(self, arms: List[Arm], rng=None):
         """
         Initializes the bandit with a list of arms.
 
+        The bandit works on its own copy of the arms, so bandits built from the same arms (for
+        example with with_rng) never share their generators or buffers. If a generator (or seed)
+        is given, pull_arms draws from it and every arm receives its own independent stream
+        obtained by jumping ahead the generator.
+
         :param arms: List of instances of classes derived from Arm.
         :type arms: list of Arm
+        :param rng: Generator, seed (creates a Philox stream) or None for the global state of np.random.
         """
-        self.arms = arms
+        # Copia de los brazos: set_rng no debe modificar los del llamador ni los de otro bandido
+        self.arms = copy.deepcopy(arms)
         self.k = len(arms)
+        self.rng = make_rng(rng)
+        if isinstance(self.rng, np.random.Generator):
+            for arm, arm_rng in zip(self.arms, jumped_streams(self.rng, self.k)):
+                arm.set_rng(arm_rng)
+        elif self.rng is not None:
+            for arm in self.arms:
+                arm.set_rng(self.rng)
+        # Backend vectorizado con los parámetros de los brazos en arrays de NumPy
+        self.vector = VectorBandit.from_arms(self.arms, rng=self.rng)
         self.expected_rewards = self.get_expected_rewards()
         self.optimal_arm = self.get_optimal_arm()
 
@@ -50,6 +72,76 @@ class Bandit:
         reward = self.arms[index].pull()
         return reward
 
+    def pull_arm_many(self, index: int, n: int) -> np.ndarray:
+        """
+        Pulls a specific arm n times with a single sampling call.
+
+        :param index: Index of the arm to pull (0 to k-1).
+        :param n: Number of pulls.
+        :return: Array with the n rewards.
+        :raises IndexError: If the index is out of the valid range.
+        """
+        if index < 0 or index >= self.k:
+            raise IndexError("Arm index out of range.")
+
+        return self.arms[index].pull_many(n)
+
+    def pull_arm_total(self, index: int, n: int) -> float:
+        """
+        Pulls a specific arm n times and returns only the sum of the rewards, drawn directly
+        from its distribution when the arm supports it.
+
+        :param index: Index of the arm to pull (0 to k-1).
+        :param n: Number of pulls.
+        :return: Sum of the n rewards.
+        :raises IndexError: If the index is out of the valid range.
+        """
+        if index < 0 or index >= self.k:
+            raise IndexError("Arm index out of range.")
+
+        return self.arms[index].pull_total(n)
+
+    def pull_arms(self, indices) -> np.ndarray:
+        """
+        Pulls a vector of arms with a single sampling call and returns their rewards.
+
+        :param indices: Indices of the arms to pull (0 to k-1). May contain repetitions.
+        :return: Array of rewards, one per element of indices.
+        :raises IndexError: If any index is out of the valid range.
+        """
+        return self.vector.pull_arms(indices)
+
+    def start_runs(self, first_run: int, runs: int):
+        """
+        Notifies the bandit that the runs first_run, ..., first_run + runs - 1 of an algorithm
+        are about to be simulated. pull_arms then receives one arm per run, in that order.
+        The base bandit draws independent rewards and ignores it.
+
+        :param first_run: Index of the first run.
+        :param runs: Number of runs simulated at once.
+        """
+        pass
+
+    def with_rng(self, rng) -> 'Bandit':
+        """
+        Returns a bandit with a copy of the arms that draws its rewards from the given generator
+        (used by the parallel backend to give each worker its own stream). This bandit is not modified.
+
+        :param rng: Generator, seed or None for the global state of np.random.
+        :return: New bandit.
+        """
+        return Bandit(self.arms, rng=rng)
+
+    def set_block_size(self, block_size: int = 4096):
+        """
+        Enables (block_size > 0) or disables (block_size = 0) the buffered sampling mode of
+        every arm used by pull_arm.
+
+        :param block_size: Number of rewards pre-drawn per block.
+        """
+        for arm in self.arms:
+            arm.set_block_size(block_size)
+
     def get_optimal_arm(self) -> int:
         """
         Identifies the arm with the highest expected reward.
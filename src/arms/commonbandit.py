@@ -0,0 +1,189 @@
+"""
+Module: arms/commonbandit.py
+Description: Contains the CommonRandomBandit class, a bandit whose reward for the n-th pull of
+             an arm in a given run is a fixed value shared by every algorithm (common random
+             numbers), so that differences between algorithms reflect policy and not noise.
+
+Author: Jesús Verdú Chacón
+        Jorge López Abad
+Email: jesus.v.c@um.es
+       jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import List
+
+import numpy as np
+
+from arms import Arm
+from arms.bandit import Bandit
+from arms.vectorbandit import VectorBandit
+from randomness import stream
+
+
+class CommonRandomBandit(Bandit):
+    # Longitud por defecto de los bloques de recompensas de cada (ejecución, brazo). Forma parte
+    # de la definición de la tabla, por lo que no puede depender del número de ejecuciones
+    BLOCK_SIZE = 256
+
+    def __init__(self, arms: List[Arm], seed: int, block_size: int = BLOCK_SIZE):
+        """
+        Initializes the bandit with a list of arms and the seed of the reward table.
+
+        The reward of the n-th pull of arm a in run r is the element n % block_size of the block
+        n // block_size drawn from the Philox stream identified by (seed, r, a, block). Blocks are
+        generated lazily and only the current block of each (run, arm) is kept in memory. The
+        block length is fixed, so the table only depends on (seed, block_size) and not on how
+        many runs are simulated at once (loop or vectorized backend, batches, shards).
+
+        :param arms: List of instances of classes derived from Arm.
+        :param seed: Seed of the reward table.
+        :param block_size: Number of rewards generated at once for a (run, arm). The cache holds
+                           runs x k x block_size rewards.
+        """
+        super().__init__(arms)
+        self.seed = seed
+        self.block_size = block_size
+        # Bloque de recompensas guardado de cada (ejecución, brazo) y su índice
+        self.cache = None
+        self.blocks = None
+        self.first_run = 0
+        self.start_runs(0, 1)
+
+    def start_runs(self, first_run: int, runs: int):
+        """
+        Restarts the pull counters of the runs first_run, ..., first_run + runs - 1, so that
+        the next algorithm receives the same rewards as the previous ones.
+
+        :param first_run: Index of the first run.
+        :param runs: Number of runs simulated at once.
+        """
+        shape = (runs, self.k, self.block_size)
+
+        # Los bloques guardados siguen siendo válidos si se repiten las mismas ejecuciones
+        if self.cache is None or self.cache.shape != shape or self.first_run != first_run:
+            self.cache = np.zeros(shape, dtype=float)
+            self.blocks = np.full((runs, self.k), -1, dtype=np.int64)
+        self.first_run = first_run
+        self.rows = np.arange(runs)
+        # Número de tiradas de cada brazo en cada ejecución
+        self.pulls = np.zeros((runs, self.k), dtype=np.int64)
+
+    def with_rng(self, rng) -> 'CommonRandomBandit':
+        """
+        The rewards do not depend on any generator, so the same bandit is returned.
+        """
+        return self
+
+    def generate_block(self, row: int, arm: int, block: int):
+        """
+        Generates the block of rewards of an arm in a run and stores it in the cache.
+        """
+        rng = stream(self.seed, self.first_run + row, arm, block)
+        size = self.cache.shape[2]
+        kind = self.vector.kinds[arm]
+        if kind == VectorBandit.NORMAL:
+            self.cache[row, arm] = rng.normal(self.vector.mu[arm], self.vector.sigma[arm], size)
+        elif kind == VectorBandit.BINOMIAL:
+            self.cache[row, arm] = rng.binomial(self.vector.n[arm], self.vector.p[arm], size)
+        else:
+            original, self.arms[arm].rng = self.arms[arm].rng, rng
+            self.cache[row, arm] = self.arms[arm].sample(size)
+            self.arms[arm].rng = original
+        self.blocks[row, arm] = block
+
+    def lookup(self, rows: np.ndarray, arms: np.ndarray) -> np.ndarray:
+        """
+        Returns the reward of the next pull of each (run, arm) pair and advances its counter.
+        """
+        size = self.cache.shape[2]
+        pulls = self.pulls[rows, arms]
+        blocks = pulls // size
+        for i in np.flatnonzero(self.blocks[rows, arms] != blocks):
+            self.generate_block(rows[i], arms[i], blocks[i])
+        self.pulls[rows, arms] += 1
+        return self.cache[rows, arms, pulls % size]
+
+    def pull_arm(self, index: int) -> float:
+        """
+        Pulls a specific arm in the current run (the first one of start_runs).
+
+        :param index: Index of the arm to pull (0 to k-1).
+        :return: Reward obtained from the arm.
+        :raises IndexError: If the index is out of the valid range.
+        """
+        if index < 0 or index >= self.k:
+            raise IndexError("Arm index out of range.")
+
+        size = self.cache.shape[2]
+        pull = self.pulls[0, index]
+        if self.blocks[0, index] != pull // size:
+            self.generate_block(0, index, pull // size)
+        self.pulls[0, index] += 1
+        return float(self.cache[0, index, pull % size])
+
+    def pull_arm_many(self, index: int, n: int) -> np.ndarray:
+        """
+        Pulls a specific arm n times in the current run.
+
+        :param index: Index of the arm to pull (0 to k-1).
+        :param n: Number of pulls.
+        :return: Array with the n rewards.
+        :raises IndexError: If the index is out of the valid range.
+        """
+        if index < 0 or index >= self.k:
+            raise IndexError("Arm index out of range.")
+
+        size = self.cache.shape[2]
+        rewards = np.empty(n, dtype=float)
+        done = 0
+        while done < n:
+            pull = self.pulls[0, index]
+            if self.blocks[0, index] != pull // size:
+                self.generate_block(0, index, pull // size)
+            start = pull % size
+            count = min(n - done, size - start)
+            rewards[done:done + count] = self.cache[0, index, start:start + count]
+            self.pulls[0, index] += count
+            done += count
+        return rewards
+
+    def pull_arm_total(self, index: int, n: int) -> float:
+        """
+        Pulls a specific arm n times in the current run and returns the sum of the rewards.
+        The table values are summed (instead of drawing the sum directly) so that every
+        algorithm sees the same rewards.
+
+        :param index: Index of the arm to pull (0 to k-1).
+        :param n: Number of pulls.
+        :return: Sum of the n rewards.
+        """
+        return float(np.sum(self.pull_arm_many(index, n)))
+
+    def pull_arms(self, indices) -> np.ndarray:
+        """
+        Pulls one arm in each of the runs of start_runs.
+
+        :param indices: Index of the arm to pull in each run.
+        :return: Array of rewards, one per run.
+        :raises IndexError: If any index is out of the valid range.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        if indices.min() < 0 or indices.max() >= self.k:
+            raise IndexError("Arm index out of range.")
+
+        return self.lookup(self.rows[:len(indices)], indices)
+
+    def __str__(self):
+        """
+        String representation of the bandit showing the types of arms.
+
+        :return: Detailed description of the bandit and its arms.
+        :rtype: str
+        """
+        return f"Common random numbers ({self.seed}) " + super().__str__()
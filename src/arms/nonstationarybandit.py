@@ -0,0 +1,155 @@
+"""
+Module: arms/nonstationarybandit.py
+Description: Contains the NonStationaryBandit class, a bandit that keeps a clock and moves its
+             non-stationary arms (ArmNormalDrift, ArmBernoulliPiecewise) to the current step
+             before every pull, so that the expected rewards and the optimal arm change over time.
+
+Author: Jesús Verdú Chacón
+        Jorge López Abad
+Email: jesus.v.c@um.es
+       jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import List
+
+import numpy as np
+
+from arms import Arm
+from arms.bandit import Bandit
+
+
+class NonStationaryBandit(Bandit):
+    stationary = False
+
+    def __init__(self, arms: List[Arm], rng=None):
+        """
+        Initializes the bandit with a list of arms. Arms with a set_time method are non-stationary
+        and are moved to the current step before they are pulled; the rest behave as in Bandit.
+
+        Every call to pull_arm (one pull) or pull_arms (one pull per run, all at the same step)
+        advances the clock and all the non-stationary arms by one step, so the evolution of each
+        arm depends only on the step and not on how often it is pulled. start_runs restarts the
+        clock and the arms: with seeded arms (as built by generate_arms) run r always follows the
+        same evolution, so every algorithm is compared on the same paths. The arms have a single
+        state, so run_experiment simulates non-stationary bandits run by run (loop backend) with
+        every backend, and run_sweep rejects them.
+
+        The attributes expected_rewards and optimal_arm hold the values at step 0; get_expected_rewards
+        and get_optimal_arm return those of the current step, the step of the next pull. The
+        backends of run_experiment read them before every pull to compute the dynamic regret and
+        the optimal selections with respect to the optimal arm of each step.
+
+        :param arms: List of instances of classes derived from Arm.
+        :param rng: Generator, seed (creates a Philox stream) or None for the global state of np.random.
+        """
+        # Reloj del bandido: número de pasos simulados en la ejecución actual
+        self.t = 0
+        self.dynamic = []
+        super().__init__(arms, rng)
+        # Brazos no estacionarios de la copia del bandido (ver Bandit)
+        self.dynamic = [arm for arm in self.arms if hasattr(arm, 'set_time')]
+
+    def tick(self):
+        """
+        Moves the non-stationary arms to the current step and advances the clock.
+        """
+        for arm in self.dynamic:
+            arm.set_time(self.t)
+        self.t += 1
+
+    def pull_arm(self, index: int) -> float:
+        """
+        Pulls a specific arm at the current step, advances the clock and returns the reward.
+
+        :param index: Index of the arm to pull (0 to k-1).
+        :return: Reward obtained from the arm.
+        :raises IndexError: If the index is out of the valid range.
+        """
+        if index < 0 or index >= self.k:
+            raise IndexError("Arm index out of range.")
+
+        # Todos los brazos avanzan en cada paso, de modo que la evolución de cada uno depende
+        # solo del instante y no de las veces que se tira de él
+        self.tick()
+        return self.arms[index].pull()
+
+    def pull_arm_many(self, index: int, n: int) -> np.ndarray:
+        """
+        Pulls a specific arm in n consecutive steps.
+
+        :param index: Index of the arm to pull (0 to k-1).
+        :param n: Number of pulls.
+        :return: Array with the n rewards.
+        """
+        return np.array([self.pull_arm(index) for _ in range(n)], dtype=float)
+
+    def pull_arm_total(self, index: int, n: int) -> float:
+        """
+        Pulls a specific arm in n consecutive steps and returns the sum of the rewards.
+
+        :param index: Index of the arm to pull (0 to k-1).
+        :param n: Number of pulls.
+        :return: Sum of the n rewards.
+        """
+        return float(np.sum(self.pull_arm_many(index, n)))
+
+    def pull_arms(self, indices) -> np.ndarray:
+        """
+        Pulls a vector of arms (one per run) at the current step and advances the clock.
+
+        :param indices: Indices of the arms to pull (0 to k-1). May contain repetitions.
+        :return: Array of rewards, one per element of indices.
+        """
+        self.tick()
+        return self.vector.pull_arms(indices)
+
+    def start_runs(self, first_run: int, runs: int):
+        """
+        Restarts the clock and the non-stationary arms before simulating new runs. The arms
+        follow the evolution of run first_run, so runs should be simulated one at a time.
+
+        :param first_run: Index of the first run.
+        :param runs: Number of runs simulated at once.
+        """
+        self.t = 0
+        for arm in self.dynamic:
+            arm.reset(first_run)
+
+    def with_rng(self, rng) -> 'NonStationaryBandit':
+        """
+        Returns a non-stationary bandit with a copy of the arms that draws its rewards from the given generator.
+
+        :param rng: Generator, seed or None for the global state of np.random.
+        :return: New bandit.
+        """
+        return NonStationaryBandit(self.arms, rng=rng)
+
+    def get_expected_rewards(self) -> List[float]:
+        """
+        Returns the expected reward of each arm at the current step.
+
+        :return: List of rewards for each arm.
+        """
+        for arm in self.dynamic:
+            arm.set_time(self.t)
+        return [arm.get_expected_value() for arm in self.arms]
+
+    def get_expected_value(self, numer_arm):
+        arm = self.arms[numer_arm]
+        if hasattr(arm, 'set_time'):
+            arm.set_time(self.t)
+        return arm.get_expected_value()
+
+    def get_optimal_arm(self) -> int:
+        """
+        Identifies the arm with the highest expected reward at the current step.
+
+        :return: Index of the optimal arm.
+        """
+        return int(np.argmax(self.get_expected_rewards()))
@@ -0,0 +1,152 @@
+"""
+Module: arms/vectorbandit.py
+Description: Contains the VectorBandit class, a structure-of-arrays backend that samples
+             rewards for a whole vector of arm choices with a single NumPy call.
+
+Author: Jesús Verdú Chacón
+        Jorge López Abad
+Email: jesus.v.c@um.es
+       jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import List
+
+import numpy as np
+
+from arms import Arm
+from arms.armnormal import ArmNormal
+from arms.armbernoulli import ArmBernoulli
+from arms.armbinomial import ArmBinomial
+
+
+class VectorBandit:
+    # Familias de distribución soportadas de forma vectorizada
+    NORMAL = 0
+    BINOMIAL = 1
+    # Brazos de otras clases: se muestrean llamando a su método pull()
+    OTHER = 2
+
+    def __init__(self, kinds: np.ndarray, mu: np.ndarray, sigma: np.ndarray,
+                 n: np.ndarray, p: np.ndarray, arms: List[Arm] = None, rng=None):
+        """
+        Initializes the backend from the parameter arrays of the arms.
+
+        Bernoulli arms are stored as binomial arms with n = 1.
+
+        :param kinds: Distribution family of each arm (NORMAL, BINOMIAL or OTHER).
+        :param mu: Mean of each normal arm (ignored for the rest).
+        :param sigma: Standard deviation of each normal arm (ignored for the rest).
+        :param n: Number of trials of each binomial arm (ignored for the rest).
+        :param p: Success probability of each binomial arm (ignored for the rest).
+        :param arms: Original arms, needed only for arms of family OTHER.
+        :param rng: Random generator. By default the global state of np.random.
+        """
+        self.kinds = np.asarray(kinds, dtype=np.int8)
+        self.k = len(self.kinds)
+        self.mu = np.asarray(mu, dtype=float)
+        self.sigma = np.asarray(sigma, dtype=float)
+        self.n = np.asarray(n, dtype=np.int64)
+        self.p = np.asarray(p, dtype=float)
+        self.arms = arms
+        self.rng = rng
+
+        # Si todos los brazos son de la misma familia se evita el uso de máscaras
+        families = np.unique(self.kinds)
+        self.family = int(families[0]) if len(families) == 1 else None
+
+        if (self.kinds == self.OTHER).any() and arms is None:
+            raise ValueError("The original arms are required for arms of unknown type.")
+
+    @classmethod
+    def from_arms(cls, arms: List[Arm], rng=None):
+        """
+        Builds the backend from a list of arms.
+
+        :param arms: List of instances of classes derived from Arm.
+        :param rng: Random generator. By default the global state of np.random.
+        :return: VectorBandit with the parameters of the arms.
+        """
+        k = len(arms)
+        kinds = np.full(k, cls.OTHER, dtype=np.int8)
+        mu = np.zeros(k, dtype=float)
+        sigma = np.ones(k, dtype=float)
+        n = np.zeros(k, dtype=np.int64)
+        p = np.zeros(k, dtype=float)
+
+        for i, arm in enumerate(arms):
+            if type(arm) is ArmNormal:
+                kinds[i] = cls.NORMAL
+                mu[i], sigma[i] = arm.mu, arm.sigma
+            elif type(arm) is ArmBernoulli:
+                kinds[i] = cls.BINOMIAL
+                n[i], p[i] = 1, arm.p
+            elif type(arm) is ArmBinomial:
+                kinds[i] = cls.BINOMIAL
+                n[i], p[i] = arm.n, arm.p
+
+        return cls(kinds, mu, sigma, n, p, arms=list(arms), rng=rng)
+
+    def pull_arms(self, indices) -> np.ndarray:
+        """
+        Pulls a vector of arms and returns one reward per element.
+
+        :param indices: Indices of the arms to pull (0 to k-1). May contain repetitions.
+        :return: Array of rewards with the same shape as indices.
+        :raises IndexError: If any index is out of the valid range.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        if indices.size == 0:
+            return np.zeros(indices.shape, dtype=float)
+        if indices.min() < 0 or indices.max() >= self.k:
+            raise IndexError("Arm index out of range.")
+
+        rng = np.random if self.rng is None else self.rng
+
+        if self.family == self.NORMAL:
+            return rng.normal(self.mu[indices], self.sigma[indices])
+        if self.family == self.BINOMIAL:
+            return rng.binomial(self.n[indices], self.p[indices]).astype(float)
+
+        # Bandido mixto: una llamada de muestreo por familia presente
+        rewards = np.empty(indices.shape, dtype=float)
+        kinds = self.kinds[indices]
+
+        mask = kinds == self.NORMAL
+        if mask.any():
+            chosen = indices[mask]
+            rewards[mask] = rng.normal(self.mu[chosen], self.sigma[chosen])
+
+        mask = kinds == self.BINOMIAL
+        if mask.any():
+            chosen = indices[mask]
+            rewards[mask] = rng.binomial(self.n[chosen], self.p[chosen])
+
+        mask = kinds == self.OTHER
+        if mask.any():
+            rewards[mask] = [self.arms[i].pull() for i in indices[mask]]
+
+        return rewards
+
+    def get_expected_rewards(self) -> np.ndarray:
+        """
+        Returns the expected reward of each arm.
+
+        :return: Array with the expected reward of each arm.
+        """
+        expected = np.where(self.kinds == self.NORMAL, self.mu, self.n * self.p)
+        for i in np.flatnonzero(self.kinds == self.OTHER):
+            expected[i] = self.arms[i].get_expected_value()
+        return expected
+
+    def __len__(self):
+        """
+        Returns the number of arms in the bandit.
+        :return:
+        """
+        return self.k
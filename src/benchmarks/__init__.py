@@ -0,0 +1,23 @@
+"""
+Module: benchmarks/__init__.py
+Description: Contiene las importaciones y modulos/clases públicas del paquete benchmarks.
+
+Author: Jesús Verdú Chacón
+        Jorge López Abad
+Email: jesus.v.c@um.es
+       jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+# Importación de módulos o clases
+from .suite import (bench_algorithms, bench_arms, bench_experiments, bench_pool, bench_nonstationary,
+                    bench_imports, import_budget, run_suite, save_baseline, load_baseline, compare, regressions)
+
+# Lista de módulos o clases públicas
+__all__ = ['bench_algorithms', 'bench_arms', 'bench_experiments', 'bench_pool', 'bench_nonstationary',
+           'bench_imports', 'import_budget', 'run_suite', 'save_baseline', 'load_baseline', 'compare', 'regressions']
@@ -0,0 +1,68 @@
+"""
+Module: benchmarks/__main__.py
+Description: Ejecución del banco de pruebas desde la línea de comandos:
+
+             python -m benchmarks --save baseline.json           # Guarda una referencia
+             python -m benchmarks --compare baseline.json        # Compara con una referencia
+
+             Al comparar, el proceso termina con código 1 si alguna medida empeora más que el umbral.
+             También termina con código 1 si importar arms y algorithms supera el presupuesto de
+             tiempo de importación (IMPORT_BUDGET veces el de numpy).
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import argparse
+import sys
+
+from benchmarks.suite import (IMPORT_BUDGET, run_suite, save_baseline, load_baseline, compare, regressions,
+                              import_budget)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Banco de pruebas de rendimiento de algoritmos, brazos y experimentos.')
+    parser.add_argument('--levels', nargs='+', choices=['algorithms', 'arms', 'experiments', 'pool', 'nonstationary', 'imports'],
+                        default=['algorithms', 'arms', 'experiments', 'pool', 'nonstationary', 'imports'], help='Niveles a medir.')
+    parser.add_argument('--quick', action='store_true', help='Medidas más cortas y más ruidosas.')
+    parser.add_argument('--backend', default='vectorized', help='Backend de los experimentos.')
+    parser.add_argument('--save', metavar='FICHERO', help='Guardar los resultados como referencia JSON.')
+    parser.add_argument('--compare', metavar='FICHERO', help='Referencia JSON con la que comparar.')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Empeoramiento relativo considerado regresión (por defecto 0.1 = 10%%).')
+    args = parser.parse_args(argv)
+
+    current = run_suite(args.levels, args.quick, args.backend)
+    if args.save:
+        save_baseline(current, args.save)
+
+    over_budget = False
+    if 'imports' in args.levels:
+        ratio = import_budget(current['results'])
+        over_budget = ratio > IMPORT_BUDGET
+        print(f"Importar arms y algorithms cuesta {ratio:.2f} veces importar numpy "
+              f"(presupuesto {IMPORT_BUDGET:.2f}){': SUPERADO' if over_budget else ''}.\n")
+
+    if not args.compare:
+        for name, res in current['results'].items():
+            print(f"{name:45s} {res['value']:>16.6g} {res['unit']}")
+        return 1 if over_budget else 0
+
+    comparison = compare(current, load_baseline(args.compare))
+    failed = regressions(comparison, args.threshold)
+    for name, old, new, change in comparison:
+        flag = 'REGRESIÓN' if name in failed else ''
+        print(f"{name:45s} {old:>14.6g} -> {new:<14.6g} {change:+8.1%} {flag}")
+    print(f"\n{len(failed)} regresiones de {len(comparison)} medidas (umbral {args.threshold:.0%}).")
+    return 1 if failed or over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
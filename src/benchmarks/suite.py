@@ -0,0 +1,429 @@
+"""
+Module: benchmarks/suite.py
+Description: Banco de pruebas de rendimiento: latencia por llamada de la selección y la
+             actualización de cada algoritmo, velocidad de generación de recompensas de cada
+             brazo, pasos por segundo del experimento completo de cada notebook, memoria y
+             decisiones por segundo de los conjuntos de bandidos (BanditPool), coste por paso,
+             memoria y regret de los algoritmos para brazos no estacionarios y tiempo de
+             importación de los paquetes. Los resultados se guardan como referencias JSON y se
+             comparan con ellas para detectar regresiones.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import Dict, List, Tuple
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from algorithms import EpsilonGreedy, UCB1, LazyUCB1, UCB2, Softmax, Gradiente
+from arms import ArmNormal, ArmBernoulli, ArmBinomial, ArmNormalDrift, ArmBernoulliPiecewise, Bandit
+
+
+# Algoritmos medidos y sus parámetros
+ALGORITHMS = {
+    EpsilonGreedy: {'epsilon': 0.1},
+    UCB1: {'c': 1},
+    LazyUCB1: {'c': 1},
+    UCB2: {'alfa': 0.1},
+    Softmax: {'tau': 1},
+    Gradiente: {'alfa': 0.1},
+}
+
+# Brazos medidos. La lista es explícita: Arm.__subclasses__() solo devuelve las subclases directas
+# ya importadas, y los brazos no estacionarios derivan de ArmNormal y ArmBernoulli
+ARMS = (ArmNormal, ArmBernoulli, ArmBinomial, ArmNormalDrift, ArmBernoulliPiecewise)
+
+# Números de brazos en los que se mide la latencia de los algoritmos
+ARM_COUNTS = (10, 100, 10 ** 4)
+
+# Tiempo máximo de importación de arms y algorithms (incluido numpy) relativo al de numpy solo
+IMPORT_BUDGET = 1.15
+
+# Sentencias cuyo tiempo de importación se mide, cada una en un intérprete nuevo
+IMPORTS = {
+    'numpy': 'import numpy',
+    'arms+algorithms': 'import numpy; from arms import *; from algorithms import *',
+    'experiments': 'import experiments',
+    'plotting': 'import plotting',
+}
+
+# Configuración del experimento de cada notebook: clase de los brazos, pasos, ejecuciones y algoritmos
+NOTEBOOKS = {
+    'epsilongreedy_EML_normal': (ArmNormal, 1000, 500,
+                                 [(EpsilonGreedy, {'epsilon': 0}), (EpsilonGreedy, {'epsilon': 0.01}),
+                                  (EpsilonGreedy, {'epsilon': 0.1})]),
+    'Softmax_EML_normal': (ArmNormal, 1000, 500,
+                           [(Softmax, {'tau': 0.1}), (Softmax, {'tau': 1}),
+                            (Gradiente, {'alfa': 0.1}), (Gradiente, {'alfa': 0.4})]),
+    'Softmax_EML_binomial': (ArmBinomial, 1000, 500,
+                             [(Softmax, {'tau': 0.1}), (Softmax, {'tau': 1}),
+                              (Gradiente, {'alfa': 0.1}), (Gradiente, {'alfa': 0.4})]),
+    'Softmax_EML_bernoulli': (ArmBernoulli, 1000, 500,
+                              [(Softmax, {'tau': 0.1}), (Softmax, {'tau': 1}),
+                               (Gradiente, {'alfa': 0.1}), (Gradiente, {'alfa': 0.4})]),
+    'UCB_EML_normal': (ArmNormal, 2000, 500,
+                       [(UCB1, {'c': 0.1}), (UCB1, {'c': 1}), (UCB2, {'alfa': 0.1}), (UCB2, {'alfa': 0.9})]),
+    'UCB_EML_binomial': (ArmBinomial, 2000, 500,
+                         [(UCB1, {'c': 0.1}), (UCB1, {'c': 1}), (UCB2, {'alfa': 0.1}), (UCB2, {'alfa': 0.9})]),
+    'UCB_EML_bernoulli': (ArmBernoulli, 2000, 500,
+                          [(UCB1, {'c': 0.1}), (UCB1, {'c': 1}), (UCB2, {'alfa': 0.1}), (UCB2, {'alfa': 0.9})]),
+}
+
+
+def result(value: float, unit: str, better: str) -> dict:
+    """
+    Resultado de una medida.
+    :param value: Valor medido.
+    :param unit: Unidad del valor.
+    :param better: 'lower' si un valor menor es mejor (latencias) o 'higher' si lo es uno mayor (velocidades).
+    """
+    return {'value': float(value), 'unit': unit, 'better': better}
+
+
+def throughput(fn, calls: int, repeat: int) -> float:
+    """
+    Llamadas por segundo de una función, la mejor de repeat medidas de calls llamadas.
+    """
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return calls / best
+
+
+def bench_algorithms(ks=ARM_COUNTS, calls: int = 2000, seed: int = 42) -> Dict[str, dict]:
+    """
+    Latencia por llamada de la selección (select_arm) y la actualización (update) de cada algoritmo.
+    En UCB2 cada select_arm inicia una época, que se registra con una sola llamada a update_epoch.
+
+    Cada algoritmo se calienta antes con 2k pasos para que todos los brazos tengan estimaciones y
+    las medidas correspondan al régimen estacionario. Se registra la mediana de la duración de cada
+    llamada, robusta frente a interrupciones del sistema.
+
+    :param ks: Números de brazos.
+    :param calls: Número de llamadas medidas de cada método.
+    :param seed: Semilla de los algoritmos y de las recompensas.
+    :return: Resultados por nombre ('select_arm/<algoritmo>/k=<k>' y 'update/<algoritmo>/k=<k>', o
+             'update_epoch/UCB2/k=<k>').
+    """
+    results = {}
+    clock = time.perf_counter_ns
+    for k in ks:
+        for algo_class, params in ALGORITHMS.items():
+            np.random.seed(seed)
+            algo = algo_class(k, **params)
+            warmup = 2 * k
+            rewards = np.random.normal(size=warmup + calls)
+            for t in range(warmup):
+                algo.observe(algo.next_arm(t), rewards[t], t)
+
+            select_ns = np.empty(calls)
+            update_ns = np.empty(calls)
+            t = warmup
+            for i in range(calls):
+                if isinstance(algo, UCB2):
+                    start = clock()
+                    arm, num_veces = algo.select_arm(t)
+                    select_ns[i] = clock() - start
+                    # La suma de las num_veces recompensas normales de la época es normal de varianza num_veces
+                    total = rewards[warmup + i] * np.sqrt(num_veces)
+                    start = clock()
+                    algo.update_epoch(arm, total, num_veces)
+                    update_ns[i] = clock() - start
+                    t += num_veces
+                    continue
+
+                start = clock()
+                arm = algo.select_arm(t) if isinstance(algo, UCB1) else algo.select_arm()
+                middle = clock()
+                if isinstance(algo, Gradiente):
+                    algo.update(arm, rewards[warmup + i], t)
+                else:
+                    algo.update(arm, rewards[warmup + i])
+                select_ns[i] = middle - start
+                update_ns[i] = clock() - middle
+                t += 1
+
+            name = algo_class.__name__
+            update_name = 'update_epoch' if algo_class is UCB2 else 'update'
+            results[f'select_arm/{name}/k={k}'] = result(np.median(select_ns), 'ns', 'lower')
+            results[f'{update_name}/{name}/k={k}'] = result(np.median(update_ns), 'ns', 'lower')
+    return results
+
+
+def bench_arms(calls: int = 20000, block: int = 4096, repeat: int = 5, seed: int = 42) -> Dict[str, dict]:
+    """
+    Recompensas por segundo de cada brazo de ARMS: tiradas sueltas (pull), tiradas sueltas con
+    el búfer de bloques activado (pull_buffered) y tiradas en bloque (pull_many).
+
+    :param calls: Número de tiradas sueltas por medida.
+    :param block: Número de recompensas de cada llamada a pull_many y del búfer.
+    :param repeat: Número de medidas; se registra la mejor.
+    :param seed: Semilla de los parámetros de los brazos.
+    :return: Resultados por nombre ('pull/<brazo>', 'pull_buffered/<brazo>', 'pull_many/<brazo>').
+    """
+    results = {}
+    for arm_class in ARMS:
+        name = arm_class.__name__
+        arm = arm_class.generate_arms(1, rng=seed)[0]
+
+        results[f'pull/{name}'] = result(throughput(arm.pull, calls, repeat), 'pulls/s', 'higher')
+        arm.set_block_size(block)
+        results[f'pull_buffered/{name}'] = result(throughput(arm.pull, calls, repeat), 'pulls/s', 'higher')
+        arm.set_block_size(0)
+        many = throughput(lambda: arm.pull_many(block), max(calls // block, 1), repeat)
+        results[f'pull_many/{name}'] = result(many * block, 'pulls/s', 'higher')
+    return results
+
+
+def bench_experiments(notebooks: List[str] = None, runs: int = None, backend: str = 'vectorized',
+                      seed: int = 42) -> Dict[str, dict]:
+    """
+    Pasos por segundo (pasos x ejecuciones x algoritmos) de run_experiment con la configuración
+    de cada notebook.
+
+    :param notebooks: Nombres de los notebooks (claves de NOTEBOOKS). Por defecto todos.
+    :param runs: Número de ejecuciones. Por defecto el del notebook.
+    :param backend: Backend de ejecución del experimento.
+    :param seed: Semilla del bandido y del experimento, como en los notebooks.
+    :return: Resultados por nombre ('experiment/<notebook>').
+    """
+    from experiments import run_experiment  # Evita cargar el motor si solo se miden los componentes
+
+    results = {}
+    for name in notebooks or NOTEBOOKS:
+        arm_class, steps, notebook_runs, specs = NOTEBOOKS[name]
+        runs_used = runs or notebook_runs
+        np.random.seed(seed)
+        bandit = Bandit(arms=arm_class.generate_arms(10))
+        algorithms = [algo_class(k=10, **params) for algo_class, params in specs]
+
+        start = time.perf_counter()
+        run_experiment(bandit, algorithms, steps, runs_used, seed=seed, backend=backend)
+        elapsed = time.perf_counter() - start
+        results[f'experiment/{name}'] = result(steps * runs_used * len(algorithms) / elapsed, 'steps/s', 'higher')
+    return results
+
+
+def bench_pool(n: int = 10 ** 6, k: int = 4, batch: int = 10000, repeat: int = 20,
+               seed: int = 42) -> Dict[str, dict]:
+    """
+    Memoria por instancia y decisiones por segundo (select y update de un lote de identificadores
+    al azar) de cada BanditPool, y memoria por instancia del algoritmo escalar equivalente.
+
+    :param n: Número de instancias del conjunto.
+    :param k: Número de brazos de cada instancia.
+    :param batch: Número de identificadores de cada lote.
+    :param repeat: Número de lotes medidos.
+    :param seed: Semilla de los conjuntos y de las recompensas.
+    :return: Resultados por nombre ('pool_bytes/<conjunto>', 'pool/<conjunto>' y
+             'algorithm_bytes/<algoritmo>').
+    """
+    import tracemalloc
+
+    from algorithms import BanditPool
+
+    results = {}
+    rng = np.random.default_rng(seed)
+    for algo_class in (EpsilonGreedy, UCB1):
+        params = ALGORITHMS[algo_class]
+        tracemalloc.start()
+        algos = [algo_class(k, **params) for _ in range(1000)]
+        size = tracemalloc.get_traced_memory()[0] / len(algos)
+        tracemalloc.stop()
+        results[f'algorithm_bytes/{algo_class.__name__}'] = result(size, 'bytes', 'lower')
+
+        pool = BanditPool.from_algorithm(algos[0], n, rng=seed)
+        name = type(pool).__name__
+        ids = rng.integers(n, size=(repeat, batch))
+        rewards = rng.random((repeat, batch))
+        start = time.perf_counter()
+        for i in range(repeat):
+            pool.update(ids[i], pool.select(ids[i]), rewards[i])
+        results[f'pool/{name}'] = result(repeat * batch / (time.perf_counter() - start), 'decisions/s', 'higher')
+        results[f'pool_bytes/{name}'] = result(pool.bytes_per_instance, 'bytes', 'lower')
+    return results
+
+
+def bench_nonstationary(horizons=(10 ** 3, 10 ** 4, 10 ** 5), k: int = 10, hazard: float = 0.001,
+                        seed: int = 42) -> Dict[str, dict]:
+    """
+    Algoritmos para brazos no estacionarios frente a los estacionarios en un bandido de brazos
+    Bernoulli estacionarios a trozos (ArmBernoulliPiecewise), con distintos horizontes.
+
+    Para cada algoritmo y horizonte se registran la mediana de la duración de un paso (next_arm
+    y observe), la memoria de su estado (arrays de get_state) y el regret dinámico medio por paso,
+    respecto al mejor brazo de cada instante. Con ventana deslizante o descuento, duración y
+    memoria no crecen con el horizonte. La evolución de los brazos es la misma para todos los
+    algoritmos porque se consulta en todos los pasos y tiene su propio flujo aleatorio.
+
+    :param horizons: Números de pasos.
+    :param k: Número de brazos.
+    :param hazard: Probabilidad de cambio de cada brazo en cada paso.
+    :param seed: Semilla de los brazos, las recompensas y los algoritmos.
+    :return: Resultados por nombre ('nonstationary_step/<algoritmo>/T=<T>',
+             'nonstationary_bytes/<algoritmo>/T=<T>' y 'nonstationary_regret/<algoritmo>/T=<T>').
+    """
+    from algorithms import SlidingWindowUCB1, DiscountedUCB1, SlidingWindowEpsilonGreedy, DiscountedEpsilonGreedy
+    from arms import ArmBernoulliPiecewise, NonStationaryBandit
+
+    # Memoria de unos 1 / hazard pasos: la duración media de cada tramo estacionario
+    memory = int(1 / hazard)
+    algorithms = [(UCB1, {'c': 1}), (SlidingWindowUCB1, {'c': 1, 'window': memory}),
+                  (DiscountedUCB1, {'c': 1, 'gamma': 1 - 1 / memory}),
+                  (EpsilonGreedy, {'epsilon': 0.1}), (SlidingWindowEpsilonGreedy, {'epsilon': 0.1, 'window': memory}),
+                  (DiscountedEpsilonGreedy, {'epsilon': 0.1, 'gamma': 1 - 1 / memory})]
+
+    results = {}
+    clock = time.perf_counter_ns
+    for steps in horizons:
+        for algo_class, params in algorithms:
+            bandit = NonStationaryBandit(ArmBernoulliPiecewise.generate_arms(k, hazard, rng=seed), rng=seed)
+            algo = algo_class(k, **params, rng=seed)
+
+            step_ns = np.empty(steps)
+            regret = 0.0
+            for t in range(steps):
+                expected = bandit.get_expected_rewards()
+                start = clock()
+                arm = algo.next_arm(t)
+                reward = bandit.pull_arm(arm)
+                algo.observe(arm, reward, t)
+                step_ns[t] = clock() - start
+                regret += max(expected) - expected[arm]
+
+            name = f'{algo_class.__name__}/T={steps}'
+            state_bytes = sum(np.asarray(value).nbytes for value in algo.get_state().values())
+            results[f'nonstationary_step/{name}'] = result(np.median(step_ns), 'ns', 'lower')
+            results[f'nonstationary_bytes/{name}'] = result(state_bytes, 'bytes', 'lower')
+            results[f'nonstationary_regret/{name}'] = result(regret / steps, 'regret/step', 'lower')
+    return results
+
+
+def bench_imports(repeat: int = 7) -> Dict[str, dict]:
+    """
+    Tiempo de importación de numpy y de los paquetes del proyecto, medido en intérpretes nuevos
+    (como los procesos del backend 'parallel'). Se registra el mínimo de repeat medidas, el menos
+    afectado por la caché de disco y la carga del sistema.
+
+    :param repeat: Número de medidas de cada importación.
+    :return: Resultados por nombre ('import/<paquetes>'), en milisegundos.
+    """
+    src = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = {}
+    for name, statement in IMPORTS.items():
+        code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+        times = [float(subprocess.run([sys.executable, '-c', code], cwd=src, check=True,
+                                      capture_output=True, text=True).stdout)
+                 for _ in range(repeat)]
+        results[f'import/{name}'] = result(1000 * min(times), 'ms', 'lower')
+    return results
+
+
+def import_budget(results: Dict[str, dict]) -> float:
+    """
+    Tiempo de importación de arms y algorithms relativo al de numpy solo, que debe ser como
+    mucho IMPORT_BUDGET.
+    :param results: Resultados de bench_imports.
+    """
+    return results['import/arms+algorithms']['value'] / results['import/numpy']['value']
+
+
+def run_suite(levels=('algorithms', 'arms', 'experiments', 'pool', 'nonstationary', 'imports'), quick: bool = False,
+              backend: str = 'vectorized') -> dict:
+    """
+    Ejecuta los niveles indicados del banco de pruebas.
+
+    :param levels: Niveles a medir: 'algorithms', 'arms', 'experiments', 'pool', 'nonstationary' y/o 'imports'.
+    :param quick: Si es True, medidas más cortas (menos llamadas y 20 ejecuciones por experimento),
+                  útiles para comprobaciones rápidas pero más ruidosas.
+    :param backend: Backend de ejecución de los experimentos.
+    :return: Referencia con los metadatos del entorno y los resultados de cada medida.
+    """
+    results = {}
+    if 'algorithms' in levels:
+        results.update(bench_algorithms(calls=300 if quick else 2000))
+    if 'arms' in levels:
+        results.update(bench_arms(calls=2000 if quick else 20000, repeat=3 if quick else 5))
+    if 'experiments' in levels:
+        results.update(bench_experiments(runs=20 if quick else None, backend=backend))
+    if 'pool' in levels:
+        results.update(bench_pool(n=10 ** 5 if quick else 10 ** 6, repeat=5 if quick else 20))
+    if 'nonstationary' in levels:
+        results.update(bench_nonstationary(horizons=(10 ** 3, 10 ** 4) if quick else (10 ** 3, 10 ** 4, 10 ** 5)))
+    if 'imports' in levels:
+        results.update(bench_imports(repeat=3 if quick else 7))
+
+    metadata = {
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'quick': quick,
+        'backend': backend,
+    }
+    return {'metadata': metadata, 'results': results}
+
+
+def save_baseline(baseline: dict, path: str):
+    """
+    Guarda una referencia en un fichero JSON.
+    """
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> dict:
+    """
+    Carga una referencia guardada con save_baseline.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(current: dict, baseline: dict) -> List[Tuple[str, float, float, float]]:
+    """
+    Compara dos referencias medida a medida.
+
+    :param current: Referencia actual (ver run_suite).
+    :param baseline: Referencia anterior.
+    :return: Lista de (nombre, valor anterior, valor actual, empeoramiento relativo) de las medidas
+             comunes a ambas referencias, de mayor a menor empeoramiento. Un empeoramiento negativo
+             es una mejora.
+    """
+    comparison = []
+    for name, new in current['results'].items():
+        old = baseline['results'].get(name)
+        if old is None:
+            continue
+        if new['better'] == 'lower':
+            change = new['value'] / old['value'] - 1
+        else:
+            change = old['value'] / new['value'] - 1
+        comparison.append((name, old['value'], new['value'], change))
+    return sorted(comparison, key=lambda item: -item[3])
+
+
+def regressions(comparison: List[Tuple[str, float, float, float]], threshold: float = 0.1) -> List[str]:
+    """
+    Nombres de las medidas de una comparación cuyo empeoramiento supera threshold.
+    :param comparison: Resultado de compare.
+    :param threshold: Empeoramiento relativo a partir del cual una medida es una regresión (0.1 = 10%).
+    """
+    return [name for name, _, _, change in comparison if change > threshold]
@@ -0,0 +1,32 @@
+"""
+Module: experiments/__init__.py
+Description: Contiene las importaciones y modulos/clases públicas del paquete experiments.
+
+Author: Jesús Verdú Chacón
+        Jorge López Abad
+Email: jesus.v.c@um.es
+       jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+# Importación de módulos o clases
+from .metrics import checkpoint_steps, WelfordAccumulator, MetricSeries
+from .trajectories import TrajectoryStore, TrajectoryWriter
+from .profiling import LatencyHistogram, Profiler
+from .result import AlgorithmTotals, ExperimentResult
+from .checkpoint import ExperimentCheckpoint
+from .backends import Backend, LoopBackend, VectorizedBackend, ParallelBackend, get_backend
+from .engine import run_experiment
+from .sweep import expand_grid, SweepResult, run_sweep
+from .runner import load_config, run_config
+
+# Lista de módulos o clases públicas
+__all__ = ['checkpoint_steps', 'WelfordAccumulator', 'MetricSeries', 'TrajectoryStore', 'TrajectoryWriter',
+           'LatencyHistogram', 'Profiler', 'AlgorithmTotals', 'ExperimentResult', 'ExperimentCheckpoint',
+           'Backend', 'LoopBackend', 'VectorizedBackend', 'ParallelBackend', 'get_backend', 'run_experiment',
+           'expand_grid', 'SweepResult', 'run_sweep', 'load_config', 'run_config']
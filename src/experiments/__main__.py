@@ -0,0 +1,57 @@
+"""
+Module: experiments/__main__.py
+Description: Ejecución de un experimento desde la línea de comandos, sin notebooks:
+
+             python -m experiments configs/UCB_EML_bernoulli.toml --output results/ucb_bernoulli
+
+             Los parámetros steps, runs, seed, backend y n_workers de la configuración se pueden
+             sustituir con las opciones del mismo nombre.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import argparse
+import os
+import sys
+
+from experiments.runner import load_config, run_config
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m experiments',
+                                     description='Ejecuta un experimento descrito en un fichero JSON o TOML.')
+    parser.add_argument('config', help='Fichero de configuración (.json o .toml).')
+    parser.add_argument('-o', '--output', help='Directorio de salida. Por defecto la clave output de la '
+                                               'configuración o results/<nombre del fichero>.')
+    parser.add_argument('--steps', type=int, help='Número de pasos de cada ejecución.')
+    parser.add_argument('--runs', type=int, help='Número de ejecuciones.')
+    parser.add_argument('--seed', type=int, help='Semilla del experimento.')
+    parser.add_argument('--backend', choices=['loop', 'vectorized', 'parallel'], help='Backend de ejecución.')
+    parser.add_argument('--n-workers', dest='n_workers', type=int, help="Procesos del backend 'parallel'.")
+    parser.add_argument('--no-figures', action='store_true', help='No guardar las gráficas.')
+    parser.add_argument('--quiet', action='store_true', help='No mostrar el progreso.')
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    for name in ('steps', 'runs', 'seed', 'backend', 'n_workers'):
+        if getattr(args, name) is not None:
+            config[name] = getattr(args, name)
+    name = os.path.splitext(os.path.basename(args.config))[0]
+    output_dir = args.output or config.pop('output', None) or os.path.join('results', name)
+    config.pop('output', None)
+
+    result = run_config(config, output_dir, figures=not args.no_figures, progress=not args.quiet)
+    if not args.quiet:
+        print(f"{result.runs} ejecuciones de {result.steps} pasos guardadas en {output_dir}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,432 @@
+"""
+Module: experiments/backends.py
+Description: Backends de ejecución del motor de experimentos. Cada backend simula todas las
+             ejecuciones de un algoritmo y devuelve sus métricas acumuladas.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List
+import os
+
+import numpy as np
+
+from algorithms import Algorithm, BatchedAlgorithm
+from arms import Bandit
+from experiments.metrics import checkpoint_steps
+from experiments.result import AlgorithmTotals
+from experiments.trajectories import TrajectoryStore, TrajectoryWriter
+from randomness import jumped_streams
+
+
+class Backend(ABC):
+    # Perfilador del experimento en curso (ver experiments.profiling). None si no se perfila
+    profiler = None
+
+    def run(self, bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int,
+            seed: int = None, checkpoints: np.ndarray = None,
+            trajectories: TrajectoryStore = None, run_offset: int = 0,
+            progress=None) -> List[AlgorithmTotals]:
+        """
+        Simula runs ejecuciones de steps pasos de cada algoritmo sobre el bandido.
+        :param bandit: Bandido sobre el que se experimenta.
+        :param algorithms: Algoritmos a simular.
+        :param steps: Número de pasos de tiempo de cada ejecución.
+        :param runs: Número de ejecuciones.
+        :param seed: Semilla para la reproducibilidad de los resultados. None para no fijarla.
+        :param checkpoints: Pasos de tiempo en los que se registran las métricas. Por defecto todos.
+        :param trajectories: Almacén en el que guardar las trayectorias de cada ejecución. Opcional.
+        :param run_offset: Índice global de la primera ejecución (almacén de trayectorias y bandidos
+                           con números aleatorios comunes).
+        :param progress: Si se indica, función a la que se llama con el número de ejecuciones (de un
+                         algoritmo) completadas desde la llamada anterior.
+        :return: Acumulados de las métricas de cada algoritmo.
+        """
+        if seed is not None:
+            np.random.seed(seed)  # Asegurar reproducibilidad de resultados.
+
+        totals = []
+        for i, algo in enumerate(algorithms):
+            totals.append(self.run_algorithm(bandit, algo, steps, runs, checkpoints=checkpoints,
+                                             recorder=None if trajectories is None else trajectories.writer(i, run_offset),
+                                             run_offset=run_offset))
+            if progress is not None:
+                progress(runs)
+        return totals
+
+    @abstractmethod
+    def run_algorithm(self, bandit: Bandit, algo: Algorithm, steps: int, runs: int,
+                      rng=None, checkpoints: np.ndarray = None,
+                      recorder: TrajectoryWriter = None, run_offset: int = 0) -> AlgorithmTotals:
+        """
+        Simula runs ejecuciones de steps pasos de un algoritmo sobre el bandido.
+        :param bandit: Bandido sobre el que se experimenta.
+        :param algo: Algoritmo a simular.
+        :param steps: Número de pasos de tiempo de cada ejecución.
+        :param runs: Número de ejecuciones.
+        :param rng: Generador aleatorio. Por defecto el estado global de np.random.
+        :param checkpoints: Pasos de tiempo en los que se registran las métricas. Por defecto todos.
+        :param recorder: Escritor de las trayectorias de cada ejecución. Opcional.
+        :param run_offset: Índice global de la primera ejecución (bandidos con números aleatorios comunes).
+        :return: Acumulados de las métricas sobre todas las ejecuciones.
+        """
+        raise NotImplementedError("Este método debe ser implementado por la subclase.")
+
+
+class LoopBackend(Backend):
+    """
+    Backend de referencia: simula cada ejecución paso a paso usando el protocolo uniforme
+    next_epoch / observe de los algoritmos. Las épocas de varios pasos (UCB2) se registran con
+    una sola actualización agregada; si no contienen pasos registrados su recompensa total se
+    extrae directamente de la distribución de la suma.
+
+    Con bandidos no estacionarios el regret es dinámico: en cada paso se compara con la recompensa
+    esperada del brazo óptimo en ese paso, que también es el que cuenta como selección óptima.
+    """
+
+    def run_algorithm(self, bandit: Bandit, algo: Algorithm, steps: int, runs: int,
+                      rng=None, checkpoints: np.ndarray = None,
+                      recorder: TrajectoryWriter = None, run_offset: int = 0) -> AlgorithmTotals:
+        # Los algoritmos secuenciales usan el estado global de np.random
+        checkpoints = checkpoint_steps(steps) if checkpoints is None else checkpoints
+        totals = AlgorithmTotals.zeros(checkpoints, bandit.k)
+        if self.profiler is not None:
+            self.profiler.instrument_totals(totals)
+        dynamic = not bandit.stationary
+        if not dynamic:
+            optimal_arm = bandit.optimal_arm
+            optimal_reward = bandit.get_expected_value(optimal_arm)
+
+        # Valores de la ejecución en curso en los pasos registrados
+        point_rewards = np.zeros(len(checkpoints))
+        point_optimal = np.zeros(len(checkpoints))
+        point_regret = np.zeros(len(checkpoints))
+        final_regret = np.zeros(runs)
+
+        if recorder is not None:
+            # Trayectoria completa de la ejecución en curso
+            run_arms = np.zeros(steps, dtype=recorder.arms.dtype)
+            run_rewards = np.zeros(steps, dtype=np.float32)
+            # Recompensa esperada del brazo óptimo de cada paso (regret dinámico)
+            run_optimal = np.zeros(steps, dtype=np.float32) if dynamic else None
+
+        for run in range(runs):
+            algo.reset()  # Reiniciar los valores del algoritmo.
+            bandit.start_runs(run_offset + run, 1)
+
+            total_reward = 0.0
+            optimal_total = 0.0  # Suma de las recompensas esperadas óptimas (regret dinámico)
+            point = 0  # Siguiente paso registrado
+            step = 0
+            while step < steps:
+                # Seleccionar un brazo y el número de pasos durante los que no cambia la decisión.
+                chosen_arm, num_veces = algo.next_epoch(step)
+                num_veces = min(num_veces, steps - step)
+
+                if dynamic:
+                    end = point + np.searchsorted(checkpoints[point:], step + num_veces)
+                    reward, optimal_total = self.pull_dynamic(
+                        bandit, chosen_arm, step, num_veces, checkpoints[point:end], total_reward,
+                        optimal_total, point_rewards[point:end], point_optimal[point:end],
+                        point_regret[point:end], None if recorder is None else run_rewards[step:step + num_veces],
+                        None if recorder is None else run_optimal[step:step + num_veces])
+                    if num_veces == 1:
+                        algo.observe(chosen_arm, reward, step)
+                    else:
+                        algo.observe_epoch(chosen_arm, reward, num_veces, step)
+                    total_reward += reward
+                    point = end
+                elif num_veces == 1:
+                    reward = bandit.pull_arm(chosen_arm)  # Obtener la recompensa del brazo seleccionado.
+                    algo.observe(chosen_arm, reward, step)  # Actualizar el valor estimado del brazo seleccionado.
+                    total_reward += reward
+                    if recorder is not None:
+                        run_rewards[step] = reward
+
+                    if step == checkpoints[point]:
+                        point_rewards[point] = reward
+                        point_optimal[point] = chosen_arm == optimal_arm
+                        point_regret[point] = (step + 1) * optimal_reward - total_reward
+                        point += 1
+                else:
+                    end = point + np.searchsorted(checkpoints[point:], step + num_veces)
+                    reward = self.pull_epoch(bandit, chosen_arm, step, num_veces, checkpoints[point:end],
+                                             total_reward, point_rewards[point:end], point_regret[point:end],
+                                             optimal_reward,
+                                             None if recorder is None else run_rewards[step:step + num_veces])
+                    algo.observe_epoch(chosen_arm, reward, num_veces, step)
+                    total_reward += reward
+
+                    point_optimal[point:end] = chosen_arm == optimal_arm
+                    point = end
+
+                totals.arm_rewards[chosen_arm] += reward
+                totals.arm_selections[chosen_arm] += num_veces
+                if recorder is not None:
+                    run_arms[step:step + num_veces] = chosen_arm
+                step += num_veces
+
+            if recorder is not None:
+                recorder.write_run(run, run_arms, run_rewards, run_optimal)
+            totals.rewards.add(point_rewards)
+            totals.optimal_selections.add(point_optimal)
+            totals.regret.add(point_regret)
+            final_regret[run] = point_regret[-1]
+            totals.runs += 1
+
+        totals.final_regret = final_regret
+        if recorder is not None:
+            recorder.flush()
+        return totals
+
+    @staticmethod
+    def pull_dynamic(bandit: Bandit, chosen_arm: int, step: int, num_veces: int, points: np.ndarray,
+                     total_reward: float, optimal_total: float, point_rewards: np.ndarray,
+                     point_optimal: np.ndarray, point_regret: np.ndarray, out: np.ndarray = None,
+                     out_optimal: np.ndarray = None):
+        """
+        Tira num_veces del brazo elegido de un bandido no estacionario a partir de step, registrando
+        los pasos de points. Antes de cada tirada se leen las recompensas esperadas del paso.
+        :param optimal_total: Suma de las recompensas esperadas óptimas de los pasos anteriores.
+        :param out: Si se indica, se guardan en él todas las recompensas de la época.
+        :param out_optimal: Si se indica, se guarda en él la recompensa esperada óptima de cada paso.
+        :return: Suma de las recompensas de la época y suma de las recompensas esperadas óptimas
+                 hasta el final de la época.
+        """
+        epoch_reward = 0.0
+        i = 0  # Siguiente paso registrado
+        for offset in range(num_veces):
+            expected = bandit.get_expected_rewards()
+            optimal_arm = int(np.argmax(expected))
+            optimal_total += expected[optimal_arm]
+            if out_optimal is not None:
+                out_optimal[offset] = expected[optimal_arm]
+
+            reward = bandit.pull_arm(chosen_arm)
+            epoch_reward += reward
+            if out is not None:
+                out[offset] = reward
+
+            if i < len(points) and step + offset == points[i]:
+                point_rewards[i] = reward
+                point_optimal[i] = chosen_arm == optimal_arm
+                point_regret[i] = optimal_total - (total_reward + epoch_reward)
+                i += 1
+        return epoch_reward, optimal_total
+
+    @staticmethod
+    def pull_epoch(bandit: Bandit, chosen_arm: int, step: int, num_veces: int, points: np.ndarray,
+                   total_reward: float, point_rewards: np.ndarray, point_regret: np.ndarray,
+                   optimal_reward: float, out: np.ndarray = None) -> float:
+        """
+        Tira num_veces del brazo elegido a partir de step, registrando los pasos de points.
+        :param out: Si se indica, se guardan en él todas las recompensas de la época.
+        :return: Suma de las recompensas de la época.
+        """
+        if out is not None or 2 * len(points) > num_veces:
+            # Muchos pasos registrados: toda la época con una sola extracción vectorizada.
+            rewards = bandit.pull_arm_many(chosen_arm, num_veces)
+            if out is not None:
+                out[:] = rewards
+            cumulative = total_reward + np.cumsum(rewards)
+            point_rewards[:] = rewards[points - step]
+            point_regret[:] = (points + 1) * optimal_reward - cumulative[points - step]
+            return float(cumulative[-1] - total_reward)
+
+        # Pocos pasos registrados: recompensas individuales en ellos y sumas entre medias.
+        epoch_reward = 0.0
+        cursor = step
+        for i, point in enumerate(points):
+            if point > cursor:
+                epoch_reward += bandit.pull_arm_total(chosen_arm, point - cursor)
+            reward = bandit.pull_arm(chosen_arm)
+            epoch_reward += reward
+            point_rewards[i] = reward
+            point_regret[i] = (point + 1) * optimal_reward - (total_reward + epoch_reward)
+            cursor = point + 1
+        if step + num_veces > cursor:
+            epoch_reward += bandit.pull_arm_total(chosen_arm, step + num_veces - cursor)
+        return epoch_reward
+
+
+class VectorizedBackend(Backend):
+    """
+    Backend vectorizado: simula todas las ejecuciones a la vez con la versión por lotes del
+    algoritmo y el muestreo vectorizado del bandido. Los algoritmos sin versión por lotes se
+    simulan con el backend de referencia, igual que todos los algoritmos con bandidos no
+    estacionarios: cada ejecución sigue su propio camino de los brazos y todos los algoritmos se
+    evalúan sobre los mismos caminos (ver NonStationaryBandit).
+    """
+    # Tamaño aproximado del bloque de trayectorias que se guarda en memoria antes de escribirlo
+    TRAJECTORY_BLOCK_BYTES = 1 << 24
+
+    def run_algorithm(self, bandit: Bandit, algo: Algorithm, steps: int, runs: int,
+                      rng=None, checkpoints: np.ndarray = None,
+                      recorder: TrajectoryWriter = None, run_offset: int = 0) -> AlgorithmTotals:
+        try:
+            batched = BatchedAlgorithm.from_algorithm(algo, runs, rng=rng) if bandit.stationary else None
+        except ValueError:
+            batched = None
+        if batched is None:
+            # Sin versión por lotes, o bandido no estacionario (cada ejecución sigue su propio camino)
+            loop = LoopBackend()
+            loop.profiler = self.profiler
+            return loop.run_algorithm(bandit, algo, steps, runs, checkpoints=checkpoints,
+                                      recorder=recorder, run_offset=run_offset)
+
+        checkpoints = checkpoint_steps(steps) if checkpoints is None else checkpoints
+        totals = AlgorithmTotals.zeros(checkpoints, bandit.k)
+        if self.profiler is not None:
+            self.profiler.instrument_algorithm(batched, source=algo)
+            self.profiler.instrument_totals(totals)
+        optimal_arm = bandit.optimal_arm
+        optimal_reward = bandit.get_expected_value(optimal_arm)
+
+        total_rewards = np.zeros(runs)
+        point = 0  # Siguiente paso registrado
+        bandit.start_runs(run_offset, runs)
+
+        if recorder is not None:
+            # Las trayectorias se escriben por bloques de pasos para no escribir columna a columna
+            block = max(1, min(steps, self.TRAJECTORY_BLOCK_BYTES // (runs * 6)))
+            block_arms = np.zeros((block, runs), dtype=recorder.arms.dtype)
+            block_rewards = np.zeros((block, runs), dtype=np.float32)
+
+        for step in range(steps):
+            chosen_arms = batched.select_arms(step)
+            rewards = bandit.pull_arms(chosen_arms)
+            batched.update_batch(chosen_arms, rewards)
+            total_rewards += rewards
+
+            if recorder is not None:
+                row = step % block
+                block_arms[row], block_rewards[row] = chosen_arms, rewards
+                if row == block - 1 or step == steps - 1:
+                    recorder.write_steps(step - row, block_arms[:row + 1], block_rewards[:row + 1])
+
+            if step == checkpoints[point]:
+                totals.rewards.add_at(point, rewards)
+                totals.optimal_selections.add_at(point, chosen_arms == optimal_arm)
+                totals.regret.add_at(point, (step + 1) * optimal_reward - total_rewards)
+                point += 1
+
+        # La ganancia de cada brazo se obtiene de los conteos y los promedios estimados
+        totals.arm_rewards += np.sum(batched.counts * batched.values, axis=0)
+        totals.arm_selections += np.sum(batched.counts, axis=0)
+        totals.runs = runs
+        totals.final_regret = steps * optimal_reward - total_rewards
+
+        if recorder is not None:
+            recorder.flush()
+        return totals
+
+
+def _run_shard(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int,
+               seed_seq: np.random.SeedSequence, inner: Backend, checkpoints: np.ndarray,
+               trajectories: TrajectoryStore = None, run_offset: int = 0) -> List[AlgorithmTotals]:
+    """
+    Simula un fragmento de las ejecuciones en un proceso trabajador con su propio flujo aleatorio.
+    """
+    rng = np.random.Generator(np.random.Philox(seed_seq))
+    # Los brazos y algoritmos secuenciales usan el estado global, que también se siembra
+    np.random.seed(seed_seq.generate_state(4))
+
+    # Cada brazo y cada algoritmo recibe un flujo saltado del fragmento; el del bandido (rng) solo
+    # se usa para las recompensas, de modo que las decisiones no comparten flujo con ellas
+    streams = jumped_streams(rng, bandit.k + len(algorithms))
+    algo_rngs = streams[bandit.k:]
+    bandit = bandit.with_rng(rng)
+    for algo, algo_rng in zip(algorithms, algo_rngs):
+        if algo.rng is not None:
+            algo.rng = algo_rng
+
+    return [inner.run_algorithm(bandit, algo, steps, runs, rng=algo_rng, checkpoints=checkpoints,
+                                recorder=None if trajectories is None else trajectories.writer(i, run_offset),
+                                run_offset=run_offset)
+            for i, (algo, algo_rng) in enumerate(zip(algorithms, algo_rngs))]
+
+
+class ParallelBackend(Backend):
+    """
+    Backend paralelo: reparte las ejecuciones entre varios procesos. Cada fragmento recibe un
+    flujo aleatorio independiente obtenido con np.random.SeedSequence(seed).spawn(n_workers) y
+    los acumulados parciales se combinan al final en orden, de modo que el resultado es reproducible
+    para cada pareja (seed, n_workers).
+    """
+
+    def __init__(self, n_workers: int = None, inner: Backend = None):
+        """
+        :param n_workers: Número de procesos. Por defecto el número de CPUs.
+        :param inner: Backend que simula cada fragmento. Por defecto el vectorizado.
+        """
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.inner = inner if inner is not None else VectorizedBackend()
+
+    def run(self, bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int,
+            seed: int = None, checkpoints: np.ndarray = None,
+            trajectories: TrajectoryStore = None, run_offset: int = 0,
+            progress=None) -> List[AlgorithmTotals]:
+        checkpoints = checkpoint_steps(steps) if checkpoints is None else checkpoints
+        n_shards = min(self.n_workers, runs)
+        if seed is None:
+            # Sin semilla, los fragmentos se derivan del estado global de np.random
+            seed = np.random.randint(2 ** 32, size=4, dtype=np.uint64)
+        children = np.random.SeedSequence(seed).spawn(self.n_workers)[:n_shards]
+        # Reparto de las ejecuciones lo más equilibrado posible
+        shards = np.array_split(np.arange(runs), n_shards)
+
+        with ProcessPoolExecutor(max_workers=n_shards) as executor:
+            futures = [executor.submit(_run_shard, bandit, algorithms, steps, len(shard), child, self.inner,
+                                       checkpoints, trajectories, run_offset + int(shard[0]))
+                       for shard, child in zip(shards, children)]
+            if progress is not None:
+                sizes = {future: len(shard) for future, shard in zip(futures, shards)}
+                for future in as_completed(futures):
+                    progress(sizes[future] * len(algorithms))
+            partials = [future.result() for future in futures]
+
+        # Reducción de los acumulados parciales de cada algoritmo en el orden de los fragmentos
+        totals = partials[0]
+        for partial in partials[1:]:
+            totals = [total + other for total, other in zip(totals, partial)]
+        return totals
+
+    def run_algorithm(self, bandit: Bandit, algo: Algorithm, steps: int, runs: int,
+                      rng=None, checkpoints: np.ndarray = None,
+                      recorder: TrajectoryWriter = None, run_offset: int = 0) -> AlgorithmTotals:
+        if recorder is not None:
+            raise ValueError("El backend 'parallel' guarda las trayectorias desde run(trajectories=...).")
+        seed = None if rng is None else int(rng.integers(2 ** 32))
+        return self.run(bandit, [algo], steps, runs, seed, checkpoints, run_offset=run_offset)[0]
+
+
+# Backends disponibles por nombre
+BACKENDS = {
+    'loop': LoopBackend,
+    'vectorized': VectorizedBackend,
+    'parallel': ParallelBackend,
+}
+
+
+def get_backend(backend, **options) -> Backend:
+    """
+    Obtiene un backend a partir de su nombre o de una instancia.
+    :param backend: Nombre del backend o instancia de Backend.
+    :param options: Parámetros del constructor del backend (p.e. n_workers para 'parallel').
+    :return: Instancia del backend.
+    :raises ValueError: Si el nombre no corresponde a ningún backend.
+    """
+    if isinstance(backend, Backend):
+        return backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend desconocido: {backend}. Opciones: {', '.join(BACKENDS)}.")
+    return BACKENDS[backend](**options)
@@ -0,0 +1,195 @@
+"""
+Module: experiments/checkpoint.py
+Description: Puntos de control de un experimento: estado de los algoritmos, estado aleatorio,
+             acumulados parciales y ejecuciones completadas, guardados de forma atómica en un
+             fichero binario .npz para poder reanudar el experimento tras una interrupción.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from dataclasses import dataclass
+from typing import List, Dict
+import json
+import os
+import pickle
+
+import numpy as np
+
+from algorithms import Algorithm
+from arms import Bandit
+from experiments.metrics import WelfordAccumulator
+from experiments.result import AlgorithmTotals
+
+
+def get_rng_state(rng):
+    """
+    Obtiene el estado de un generador aleatorio.
+    :param rng: Generator, RandomState o None.
+    :return: Estado del generador o None.
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng.bit_generator.state
+    if isinstance(rng, np.random.RandomState):
+        return rng.get_state()
+    return None
+
+
+def set_rng_state(rng, state):
+    """
+    Restaura el estado de un generador aleatorio obtenido con get_rng_state.
+    :param rng: Generator, RandomState o None.
+    :param state: Estado del generador.
+    """
+    if isinstance(rng, np.random.Generator):
+        rng.bit_generator.state = state
+    elif isinstance(rng, np.random.RandomState):
+        rng.set_state(state)
+
+
+def get_random_state(bandit: Bandit, algorithms: List[Algorithm]) -> dict:
+    """
+    Obtiene todo el estado aleatorio de un experimento: el estado global de np.random, los
+    generadores del bandido, de los brazos y de los algoritmos, y los búferes de recompensas
+    precalculadas de los brazos.
+    """
+    return {
+        'global': np.random.get_state(),
+        'bandit': get_rng_state(bandit.rng),
+        'arms': [(get_rng_state(arm.rng), None if arm._buffer is None else arm._buffer.copy(), arm._buffer_pos)
+                 for arm in bandit.arms],
+        'algorithms': [get_rng_state(algo.rng) for algo in algorithms],
+    }
+
+
+def set_random_state(bandit: Bandit, algorithms: List[Algorithm], state: dict):
+    """
+    Restaura el estado aleatorio obtenido con get_random_state.
+    """
+    np.random.set_state(state['global'])
+    set_rng_state(bandit.rng, state['bandit'])
+    for arm, (rng_state, buffer, buffer_pos) in zip(bandit.arms, state['arms']):
+        set_rng_state(arm.rng, rng_state)
+        arm._buffer, arm._buffer_pos = buffer, buffer_pos
+    for algo, rng_state in zip(algorithms, state['algorithms']):
+        set_rng_state(algo.rng, rng_state)
+
+
+@dataclass
+class ExperimentCheckpoint:
+    """
+    Punto de control de un experimento tomado entre dos bloques de ejecuciones.
+    """
+    # Parámetros del experimento, para comprobar que se reanuda el mismo experimento
+    config: dict
+    # Índices de las ejecuciones completadas
+    completed_runs: np.ndarray
+    # Acumulados parciales de cada algoritmo
+    totals: List[AlgorithmTotals]
+    # Estado de cada algoritmo (ver Algorithm.get_state)
+    algorithm_states: List[Dict[str, np.ndarray]]
+    # Estado aleatorio del experimento (ver get_random_state)
+    random_state: dict
+
+    @classmethod
+    def capture(cls, config: dict, completed_runs: int, totals: List[AlgorithmTotals],
+                bandit: Bandit, algorithms: List[Algorithm]) -> 'ExperimentCheckpoint':
+        """
+        Toma un punto de control del estado actual del experimento.
+        :param config: Parámetros del experimento.
+        :param completed_runs: Número de ejecuciones completadas.
+        :param totals: Acumulados parciales de cada algoritmo.
+        :param bandit: Bandido del experimento.
+        :param algorithms: Algoritmos del experimento.
+        """
+        return cls(config, np.arange(completed_runs), totals,
+                   [algo.get_state() for algo in algorithms], get_random_state(bandit, algorithms))
+
+    def restore(self, bandit: Bandit, algorithms: List[Algorithm]):
+        """
+        Restaura el estado de los algoritmos y el estado aleatorio del experimento.
+        """
+        for algo, state in zip(algorithms, self.algorithm_states):
+            algo.set_state(state)
+        set_random_state(bandit, algorithms, self.random_state)
+
+    def check(self, config: dict):
+        """
+        Comprueba que el punto de control corresponde al experimento indicado.
+        :raises ValueError: Si algún parámetro no coincide.
+        """
+        for name, value in config.items():
+            if self.config.get(name) != value:
+                raise ValueError(f"El punto de control no corresponde al experimento: {name} = "
+                                 f"{self.config.get(name)} en lugar de {value}.")
+
+    def save(self, path: str):
+        """
+        Guarda el punto de control. Se escribe en un fichero temporal que después sustituye al
+        anterior, de modo que una interrupción nunca deja un punto de control a medias.
+        :param path: Ruta del fichero.
+        """
+        arrays = {
+            'config': np.array(json.dumps(self.config)),
+            'completed_runs': self.completed_runs,
+            'random_state': np.frombuffer(pickle.dumps(self.random_state, pickle.HIGHEST_PROTOCOL), dtype=np.uint8),
+        }
+        for i, total in enumerate(self.totals):
+            arrays[f'totals/{i}/runs'] = np.array(total.runs)
+            arrays[f'totals/{i}/checkpoints'] = total.checkpoints
+            arrays[f'totals/{i}/arm_rewards'] = total.arm_rewards
+            arrays[f'totals/{i}/arm_selections'] = total.arm_selections
+            arrays[f'totals/{i}/final_regret'] = total.final_regret
+            for metric in ('rewards', 'optimal_selections', 'regret'):
+                acc = getattr(total, metric)
+                arrays[f'totals/{i}/{metric}/count'] = acc.count
+                arrays[f'totals/{i}/{metric}/mean'] = acc.mean
+                arrays[f'totals/{i}/{metric}/m2'] = acc.m2
+        for i, state in enumerate(self.algorithm_states):
+            for name, value in state.items():
+                arrays[f'algorithms/{i}/{name}'] = value
+
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'ExperimentCheckpoint':
+        """
+        Carga un punto de control guardado con save.
+        :param path: Ruta del fichero.
+        """
+        with np.load(path) as data:
+            config = json.loads(data['config'].item())
+            n_algorithms = config['algorithms']
+
+            totals = []
+            for i in range(n_algorithms):
+                accumulators = []
+                for metric in ('rewards', 'optimal_selections', 'regret'):
+                    acc = WelfordAccumulator(0)
+                    acc.count = data[f'totals/{i}/{metric}/count']
+                    acc.mean = data[f'totals/{i}/{metric}/mean']
+                    acc.m2 = data[f'totals/{i}/{metric}/m2']
+                    accumulators.append(acc)
+                totals.append(AlgorithmTotals(int(data[f'totals/{i}/runs']), data[f'totals/{i}/checkpoints'],
+                                              *accumulators, data[f'totals/{i}/arm_rewards'],
+                                              data[f'totals/{i}/arm_selections'], data[f'totals/{i}/final_regret']))
+
+            algorithm_states = [{} for _ in range(n_algorithms)]
+            for key in data.files:
+                if key.startswith('algorithms/'):
+                    _, i, name = key.split('/')
+                    algorithm_states[int(i)][name] = data[key]
+
+            random_state = pickle.loads(data['random_state'].tobytes())
+            return cls(config, data['completed_runs'], totals, algorithm_states, random_state)
@@ -0,0 +1,210 @@
+"""
+Module: experiments/engine.py
+Description: Motor de experimentos que compara algoritmos sobre un bandido multibrazo.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from contextlib import nullcontext
+from typing import List
+import os
+import time
+
+import numpy as np
+
+from algorithms import Algorithm
+from arms import Bandit, CommonRandomBandit
+from experiments.backends import Backend, ParallelBackend, get_backend
+from experiments.checkpoint import ExperimentCheckpoint
+from experiments.metrics import checkpoint_steps
+from experiments.profiling import Profiler
+from experiments.result import AlgorithmTotals, ExperimentResult
+from experiments.trajectories import TrajectoryStore
+
+
+def run_experiment(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int,
+                   seed: int = None, backend='vectorized', n_workers: int = None,
+                   record_every: int = 1, log_points: int = None,
+                   trajectories: str = None, checkpoint: str = None, batch_runs: int = None,
+                   resume: bool = True, common_random_numbers: bool = False,
+                   regret_tolerance: float = None, optimal_tolerance: float = None,
+                   confidence: float = 0.95, profile: bool = False, progress=None) -> ExperimentResult:
+    """
+    Ejecuta el experimento: simula runs ejecuciones de steps pasos de cada algoritmo.
+
+    El regret de cada paso se calcula respecto a la recompensa esperada del brazo óptimo (del
+    brazo óptimo en ese paso con bandidos no estacionarios: regret dinámico). Las
+    métricas se acumulan en flujo (media y varianza) solo en los pasos registrados, por lo que la
+    memoria no depende del horizonte.
+
+    Si se indica alguna tolerancia, el experimento es adaptativo: se simulan bloques de batch_runs
+    ejecuciones hasta que la semiamplitud del intervalo de confianza del regret final (y del
+    porcentaje de selecciones óptimas en el último paso) de todos los algoritmos es menor que la
+    tolerancia, o hasta agotar las runs ejecuciones. result.runs indica las ejecuciones usadas.
+
+    :param bandit: Bandido sobre el que se experimenta.
+    :param algorithms: Lista de instancias de algoritmos a comparar.
+    :param steps: Número de pasos de tiempo de cada ejecución.
+    :param runs: Número de ejecuciones (máximo, en el modo adaptativo).
+    :param seed: Semilla para la reproducibilidad de los resultados. None para no fijarla.
+    :param backend: Nombre ('loop', 'vectorized', 'parallel') o instancia del backend de ejecución.
+    :param n_workers: Número de procesos del backend 'parallel'. Por defecto el número de CPUs. El
+                      reparto de las ejecuciones entre los procesos determina sus flujos aleatorios,
+                      por lo que el resultado es reproducible para cada pareja (seed, n_workers).
+    :param record_every: Registrar las métricas uno de cada record_every pasos.
+    :param log_points: Si se indica, registrar unos log_points pasos espaciados logarítmicamente.
+    :param trajectories: Si se indica, directorio en el que guardar (np.memmap) el brazo elegido y la
+                         recompensa de cada paso de cada ejecución.
+    :param checkpoint: Si se indica, fichero en el que guardar un punto de control al final de cada
+                       bloque de batch_runs ejecuciones.
+    :param batch_runs: Número de ejecuciones de cada bloque (puntos de control y modo adaptativo).
+                       Por defecto runs // 10.
+    :param resume: Si existe el punto de control, reanudar el experimento desde él.
+    :param common_random_numbers: Si es True, todos los algoritmos reciben la misma recompensa en la
+                                  n-ésima tirada de cada brazo en cada ejecución (ver CommonRandomBandit),
+                                  y result.variance_reduction indica la reducción de varianza conseguida.
+    :param regret_tolerance: Semiamplitud máxima del intervalo de confianza del regret final.
+    :param optimal_tolerance: Semiamplitud máxima del intervalo de confianza del porcentaje de
+                              selecciones óptimas en el último paso (en puntos porcentuales).
+    :param confidence: Nivel de confianza de los intervalos del modo adaptativo.
+    :param profile: Si es True, se miden las llamadas y latencias de las tiradas del bandido, de la
+                    selección y actualización de cada algoritmo y de la contabilidad del motor (ver
+                    Profiler), se imprime un resumen al terminar y se devuelve en result.profile.
+    :param progress: Si se indica, función a la que se llama con el número de ejecuciones (de un
+                     algoritmo) completadas desde la llamada anterior, hasta runs x algoritmos.
+    :return: Resultado del experimento.
+    :raises ValueError: Si se piden números aleatorios comunes con un bandido no estacionario.
+    """
+    assert steps > 0, "El número de pasos debe ser mayor que 0."
+    assert runs > 0, "El número de ejecuciones debe ser mayor que 0."
+
+    options = {'n_workers': n_workers} if backend == 'parallel' else {}
+    backend = get_backend(backend, **options)
+
+    checkpoints = checkpoint_steps(steps, record_every, log_points)
+
+    resuming = checkpoint is not None and resume and os.path.exists(checkpoint)
+
+    table_seed = None
+    if common_random_numbers:
+        if not bandit.stationary:
+            raise ValueError("Los números aleatorios comunes no admiten bandidos no estacionarios.")
+        if resuming:
+            # Al reanudar se usa la misma tabla de recompensas que en las ejecuciones ya simuladas
+            table_seed = ExperimentCheckpoint.load(checkpoint).config.get('table_seed')
+        if table_seed is None:
+            table_seed = seed if seed is not None else int(np.random.randint(2 ** 31))
+        bandit = CommonRandomBandit(bandit.arms, table_seed)
+
+    store = None
+    if trajectories is not None:
+        if resuming and os.path.exists(os.path.join(trajectories, TrajectoryStore.HEADER)):
+            store = TrajectoryStore.open(trajectories)
+        else:
+            store = TrajectoryStore.create(trajectories, bandit, algorithms, steps, runs)
+
+    profiler = Profiler() if profile else None
+    if profiler is not None and not isinstance(backend, ParallelBackend):
+        # En el backend 'parallel' la simulación se ejecuta en otros procesos
+        profiler.instrument(bandit, algorithms)
+    backend.profiler = profiler
+    start = time.perf_counter_ns()
+
+    adaptive = regret_tolerance is not None or optimal_tolerance is not None
+    try:
+        if checkpoint is None and not adaptive:
+            totals = backend.run(bandit, algorithms, steps, runs, seed, checkpoints, trajectories=store,
+                                 progress=progress)
+        else:
+            def converged(totals: List[AlgorithmTotals]) -> bool:
+                return adaptive and _converged(totals, confidence, regret_tolerance, optimal_tolerance)
+
+            totals = _run_batches(backend, bandit, algorithms, steps, runs, seed, checkpoints, store,
+                                  batch_runs or max(1, runs // 10), checkpoint, resuming, converged, profiler,
+                                  progress, table_seed)
+
+        with _section(profiler, 'engine.result'):
+            result = ExperimentResult.from_totals(algorithms, totals, steps, bandit.optimal_arm)
+    finally:
+        backend.profiler = None
+        if profiler is not None:
+            profiler.restore()
+            profiler.wall_ns = time.perf_counter_ns() - start
+
+    result.trajectories = store
+    result.profile = profiler
+    if profiler is not None:
+        print(profiler.report())
+    if store is not None and result.runs < runs:
+        store.set_runs_used(result.runs)
+    return result
+
+
+def _section(profiler: Profiler, key: str):
+    """
+    Mide un bloque de código con el perfilador, si lo hay.
+    """
+    return nullcontext() if profiler is None else profiler.section(key)
+
+
+def _converged(totals: List[AlgorithmTotals], confidence: float, regret_tolerance: float = None,
+               optimal_tolerance: float = None) -> bool:
+    """
+    Comprueba si los intervalos de confianza de todos los algoritmos cumplen las tolerancias.
+    """
+    for total in totals:
+        if regret_tolerance is not None and total.regret.half_width(confidence)[-1] > regret_tolerance:
+            return False
+        if optimal_tolerance is not None and 100 * total.optimal_selections.half_width(confidence)[-1] > optimal_tolerance:
+            return False
+    return True
+
+
+def _run_batches(backend: Backend, bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int,
+                 seed: int, checkpoints: np.ndarray, store: TrajectoryStore, every: int,
+                 path: str = None, resuming: bool = False, converged=None,
+                 profiler: Profiler = None, progress=None, table_seed: int = None) -> List[AlgorithmTotals]:
+    """
+    Simula las ejecuciones por bloques de every ejecuciones. Al final de cada bloque se guarda un
+    punto de control (si se indica path) y se termina si converged(totals) es cierto.
+
+    Al reanudar se restauran el estado de los algoritmos, el estado aleatorio y los acumulados,
+    por lo que el resultado final es idéntico al de una simulación sin interrupciones. La semilla
+    de la tabla de números aleatorios comunes (table_seed) se guarda con la configuración.
+    """
+    config = {'steps': steps, 'runs': runs, 'k': bandit.k, 'seed': seed, 'every': every,
+              'algorithms': len(algorithms), 'classes': [type(algo).__name__ for algo in algorithms],
+              'checkpoints': len(checkpoints), 'table_seed': table_seed}
+
+    if resuming:
+        state = ExperimentCheckpoint.load(path)
+        state.check(config)
+        state.restore(bandit, algorithms)
+        totals = state.totals
+        completed = len(state.completed_runs)
+    else:
+        if seed is not None:
+            np.random.seed(seed)  # Asegurar reproducibilidad de resultados.
+        totals = [AlgorithmTotals.zeros(checkpoints, bandit.k) for _ in algorithms]
+        completed = 0
+
+    while completed < runs and not (completed and converged is not None and converged(totals)):
+        block = min(every, runs - completed)
+        partials = backend.run(bandit, algorithms, steps, block, None, checkpoints,
+                               trajectories=store, run_offset=completed, progress=progress)
+        with _section(profiler, 'engine.merge'):
+            totals = [total + partial for total, partial in zip(totals, partials)]
+        completed += block
+
+        if path is not None:
+            with _section(profiler, 'engine.checkpoint'):
+                ExperimentCheckpoint.capture(config, completed, totals, bandit, algorithms).save(path)
+
+    return totals
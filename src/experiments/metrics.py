@@ -0,0 +1,186 @@
+"""
+Module: experiments/metrics.py
+Description: Acumuladores en flujo de las métricas por paso (media y varianza de Welford) y
+             selección de los pasos registrados, de modo que la memoria no depende del horizonte.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+
+
+def checkpoint_steps(steps: int, every: int = 1, log_points: int = None) -> np.ndarray:
+    """
+    Calcula los pasos de tiempo en los que se registran las métricas. El último paso se
+    registra siempre.
+
+    :param steps: Número de pasos de tiempo.
+    :param every: Registrar uno de cada every pasos.
+    :param log_points: Si se indica, registrar unos log_points pasos espaciados logarítmicamente
+                       (tiene prioridad sobre every).
+    :return: Array ordenado con los índices de los pasos registrados.
+    """
+    assert steps > 0, "El número de pasos debe ser mayor que 0."
+    assert every > 0, "El parámetro every debe ser mayor que 0."
+
+    if log_points is not None:
+        assert log_points > 0, "El número de puntos debe ser mayor que 0."
+        points = np.geomspace(1, steps, log_points).astype(np.int64) - 1
+    else:
+        points = np.arange(every - 1, steps, every, dtype=np.int64)
+
+    return np.union1d(points, [steps - 1])
+
+
+def z_score(confidence: float) -> float:
+    """
+    Cuantil de la normal estándar para un intervalo de confianza bilateral.
+    :param confidence: Nivel de confianza, p.e. 0.95.
+    """
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+class WelfordAccumulator:
+    """
+    Media y varianza en flujo de una métrica en cada paso registrado. Cada ejecución aporta una
+    muestra por paso; las muestras se pueden añadir de una en una (algoritmo de Welford), por
+    lotes en un paso o combinando acumuladores (fórmula de Chan).
+    """
+
+    def __init__(self, n_points):
+        """
+        :param n_points: Número de pasos registrados, o forma (configuraciones, pasos registrados)
+                         para acumular varias configuraciones a la vez.
+        """
+        self.count: np.ndarray = np.zeros(n_points, dtype=np.int64)
+        self.mean: np.ndarray = np.zeros(n_points, dtype=float)
+        self.m2: np.ndarray = np.zeros(n_points, dtype=float)
+
+    def add(self, values: np.ndarray):
+        """
+        Añade una muestra en cada paso registrado (los valores de una ejecución).
+        :param values: Valor de la métrica en cada paso registrado.
+        """
+        self.count += 1
+        delta = values - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (values - self.mean)
+
+    def add_at(self, point: int, samples: np.ndarray):
+        """
+        Añade un lote de muestras en un único paso registrado (p.e. una por ejecución).
+        :param point: Posición del paso registrado.
+        :param samples: Muestras de la métrica en ese paso. Con varias configuraciones, una fila
+                        de muestras por configuración.
+        """
+        n_b = np.shape(samples)[-1]
+        if n_b == 0:
+            return
+        mean_b = np.mean(samples, axis=-1)
+        m2_b = np.sum((samples - mean_b[..., None]) ** 2, axis=-1)
+
+        n_a = self.count[..., point]
+        n = n_a + n_b
+        delta = mean_b - self.mean[..., point]
+        self.mean[..., point] += delta * n_b / n
+        self.m2[..., point] += m2_b + delta ** 2 * n_a * n_b / n
+        self.count[..., point] = n
+
+    def merge(self, other: 'WelfordAccumulator') -> 'WelfordAccumulator':
+        """
+        Combina dos acumuladores de conjuntos disjuntos de ejecuciones.
+        :param other: Acumulador a combinar.
+        :return: Nuevo acumulador con todas las muestras.
+        """
+        merged = WelfordAccumulator(self.mean.shape)
+        merged.count = self.count + other.count
+        n = np.maximum(merged.count, 1)
+        delta = other.mean - self.mean
+        merged.mean = self.mean + delta * other.count / n
+        merged.m2 = self.m2 + other.m2 + delta ** 2 * self.count * other.count / n
+        return merged
+
+    @property
+    def variance(self) -> np.ndarray:
+        """
+        Varianza muestral en cada paso registrado.
+        """
+        return self.m2 / np.maximum(self.count - 1, 1)
+
+    @property
+    def std(self) -> np.ndarray:
+        """
+        Desviación típica muestral en cada paso registrado.
+        """
+        return np.sqrt(self.variance)
+
+    def half_width(self, confidence: float = 0.95) -> np.ndarray:
+        """
+        Semiamplitud del intervalo de confianza (aproximación normal) de la media en cada paso
+        registrado. Es infinita mientras haya menos de dos muestras.
+        :param confidence: Nivel de confianza.
+        """
+        half_width = z_score(confidence) * self.std / np.sqrt(np.maximum(self.count, 1))
+        return np.where(self.count >= 2, half_width, np.inf)
+
+
+@dataclass
+class MetricSeries:
+    """
+    Serie de una métrica por algoritmo en los pasos registrados, con su dispersión entre
+    ejecuciones. Las funciones de plotting la aceptan en lugar de la matriz de medias.
+    """
+    # Índices de los pasos registrados
+    steps: np.ndarray
+    # Media entre ejecuciones (algoritmos x pasos registrados)
+    mean: np.ndarray
+    # Desviación típica entre ejecuciones (algoritmos x pasos registrados)
+    std: np.ndarray
+    # Número de ejecuciones (algoritmos x pasos registrados)
+    count: np.ndarray
+
+    @classmethod
+    def from_accumulators(cls, steps: np.ndarray, accumulators, scale: float = 1.0) -> 'MetricSeries':
+        """
+        Construye la serie a partir de un acumulador por algoritmo.
+        :param steps: Índices de los pasos registrados.
+        :param accumulators: Acumuladores de cada algoritmo (o de cada grupo de configuraciones).
+        :param scale: Factor por el que se multiplican las muestras (p.e. 100 para porcentajes).
+        """
+        n = len(steps)
+
+        def rows(values) -> np.ndarray:
+            # Cada acumulador aporta una fila, o una por configuración si acumula varias
+            return np.concatenate([np.reshape(value, (-1, n)) for value in values] or [np.zeros((0, n))])
+
+        mean = rows(acc.mean * scale for acc in accumulators)
+        std = rows(acc.std * scale for acc in accumulators)
+        count = rows(acc.count for acc in accumulators)
+        return cls(np.asarray(steps), mean, std, count)
+
+    def half_width(self, confidence: float = 0.95) -> np.ndarray:
+        """
+        Semiamplitud del intervalo de confianza (aproximación normal) de la media.
+        :param confidence: Nivel de confianza.
+        :return: Semiamplitud en cada algoritmo y paso registrado.
+        """
+        return z_score(confidence) * self.std / np.sqrt(np.maximum(self.count, 1))
+
+    def __getitem__(self, idx):
+        """
+        Media del algoritmo idx, para poder usar la serie como la matriz de medias.
+        """
+        return self.mean[idx]
+
+    def __len__(self):
+        return len(self.mean)
@@ -0,0 +1,189 @@
+"""
+Module: experiments/profiling.py
+Description: Instrumentación opcional de la simulación: contadores de llamadas e histogramas de
+             latencia (p50/p99) de las tiradas del bandido, de la selección y la actualización de
+             cada algoritmo y de la contabilidad de métricas del motor. Los métodos se sustituyen
+             por versiones cronometradas solo en las instancias instrumentadas y se restauran al
+             terminar, por lo que sin instrumentación el coste es nulo.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from contextlib import contextmanager
+from typing import Dict, List
+import math
+import time
+
+import numpy as np
+
+from algorithms import Algorithm
+from arms import Bandit
+
+
+class LatencyHistogram:
+    """
+    Histograma de latencias con cubetas logarítmicas (BINS_PER_OCTAVE por potencia de 2), de
+    memoria constante con independencia del número de llamadas. Los percentiles se estiman con
+    el centro geométrico de la cubeta, con un error relativo menor del 10%.
+    """
+    BINS_PER_OCTAVE = 4
+    # Cubre hasta 2^48 ns (más de 3 días por llamada)
+    N_BINS = 48 * BINS_PER_OCTAVE
+
+    def __init__(self):
+        self.bins = np.zeros(self.N_BINS, dtype=np.int64)
+        self.count = 0
+        self.total_ns = 0
+
+    def record(self, ns: int):
+        """
+        Registra la duración de una llamada.
+        :param ns: Duración en nanosegundos.
+        """
+        self.bins[min(int(math.log2(ns + 1) * self.BINS_PER_OCTAVE), self.N_BINS - 1)] += 1
+        self.count += 1
+        self.total_ns += ns
+
+    def percentile(self, q: float) -> float:
+        """
+        Estima un percentil de las duraciones registradas.
+        :param q: Percentil, entre 0 y 100.
+        :return: Duración en nanosegundos, o nan si no hay llamadas.
+        """
+        if self.count == 0:
+            return math.nan
+        index = int(np.searchsorted(np.cumsum(self.bins), q / 100 * self.count))
+        return 2 ** ((index + 0.5) / self.BINS_PER_OCTAVE)
+
+    @property
+    def mean(self) -> float:
+        return self.total_ns / self.count if self.count else math.nan
+
+
+class Profiler:
+    """
+    Perfilador de un experimento (run_experiment(..., profile=True)).
+
+    Cada método instrumentado se sustituye, como atributo de la instancia, por una versión que
+    mide la duración de cada llamada. Las clases no se modifican, por lo que las instancias no
+    instrumentadas no pagan ningún coste, y restore() deja las instancias como estaban.
+
+    Con el backend 'parallel' las tiradas y los algoritmos se ejecutan en otros procesos y solo
+    se mide la contabilidad del proceso principal.
+    """
+    # Métodos instrumentados de bandidos, algoritmos (escalares y por lotes) y acumuladores
+    BANDIT_METHODS = ('pull_arm', 'pull_arm_many', 'pull_arm_total', 'pull_arms')
+    ALGORITHM_METHODS = ('select_arm', 'update', 'update_epoch', 'select_arms', 'update_batch')
+    ACCUMULATOR_METHODS = ('add', 'add_at')
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        # Etiqueta de cada algoritmo instrumentado, por identidad
+        self.labels: Dict[int, str] = {}
+        # Métodos sustituidos: (instancia, nombre, atributo previo de la instancia o None)
+        self.patched: List[tuple] = []
+        self.wall_ns = 0
+
+    def histogram(self, key: str) -> LatencyHistogram:
+        if key not in self.histograms:
+            self.histograms[key] = LatencyHistogram()
+        return self.histograms[key]
+
+    def wrap(self, obj, method: str, key: str):
+        """
+        Sustituye un método de una instancia por una versión cronometrada.
+        :param obj: Instancia.
+        :param method: Nombre del método.
+        :param key: Nombre del histograma en el que se registran las llamadas.
+        """
+        original = getattr(obj, method)
+        record = self.histogram(key).record
+        clock = time.perf_counter_ns
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                record(clock() - start)
+
+        self.patched.append((obj, method, obj.__dict__.get(method)))
+        setattr(obj, method, timed)
+
+    def instrument(self, bandit: Bandit, algorithms: List[Algorithm]):
+        """
+        Instrumenta el bandido y los algoritmos de un experimento.
+        """
+        from plotting.plotting import get_algorithm_label  # Evita cargar matplotlib al importar el módulo
+
+        for method in self.BANDIT_METHODS:
+            if hasattr(bandit, method):
+                self.wrap(bandit, method, f"bandit.{method}")
+        for i, algo in enumerate(algorithms):
+            self.labels[id(algo)] = f"[{i}] {get_algorithm_label(algo)}"
+            self.instrument_algorithm(algo)
+
+    def instrument_algorithm(self, algo, source: Algorithm = None):
+        """
+        Instrumenta un algoritmo. Los backends instrumentan así la versión por lotes (algo) de un
+        algoritmo del experimento (source), cuyas medidas se registran con la etiqueta de éste.
+        """
+        label = self.labels.get(id(source if source is not None else algo), type(algo).__name__)
+        for method in self.ALGORITHM_METHODS:
+            if hasattr(algo, method):
+                self.wrap(algo, method, f"{label}.{method}")
+
+    def instrument_totals(self, totals):
+        """
+        Instrumenta los acumuladores de métricas (AlgorithmTotals) que rellena un backend.
+        """
+        for metric in ('rewards', 'optimal_selections', 'regret'):
+            accumulator = getattr(totals, metric)
+            for method in self.ACCUMULATOR_METHODS:
+                self.wrap(accumulator, method, f"engine.metrics.{method}")
+
+    @contextmanager
+    def section(self, key: str):
+        """
+        Mide la duración de un bloque de código.
+        :param key: Nombre del histograma en el que se registra.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.histogram(key).record(time.perf_counter_ns() - start)
+
+    def restore(self):
+        """
+        Deshace la instrumentación de todas las instancias, en orden inverso.
+        """
+        for obj, method, previous in reversed(self.patched):
+            if previous is None:
+                delattr(obj, method)
+            else:
+                setattr(obj, method, previous)
+        self.patched = []
+
+    def report(self) -> str:
+        """
+        Resumen de las medidas: llamadas, tiempo total, porcentaje del tiempo del experimento,
+        media, p50 y p99 de cada método instrumentado que se ha llamado, de mayor a menor tiempo total.
+        """
+        lines = [f"{'':50s} {'llamadas':>10s} {'total (ms)':>11s} {'%':>6s} "
+                 f"{'media (µs)':>11s} {'p50 (µs)':>9s} {'p99 (µs)':>9s}"]
+        measured = [(key, hist) for key, hist in self.histograms.items() if hist.count]
+        for key, hist in sorted(measured, key=lambda item: -item[1].total_ns):
+            share = 100 * hist.total_ns / self.wall_ns if self.wall_ns else math.nan
+            lines.append(f"{key[:50]:50s} {hist.count:>10d} {hist.total_ns / 1e6:>11.1f} {share:>6.1f} "
+                         f"{hist.mean / 1e3:>11.2f} {hist.percentile(50) / 1e3:>9.2f} "
+                         f"{hist.percentile(99) / 1e3:>9.2f}")
+        lines.append(f"Tiempo total del experimento: {self.wall_ns / 1e9:.3f} s")
+        return '\n'.join(lines)
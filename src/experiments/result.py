@@ -0,0 +1,168 @@
+"""
+Module: experiments/result.py
+Description: Contiene las estructuras de datos con los resultados de un experimento.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from dataclasses import dataclass
+from typing import List, Dict, Optional
+
+import numpy as np
+
+from algorithms import Algorithm
+from experiments.metrics import WelfordAccumulator, MetricSeries
+from experiments.profiling import Profiler
+from experiments.trajectories import TrajectoryStore
+
+
+@dataclass
+class AlgorithmTotals:
+    """
+    Acumulados parciales, sobre un conjunto de ejecuciones, de las métricas de un algoritmo.
+    """
+    # Número de ejecuciones acumuladas
+    runs: int
+    # Pasos de tiempo registrados
+    checkpoints: np.ndarray
+    # Recompensa obtenida en cada paso registrado
+    rewards: WelfordAccumulator
+    # Elección del brazo óptimo (0 o 1) en cada paso registrado
+    optimal_selections: WelfordAccumulator
+    # Regret acumulado en cada paso registrado
+    regret: WelfordAccumulator
+    # Suma de las recompensas obtenidas con cada brazo
+    arm_rewards: np.ndarray
+    # Número de veces que se ha elegido cada brazo
+    arm_selections: np.ndarray
+    # Regret acumulado al final de cada ejecución, en el orden de las ejecuciones
+    final_regret: np.ndarray = None
+
+    @classmethod
+    def zeros(cls, checkpoints: np.ndarray, k: int) -> 'AlgorithmTotals':
+        """
+        Crea unos acumulados parciales vacíos.
+        :param checkpoints: Pasos de tiempo registrados.
+        :param k: Número de brazos.
+        """
+        n_points = len(checkpoints)
+        return cls(0, checkpoints, WelfordAccumulator(n_points), WelfordAccumulator(n_points),
+                   WelfordAccumulator(n_points), np.zeros(k), np.zeros(k), np.zeros(0))
+
+    def __add__(self, other: 'AlgorithmTotals') -> 'AlgorithmTotals':
+        """
+        Combina los acumulados parciales de dos conjuntos disjuntos de ejecuciones.
+        """
+        return AlgorithmTotals(self.runs + other.runs,
+                               self.checkpoints,
+                               self.rewards.merge(other.rewards),
+                               self.optimal_selections.merge(other.optimal_selections),
+                               self.regret.merge(other.regret),
+                               self.arm_rewards + other.arm_rewards,
+                               self.arm_selections + other.arm_selections,
+                               np.concatenate([self.final_regret, other.final_regret]))
+
+
+def variance_reduction(final_regret: np.ndarray) -> np.ndarray:
+    """
+    Calcula, para cada pareja de algoritmos, el cociente entre la varianza que tendría la
+    diferencia de su regret final si las ejecuciones fuesen independientes (suma de varianzas)
+    y la varianza observada de la diferencia entre ejecuciones emparejadas.
+
+    Con números aleatorios comunes el cociente es mayor que 1 e indica por cuánto se divide el
+    número de ejecuciones necesario para comparar los dos algoritmos con la misma confianza.
+    Sin ellos es aproximadamente 1.
+
+    :param final_regret: Regret final de cada algoritmo en cada ejecución (algoritmos x ejecuciones).
+    :return: Matriz simétrica (algoritmos x algoritmos) con 1 en la diagonal.
+    """
+    n = len(final_regret)
+    reduction = np.ones((n, n))
+    if final_regret.shape[1] < 2:
+        return reduction
+
+    variances = np.var(final_regret, axis=1, ddof=1)
+    for i in range(n):
+        for j in range(i + 1, n):
+            paired = np.var(final_regret[i] - final_regret[j], ddof=1)
+            independent = variances[i] + variances[j]
+            reduction[i, j] = reduction[j, i] = independent / paired if paired > 0 else np.inf
+    return reduction
+
+
+@dataclass
+class ExperimentResult:
+    """
+    Resultado de un experimento: métricas promedio por algoritmo en los pasos registrados.
+
+    Se puede desempaquetar como la tupla que devolvía run_experiment en los notebooks:
+    rewards, optimal_selections, regret_accumulated, arm_stats = result
+    """
+    # Algoritmos comparados
+    algorithms: List[Algorithm]
+    # Número de pasos de tiempo
+    steps: int
+    # Número de ejecuciones (las usadas realmente en el modo adaptativo)
+    runs: int
+    # Índice del brazo óptimo
+    optimal_arm: int
+    # Pasos de tiempo registrados (todos, por defecto)
+    checkpoints: np.ndarray
+    # Recompensa promedio (algoritmos x pasos registrados)
+    rewards: np.ndarray
+    # Porcentaje de selecciones del brazo óptimo (algoritmos x pasos registrados)
+    optimal_selections: np.ndarray
+    # Regret acumulado promedio (algoritmos x pasos registrados)
+    regret_accumulated: np.ndarray
+    # Ganancia y número de selecciones promedio de cada brazo por algoritmo
+    arm_stats: List[Dict[str, np.ndarray]]
+    # Series con media y desviación típica de cada métrica, por nombre
+    series: Dict[str, MetricSeries]
+    # Regret acumulado al final de cada ejecución (algoritmos x ejecuciones)
+    final_regret: np.ndarray
+    # Reducción de varianza de la diferencia de regret final entre cada pareja de algoritmos
+    # (algoritmos x algoritmos), ver variance_reduction
+    variance_reduction: np.ndarray
+    # Almacén con las trayectorias de cada ejecución, si se han guardado
+    trajectories: Optional[TrajectoryStore] = None
+    # Perfilador con los contadores y latencias del experimento, si se ha perfilado
+    profile: Optional[Profiler] = None
+
+    @classmethod
+    def from_totals(cls, algorithms: List[Algorithm], totals: List[AlgorithmTotals],
+                    steps: int, optimal_arm: int) -> 'ExperimentResult':
+        """
+        Construye el resultado a partir de los acumulados de cada algoritmo.
+        :param algorithms: Algoritmos comparados.
+        :param totals: Acumulados de cada algoritmo sobre todas las ejecuciones.
+        :param steps: Número de pasos de tiempo.
+        :param optimal_arm: Índice del brazo óptimo.
+        """
+        runs = totals[0].runs if totals else 0
+        checkpoints = totals[0].checkpoints if totals else np.zeros(0, dtype=np.int64)
+
+        series = {
+            'rewards': MetricSeries.from_accumulators(checkpoints, [total.rewards for total in totals]),
+            'optimal_selections': MetricSeries.from_accumulators(
+                checkpoints, [total.optimal_selections for total in totals], scale=100),
+            'regret_accumulated': MetricSeries.from_accumulators(checkpoints, [total.regret for total in totals]),
+        }
+        arm_stats = [{'mean_rewards': total.arm_rewards / total.runs,
+                      'selections': total.arm_selections / total.runs} for total in totals]
+
+        final_regret = np.array([total.final_regret for total in totals]).reshape(len(totals), -1)
+
+        return cls(algorithms, steps, runs, optimal_arm, checkpoints,
+                   series['rewards'].mean, series['optimal_selections'].mean,
+                   series['regret_accumulated'].mean, arm_stats, series,
+                   final_regret, variance_reduction(final_regret))
+
+    def __iter__(self):
+        return iter((self.rewards, self.optimal_selections, self.regret_accumulated, self.arm_stats))
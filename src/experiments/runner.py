@@ -0,0 +1,238 @@
+"""
+Module: experiments/runner.py
+Description: Ejecución de un experimento descrito en un fichero de configuración JSON o TOML, sin
+             notebooks ni dependencias interactivas: construye el bandido y los algoritmos, ejecuta
+             run_experiment mostrando el progreso y guarda los resultados y las gráficas en un
+             directorio de salida (ver experiments/__main__.py).
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import List
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+import algorithms as algorithms_package
+import arms as arms_package
+from algorithms import Algorithm
+from arms import Arm, Bandit, NonStationaryBandit
+from experiments.engine import run_experiment
+from experiments.result import ExperimentResult
+
+# Parámetros de run_experiment que se pueden indicar en la configuración, además de bandit y algorithms
+EXPERIMENT_OPTIONS = ('steps', 'runs', 'seed', 'backend', 'n_workers', 'record_every', 'log_points',
+                      'trajectories', 'checkpoint', 'batch_runs', 'resume', 'common_random_numbers',
+                      'regret_tolerance', 'optimal_tolerance', 'confidence', 'profile')
+
+
+def load_config(path: str) -> dict:
+    """
+    Carga la configuración de un experimento. Ejemplo en TOML:
+
+        steps = 2000
+        runs = 500
+        seed = 42
+        backend = "vectorized"
+
+        [bandit]
+        arms = "ArmBernoulli"       # ArmNormal, ArmBernoulli, ArmBinomial, ArmNormalDrift o ArmBernoulliPiecewise
+        k = 10                      # El resto de claves se pasan a generate_arms
+
+        [[algorithms]]
+        class = "UCB1"              # El resto de claves son los parámetros del algoritmo
+        c = 0.1
+
+    :param path: Ruta del fichero (.json o .toml).
+    :return: Configuración.
+    :raises ValueError: Si la extensión no es .json ni .toml o falta alguna clave obligatoria.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.json':
+        with open(path) as f:
+            config = json.load(f)
+    elif extension == '.toml':
+        import tomllib
+
+        with open(path, 'rb') as f:
+            config = tomllib.load(f)
+    else:
+        raise ValueError(f"Formato de configuración desconocido: {extension}. Opciones: .json, .toml.")
+
+    for key in ('steps', 'runs', 'bandit', 'algorithms'):
+        if key not in config:
+            raise ValueError(f"Falta la clave obligatoria '{key}' en la configuración.")
+    unknown = set(config) - set(EXPERIMENT_OPTIONS) - {'bandit', 'algorithms', 'output'}
+    if unknown:
+        raise ValueError(f"Claves desconocidas en la configuración: {', '.join(sorted(unknown))}.")
+    return config
+
+
+def build_bandit(config: dict) -> Bandit:
+    """
+    Construye el bandido de la configuración con generate_arms. Como en los notebooks, los brazos
+    se generan con el estado global de np.random tras fijar la semilla del experimento. Con brazos
+    no estacionarios (ArmNormalDrift, ArmBernoulliPiecewise) el bandido es un NonStationaryBandit.
+    :raises ValueError: Si la clase de los brazos no existe.
+    """
+    params = dict(config['bandit'])
+    name = params.pop('arms')
+    k = params.pop('k')
+    arm_class = getattr(arms_package, name, None) if name in arms_package.__all__ else None
+    if not isinstance(arm_class, type) or not issubclass(arm_class, Arm) or arm_class is Arm:
+        raise ValueError(f"Clase de brazos desconocida: {name}.")
+
+    if config.get('seed') is not None:
+        np.random.seed(config['seed'])  # Fijar la semilla para reproducibilidad
+    # Los brazos no estacionarios necesitan el reloj de NonStationaryBandit
+    bandit_class = NonStationaryBandit if hasattr(arm_class, 'set_time') else Bandit
+    return bandit_class(arms=arm_class.generate_arms(k, **params))
+
+
+def build_algorithms(config: dict, k: int) -> List[Algorithm]:
+    """
+    Construye los algoritmos de la configuración.
+    :param k: Número de brazos.
+    :raises ValueError: Si alguna clase de algoritmo no existe.
+    """
+    algorithms = []
+    for spec in config['algorithms']:
+        params = dict(spec)
+        name = params.pop('class')
+        algo_class = getattr(algorithms_package, name, None) if name in algorithms_package.__all__ else None
+        if not isinstance(algo_class, type) or not issubclass(algo_class, Algorithm) or algo_class is Algorithm:
+            raise ValueError(f"Algoritmo desconocido: {name}.")
+        algorithms.append(algo_class(k=k, **params))
+    return algorithms
+
+
+class ProgressReport:
+    """
+    Muestra en una línea de stderr el progreso del experimento, los pasos simulados por segundo y
+    el tiempo restante estimado. Se usa como función de progreso de run_experiment.
+    """
+
+    def __init__(self, total_runs: int, steps: int, stream=sys.stderr):
+        """
+        :param total_runs: Número total de ejecuciones (ejecuciones x algoritmos).
+        :param steps: Número de pasos de cada ejecución.
+        :param stream: Fichero en el que escribir.
+        """
+        self.total_runs = total_runs
+        self.steps = steps
+        self.stream = stream
+        self.done = 0
+        self.start = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    @property
+    def throughput(self) -> float:
+        """
+        Pasos simulados por segundo (pasos x ejecuciones x algoritmos).
+        """
+        return self.done * self.steps / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __call__(self, runs: int):
+        self.done += runs
+        fraction = self.done / self.total_runs
+        remaining = self.elapsed * (1 - fraction) / fraction if fraction > 0 else float('inf')
+        self.stream.write(f"\r[{100 * fraction:5.1f}%] {self.done}/{self.total_runs} ejecuciones  "
+                          f"{self.throughput:,.0f} pasos/s  quedan {remaining:.0f} s ")
+        self.stream.flush()
+
+    def close(self):
+        self.stream.write("\n")
+        self.stream.flush()
+
+
+def save_results(result: ExperimentResult, labels: List[str], output_dir: str, summary: dict):
+    """
+    Guarda los resultados de un experimento:
+
+    - results.npz: pasos registrados, media y desviación típica de cada métrica (algoritmos x pasos),
+      regret final de cada ejecución y estadísticas de cada brazo.
+    - summary.json: resumen por algoritmo (regret final, porcentaje de selecciones óptimas y
+      recompensa promedio en el último paso, con la semiamplitud de su intervalo de confianza).
+    """
+    arrays = {'checkpoints': result.checkpoints, 'final_regret': result.final_regret,
+              'arm_mean_rewards': np.array([stats['mean_rewards'] for stats in result.arm_stats]),
+              'arm_selections': np.array([stats['selections'] for stats in result.arm_stats]),
+              'variance_reduction': result.variance_reduction}
+    for name, series in result.series.items():
+        arrays[f'{name}_mean'] = series.mean
+        arrays[f'{name}_std'] = series.std
+    np.savez(os.path.join(output_dir, 'results.npz'), **arrays)
+
+    summary['algorithms'] = {
+        label: {name: {'mean': float(series.mean[i, -1]), 'half_width': float(series.half_width()[i, -1])}
+                for name, series in result.series.items()}
+        for i, label in enumerate(labels)
+    }
+    with open(os.path.join(output_dir, 'summary.json'), 'w') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+
+
+def save_figures(result: ExperimentResult, algorithms: List[Algorithm], k: int, output_dir: str) -> List[str]:
+    """
+    Guarda las gráficas del experimento en output_dir con el backend no interactivo de matplotlib.
+    :return: Rutas de las figuras.
+    """
+    from plotting import (set_render_mode, plot_average_rewards, plot_optimal_selections, plot_regret,
+                          plot_arm_statistics)
+
+    set_render_mode(output_dir)
+    return [plot_average_rewards(result.steps, result.series['rewards'], algorithms),
+            plot_optimal_selections(result.steps, result.series['optimal_selections'], algorithms),
+            plot_regret(result.steps, result.series['regret_accumulated'], algorithms),
+            plot_arm_statistics(result.arm_stats, algorithms, k, result.optimal_arm)]
+
+
+def run_config(config: dict, output_dir: str, figures: bool = True, progress: bool = True) -> ExperimentResult:
+    """
+    Ejecuta el experimento de una configuración y guarda en output_dir la configuración usada
+    (config.json), los resultados (ver save_results) y, si figures es True, las gráficas.
+
+    :param config: Configuración (ver load_config).
+    :param output_dir: Directorio de salida. Se crea si no existe.
+    :param figures: Si es True, se guardan las gráficas en output_dir/figures.
+    :param progress: Si es True, se muestra el progreso en stderr.
+    :return: Resultado del experimento.
+    """
+    from plotting.plotting import get_algorithm_label
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, 'config.json'), 'w') as f:
+        json.dump(config, f, indent=2, ensure_ascii=False)
+
+    bandit = build_bandit(config)
+    algorithms = build_algorithms(config, bandit.k)
+    options = {name: config[name] for name in EXPERIMENT_OPTIONS if name in config}
+
+    report = ProgressReport(options['runs'] * len(algorithms), options['steps']) if progress else None
+    start = time.perf_counter()
+    result = run_experiment(bandit, algorithms, progress=report, **options)
+    elapsed = time.perf_counter() - start
+    if report is not None:
+        report.close()
+
+    labels = [get_algorithm_label(algo) for algo in algorithms]
+    summary = {'bandit': str(bandit), 'optimal_arm': int(bandit.optimal_arm), 'runs': result.runs,
+               'elapsed_seconds': elapsed,
+               'steps_per_second': result.steps * result.runs * len(algorithms) / elapsed}
+    save_results(result, labels, output_dir, summary)
+    if figures:
+        save_figures(result, algorithms, bandit.k, os.path.join(output_dir, 'figures'))
+    return result
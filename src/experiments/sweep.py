@@ -0,0 +1,192 @@
+"""
+Module: experiments/sweep.py
+Description: Barrido de hiperparámetros. Todas las configuraciones de una rejilla se simulan a la
+             vez con las versiones por lotes de los algoritmos, añadiendo un eje de configuración a
+             sus matrices de estado (configuraciones x ejecuciones, brazos).
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from dataclasses import dataclass
+from itertools import product
+from typing import List, Dict, Sequence
+import re
+
+import numpy as np
+
+from algorithms import Algorithm, BatchedAlgorithm
+from arms import Bandit
+from experiments.metrics import checkpoint_steps, WelfordAccumulator, MetricSeries
+
+
+def expand_grid(grid: Dict[type, Dict[str, Sequence]], k: int) -> List[Algorithm]:
+    """
+    Crea una instancia de algoritmo por cada combinación de parámetros de la rejilla.
+
+    :param grid: Rejilla por clase de algoritmo, p.e. {UCB1: {'c': [0.1, 1]}, Softmax: {'tau': [0.1, 1]}}.
+                 Un valor escalar equivale a una lista de un elemento.
+    :param k: Número de brazos.
+    :return: Lista de algoritmos, agrupados por clase en el orden de la rejilla.
+    """
+    algorithms = []
+    for algo_class, params in grid.items():
+        names = list(params)
+        values = [params[name] if isinstance(params[name], (list, tuple, np.ndarray)) else [params[name]]
+                  for name in names]
+        for combination in product(*values):
+            algorithms.append(algo_class(k, **dict(zip(names, combination))))
+    return algorithms
+
+
+@dataclass
+class SweepResult:
+    """
+    Resultado de un barrido: métricas de cada configuración (configuraciones x pasos registrados).
+    Cada configuración se identifica por su etiqueta (get_algorithm_label).
+    """
+    # Configuraciones simuladas, como instancias de algoritmo
+    algorithms: List[Algorithm]
+    # Etiqueta de cada configuración
+    labels: List[str]
+    # Número de pasos de tiempo
+    steps: int
+    # Número de ejecuciones por configuración
+    runs: int
+    # Índice del brazo óptimo
+    optimal_arm: int
+    # Pasos de tiempo registrados
+    checkpoints: np.ndarray
+    # Series con media y desviación típica de cada métrica, por nombre
+    series: Dict[str, MetricSeries]
+    # Ganancia y número de selecciones promedio de cada brazo (configuraciones x brazos)
+    arm_rewards: np.ndarray
+    arm_selections: np.ndarray
+
+    @property
+    def rewards(self) -> np.ndarray:
+        return self.series['rewards'].mean
+
+    @property
+    def optimal_selections(self) -> np.ndarray:
+        return self.series['optimal_selections'].mean
+
+    @property
+    def regret_accumulated(self) -> np.ndarray:
+        return self.series['regret_accumulated'].mean
+
+    def index(self, label: str) -> int:
+        """
+        Índice de la configuración con la etiqueta indicada.
+        :raises ValueError: Si no existe.
+        """
+        return self.labels.index(label)
+
+    def select(self, pattern: str = None, algo_class: type = None) -> 'SweepResult':
+        """
+        Selecciona un subconjunto de configuraciones.
+        :param pattern: Expresión regular que deben contener sus etiquetas, p.e. 'UCB1' o 'c=0.1'.
+        :param algo_class: Clase de algoritmo de las configuraciones.
+        :return: Resultado con las configuraciones seleccionadas, en el mismo orden.
+        """
+        indices = [i for i, (algo, label) in enumerate(zip(self.algorithms, self.labels))
+                   if (pattern is None or re.search(pattern, label))
+                   and (algo_class is None or type(algo) is algo_class)]
+
+        series = {name: MetricSeries(s.steps, s.mean[indices], s.std[indices], s.count[indices])
+                  for name, s in self.series.items()}
+        return SweepResult([self.algorithms[i] for i in indices], [self.labels[i] for i in indices],
+                           self.steps, self.runs, self.optimal_arm, self.checkpoints, series,
+                           self.arm_rewards[indices], self.arm_selections[indices])
+
+
+def run_sweep(bandit: Bandit, grid: Dict[type, Dict[str, Sequence]], steps: int, runs: int,
+              seed: int = None, record_every: int = 1, log_points: int = None) -> SweepResult:
+    """
+    Simula runs ejecuciones de steps pasos de todas las configuraciones de la rejilla a la vez.
+
+    Las configuraciones de cada clase se simulan con un único algoritmo por lotes cuyos parámetros
+    tienen un valor por fila (configuración x ejecución), y las recompensas de todas las clases se
+    obtienen con una sola llamada al bandido por paso, de modo que el coste de interpretación de
+    cada paso se paga una vez para toda la rejilla.
+
+    :param bandit: Bandido sobre el que se experimenta.
+    :param grid: Rejilla de parámetros por clase de algoritmo (ver expand_grid).
+    :param steps: Número de pasos de tiempo de cada ejecución.
+    :param runs: Número de ejecuciones de cada configuración.
+    :param seed: Semilla para la reproducibilidad de los resultados. None para no fijarla.
+    :param record_every: Registrar las métricas uno de cada record_every pasos.
+    :param log_points: Si se indica, registrar unos log_points pasos espaciados logarítmicamente.
+    :return: Resultado del barrido.
+    :raises ValueError: Si el bandido no es estacionario.
+    """
+    from plotting.plotting import get_algorithm_label  # Evita cargar matplotlib al importar el módulo
+
+    assert steps > 0, "El número de pasos debe ser mayor que 0."
+    assert runs > 0, "El número de ejecuciones debe ser mayor que 0."
+    if not bandit.stationary:
+        # Todas las filas compartirían el camino de los brazos de la primera ejecución
+        raise ValueError("El barrido no admite bandidos no estacionarios; usar run_experiment.")
+
+    if seed is not None:
+        np.random.seed(seed)  # Asegurar reproducibilidad de resultados.
+
+    algorithms = expand_grid(grid, bandit.k)
+    checkpoints = checkpoint_steps(steps, record_every, log_points)
+    optimal_arm = bandit.optimal_arm
+    optimal_reward = bandit.get_expected_value(optimal_arm)
+
+    # Un algoritmo por lotes por clase, con cada parámetro repetido runs veces por configuración
+    groups = []
+    start = 0
+    for algo_class in grid:
+        configs = [algo for algo in algorithms if type(algo) is algo_class]
+        rows = len(configs) * runs
+        batched = BatchedAlgorithm.from_algorithm(configs[0], rows)
+        for name in grid[algo_class]:
+            setattr(batched, name, batched.per_run(np.repeat([getattr(algo, name) for algo in configs], runs)))
+        shape = (len(configs), len(checkpoints))
+        groups.append((batched, slice(start, start + rows), len(configs),
+                       WelfordAccumulator(shape), WelfordAccumulator(shape), WelfordAccumulator(shape)))
+        start += rows
+
+    total_rewards = np.zeros(start)
+    point = 0  # Siguiente paso registrado
+    bandit.start_runs(0, start)
+
+    for step in range(steps):
+        chosen_arms = np.concatenate([group[0].select_arms(step) for group in groups])
+        rewards = bandit.pull_arms(chosen_arms)
+        total_rewards += rewards
+
+        for batched, rows, n_configs, acc_rewards, acc_optimal, acc_regret in groups:
+            batched.update_batch(chosen_arms[rows], rewards[rows])
+
+            if step == checkpoints[point]:
+                acc_rewards.add_at(point, rewards[rows].reshape(n_configs, runs))
+                acc_optimal.add_at(point, (chosen_arms[rows] == optimal_arm).reshape(n_configs, runs))
+                acc_regret.add_at(point, ((step + 1) * optimal_reward - total_rewards[rows]).reshape(n_configs, runs))
+
+        if step == checkpoints[point]:
+            point += 1
+
+    series = {
+        'rewards': MetricSeries.from_accumulators(checkpoints, [group[3] for group in groups]),
+        'optimal_selections': MetricSeries.from_accumulators(checkpoints, [group[4] for group in groups], scale=100),
+        'regret_accumulated': MetricSeries.from_accumulators(checkpoints, [group[5] for group in groups]),
+    }
+
+    # La ganancia de cada brazo se obtiene de los conteos y los promedios estimados
+    arm_rewards = np.concatenate([np.sum((batched.counts * batched.values).reshape(n_configs, runs, -1), axis=1)
+                                  for batched, _, n_configs, *_ in groups]) / runs
+    arm_selections = np.concatenate([np.sum(batched.counts.reshape(n_configs, runs, -1), axis=1)
+                                     for batched, _, n_configs, *_ in groups]) / runs
+
+    return SweepResult(algorithms, [get_algorithm_label(algo) for algo in algorithms], steps, runs,
+                       optimal_arm, checkpoints, series, arm_rewards, arm_selections)
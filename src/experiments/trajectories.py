@@ -0,0 +1,246 @@
+"""
+Module: experiments/trajectories.py
+Description: Almacenamiento en disco (np.memmap) de las trayectorias de cada ejecución: brazo
+             elegido y recompensa obtenida en cada paso, con una cabecera JSON que describe el
+             bandido y los algoritmos. Se lee por fragmentos sin cargar el fichero completo.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import List, Iterator, Tuple
+import json
+import os
+
+import numpy as np
+
+from algorithms import Algorithm
+from arms import Arm, Bandit
+
+
+def arm_parameters(arm: Arm) -> dict:
+    """
+    Describe un brazo con su clase y sus parámetros numéricos públicos.
+    :param arm: Brazo a describir.
+    :return: Diccionario serializable en JSON.
+    """
+    params = {name: value.item() if isinstance(value, np.generic) else value
+              for name, value in vars(arm).items()
+              if not name.startswith('_') and name != 'block_size'
+              and isinstance(value, (int, float, np.number))}
+    return {'class': type(arm).__name__, 'params': params, 'expected_value': float(arm.get_expected_value())}
+
+
+class TrajectoryStore:
+    """
+    Trayectorias de un experimento guardadas en un directorio:
+
+    - header.json: descripción del bandido, de los algoritmos y de las dimensiones.
+    - arms.dat: brazo elegido (int16, o int32 si hay más de 32767 brazos), forma (algoritmos, runs, steps).
+    - rewards.dat: recompensa obtenida (float32), misma forma.
+    - optimal.dat: solo con bandidos no estacionarios, recompensa esperada del brazo óptimo de cada
+      paso (float32), misma forma, para calcular el regret dinámico.
+
+    Los ficheros se escriben a medida que avanza la simulación y el objeto solo guarda la ruta
+    y la cabecera, por lo que se puede enviar a otros procesos (backend 'parallel').
+    """
+    HEADER = 'header.json'
+    ARMS = 'arms.dat'
+    REWARDS = 'rewards.dat'
+    OPTIMAL = 'optimal.dat'
+
+    def __init__(self, path: str, header: dict):
+        """
+        :param path: Directorio del almacén.
+        :param header: Cabecera con la descripción del experimento.
+        """
+        self.path = path
+        self.header = header
+        self.shape = (len(header['algorithms']), header['runs'], header['steps'])
+        self.arm_dtype = np.dtype(header['arm_dtype'])
+
+    @classmethod
+    def create(cls, path: str, bandit: Bandit, algorithms: List[Algorithm],
+               steps: int, runs: int) -> 'TrajectoryStore':
+        """
+        Crea un almacén vacío (los ficheros se reservan sin ocupar memoria).
+        :param path: Directorio del almacén. Se crea si no existe.
+        :param bandit: Bandido del experimento.
+        :param algorithms: Algoritmos del experimento.
+        :param steps: Número de pasos de tiempo de cada ejecución.
+        :param runs: Número de ejecuciones.
+        :return: Almacén abierto para escritura.
+        """
+        from plotting.plotting import get_algorithm_label  # Evita cargar matplotlib al importar el módulo
+
+        os.makedirs(path, exist_ok=True)
+        optimal_arm = int(bandit.optimal_arm)
+        header = {
+            'steps': steps,
+            'runs': runs,
+            'k': bandit.k,
+            'arm_dtype': 'int16' if bandit.k <= np.iinfo(np.int16).max else 'int32',
+            'reward_dtype': 'float32',
+            'optimal_arm': optimal_arm,
+            # En el paso 0 con bandidos no estacionarios (ver optimal.dat)
+            'optimal_reward': float(bandit.expected_rewards[optimal_arm]),
+            'dynamic': not bandit.stationary,
+            'arms': [arm_parameters(arm) for arm in bandit.arms],
+            'algorithms': [get_algorithm_label(algo) for algo in algorithms],
+        }
+        with open(os.path.join(path, cls.HEADER), 'w') as f:
+            json.dump(header, f, indent=2, ensure_ascii=False)
+
+        store = cls(path, header)
+        # Reserva de los ficheros con su tamaño final
+        np.memmap(store.file(cls.ARMS), dtype=store.arm_dtype, mode='w+', shape=store.shape).flush()
+        np.memmap(store.file(cls.REWARDS), dtype=np.float32, mode='w+', shape=store.shape).flush()
+        if store.dynamic:
+            np.memmap(store.file(cls.OPTIMAL), dtype=np.float32, mode='w+', shape=store.shape).flush()
+        return store
+
+    @classmethod
+    def open(cls, path: str) -> 'TrajectoryStore':
+        """
+        Abre un almacén existente.
+        :param path: Directorio del almacén.
+        """
+        with open(os.path.join(path, cls.HEADER)) as f:
+            return cls(path, json.load(f))
+
+    def file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def arms(self, mode: str = 'r') -> np.memmap:
+        """
+        Brazos elegidos (algoritmos x runs x steps) proyectados en memoria.
+        """
+        return np.memmap(self.file(self.ARMS), dtype=self.arm_dtype, mode=mode, shape=self.shape)
+
+    def rewards(self, mode: str = 'r') -> np.memmap:
+        """
+        Recompensas obtenidas (algoritmos x runs x steps) proyectadas en memoria.
+        """
+        return np.memmap(self.file(self.REWARDS), dtype=np.float32, mode=mode, shape=self.shape)
+
+    def optimal(self, mode: str = 'r') -> np.memmap:
+        """
+        Recompensa esperada del brazo óptimo de cada paso (algoritmos x runs x steps) proyectada en
+        memoria. Solo existe con bandidos no estacionarios.
+        """
+        return np.memmap(self.file(self.OPTIMAL), dtype=np.float32, mode=mode, shape=self.shape)
+
+    @property
+    def dynamic(self) -> bool:
+        """
+        Si el bandido no es estacionario y el regret es dinámico.
+        """
+        return self.header.get('dynamic', False)
+
+    @property
+    def runs(self) -> int:
+        """
+        Número de ejecuciones guardadas (puede ser menor que las reservadas en el modo adaptativo).
+        """
+        return self.header.get('runs_used', self.header['runs'])
+
+    def set_runs_used(self, runs: int):
+        """
+        Registra en la cabecera el número de ejecuciones guardadas realmente.
+        :param runs: Número de ejecuciones.
+        """
+        self.header['runs_used'] = runs
+        with open(self.file(self.HEADER), 'w') as f:
+            json.dump(self.header, f, indent=2, ensure_ascii=False)
+
+    def writer(self, algo_idx: int, run_offset: int = 0) -> 'TrajectoryWriter':
+        """
+        Crea el escritor de las trayectorias de un algoritmo.
+        :param algo_idx: Índice del algoritmo.
+        :param run_offset: Índice de la primera ejecución que se escribe (fragmentos en paralelo).
+        """
+        return TrajectoryWriter(self, algo_idx, run_offset)
+
+    def iter_chunks(self, algo_idx: int, chunk_runs: int = 256) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """
+        Recorre las trayectorias de un algoritmo por bloques de ejecuciones.
+        :param algo_idx: Índice del algoritmo.
+        :param chunk_runs: Número de ejecuciones de cada bloque.
+        :return: Iterador de (primera ejecución, brazos, recompensas) con forma (ejecuciones x steps).
+        """
+        arms, rewards = self.arms(), self.rewards()
+        for start in range(0, self.runs, chunk_runs):
+            stop = min(start + chunk_runs, self.runs)
+            yield start, np.array(arms[algo_idx, start:stop]), np.array(rewards[algo_idx, start:stop])
+
+    def regret_distribution(self, algo_idx: int, step: int = None, chunk_runs: int = 256) -> np.ndarray:
+        """
+        Regret acumulado de cada ejecución en un paso, calculado por bloques. Con bandidos no
+        estacionarios es el regret dinámico, respecto al brazo óptimo de cada paso.
+        :param algo_idx: Índice del algoritmo.
+        :param step: Paso de tiempo. Por defecto el último.
+        :param chunk_runs: Número de ejecuciones leídas a la vez.
+        :return: Array con el regret de cada ejecución.
+        """
+        step = self.header['steps'] - 1 if step is None else step
+        rewards = self.rewards()
+        optimal = self.optimal() if self.dynamic else None
+        regret = np.empty(self.runs)
+        for start in range(0, self.runs, chunk_runs):
+            stop = min(start + chunk_runs, self.runs)
+            total = np.sum(rewards[algo_idx, start:stop, :step + 1], axis=1, dtype=float)
+            if optimal is None:
+                regret[start:stop] = (step + 1) * self.header['optimal_reward'] - total
+            else:
+                regret[start:stop] = np.sum(optimal[algo_idx, start:stop, :step + 1], axis=1, dtype=float) - total
+        return regret
+
+
+class TrajectoryWriter:
+    """
+    Escribe en el almacén las trayectorias de un algoritmo. Los backends escriben ejecuciones
+    completas (write_run) o bloques de pasos de todas sus ejecuciones (write_steps).
+    """
+
+    def __init__(self, store: TrajectoryStore, algo_idx: int, run_offset: int = 0):
+        self.algo_idx = algo_idx
+        self.run_offset = run_offset
+        self.arms = store.arms(mode='r+')[algo_idx]
+        self.rewards = store.rewards(mode='r+')[algo_idx]
+        self.optimal = store.optimal(mode='r+')[algo_idx] if store.dynamic else None
+
+    def write_run(self, run: int, arms: np.ndarray, rewards: np.ndarray, optimal: np.ndarray = None):
+        """
+        Escribe la trayectoria completa de una ejecución.
+        :param run: Índice de la ejecución (relativo al fragmento).
+        :param arms: Brazo elegido en cada paso.
+        :param rewards: Recompensa obtenida en cada paso.
+        :param optimal: Recompensa esperada del brazo óptimo en cada paso (bandidos no estacionarios).
+        """
+        self.arms[self.run_offset + run] = arms
+        self.rewards[self.run_offset + run] = rewards
+        if optimal is not None:
+            self.optimal[self.run_offset + run] = optimal
+
+    def write_steps(self, step: int, arms: np.ndarray, rewards: np.ndarray):
+        """
+        Escribe un bloque de pasos consecutivos de todas las ejecuciones del fragmento.
+        :param step: Primer paso del bloque.
+        :param arms: Brazos elegidos (pasos x ejecuciones).
+        :param rewards: Recompensas obtenidas (pasos x ejecuciones).
+        """
+        runs = slice(self.run_offset, self.run_offset + arms.shape[1])
+        self.arms[runs, step:step + len(arms)] = arms.T
+        self.rewards[runs, step:step + len(rewards)] = rewards.T
+
+    def flush(self):
+        self.arms.flush()
+        self.rewards.flush()
+        if self.optimal is not None:
+            self.optimal.flush()
@@ -14,8 +14,34 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
-# Importación de módulos o clases
-from .plotting import plot_average_rewards, plot_optimal_selections, plot_regret, plot_arm_statistics, plot_arm_num_choices
+from importlib import import_module
+
+# Submódulo de cada módulo o clase pública
+_SUBMODULES = {
+    'set_render_mode': '.plotting',
+    'plot_average_rewards': '.plotting',
+    'plot_optimal_selections': '.plotting',
+    'plot_regret': '.plotting',
+    'plot_sweep': '.plotting',
+    'plot_arm_statistics': '.plotting',
+    'plot_arm_num_choices': '.plotting',
+}
 
 # Lista de módulos o clases públicas
-__all__ = ['plot_average_rewards', 'plot_optimal_selections', 'plot_regret', 'plot_arm_statistics', 'plot_arm_num_choices']
+__all__ = ['set_render_mode', 'plot_average_rewards', 'plot_optimal_selections', 'plot_regret', 'plot_sweep', 'plot_arm_statistics', 'plot_arm_num_choices']
+
+
+def __getattr__(name: str):
+    """
+    Importación diferida (PEP 562): el submódulo de cada nombre público se carga la primera vez
+    que se usa, de modo que importar el paquete no carga módulos que no se necesitan.
+    """
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_SUBMODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -14,14 +14,15 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
-from typing import List
+from typing import List, Dict
+import os
 
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
 
-from algorithms import Algorithm, EpsilonGreedy, UCB1, UCB2, Softmax, Gradiente
-from typing import List, Dict
+from algorithms import Algorithm
+
+# matplotlib y seaborn se importan dentro de cada función, al dibujar la primera gráfica, para que
+# importar el paquete (p.e. por get_algorithm_label) no cueste cientos de milisegundos.
 
 
 def get_algorithm_label(algo: Algorithm) -> str:
@@ -33,11 +34,15 @@ def get_algorithm_label(algo: Algorithm) -> str:
     :return: Cadena descriptiva para el algoritmo.
     :rtype: str
     """
+    from algorithms import EpsilonGreedy, UCB1, UCB2, Softmax, Gradiente
+
     label = type(algo).__name__
+    # Memoria de las variantes para brazos no estacionarios (ventana deslizante o descuento)
+    memory = f", W={algo.window}" if hasattr(algo, 'window') else f", γ={algo.gamma}" if hasattr(algo, 'gamma') else ""
     if isinstance(algo, EpsilonGreedy):
-        label += f" (epsilon={algo.epsilon})"
+        label += f" (epsilon={algo.epsilon}{memory})"
     elif isinstance(algo, UCB1):
-        label += f" (c={algo.c})"
+        label += f" (c={algo.c}{memory})"
     elif isinstance(algo, UCB2):
         label += f" (α={algo.alfa})"
     elif isinstance(algo, Softmax):
@@ -49,73 +54,220 @@ def get_algorithm_label(algo: Algorithm) -> str:
     return label
 
 
+# Modo de renderizado (ver set_render_mode). Sin directorio de salida las figuras se muestran
+# con plt.show(); con él se guardan en ficheros y se reutilizan entre llamadas.
+RENDER = {'output_dir': None, 'format': 'png', 'dpi': 100, 'max_points': 4000}
+
+
+def set_render_mode(output_dir: str = None, fmt: str = 'png', dpi: int = 100, max_points: int = 4000):
+    """
+    Configura el renderizado de las gráficas.
+
+    Con output_dir se usa el backend no interactivo Agg (nodos sin pantalla): cada función guarda
+    su figura en output_dir/<nombre>.<fmt> y devuelve la ruta, y las figuras se reutilizan entre
+    llamadas en lugar de crear una nueva cada vez. Sin output_dir se muestran con plt.show().
+
+    :param output_dir: Directorio donde guardar las figuras. None para mostrarlas.
+    :param fmt: Formato de los ficheros (png, pdf, svg...).
+    :param dpi: Resolución de los ficheros.
+    :param max_points: Número máximo de puntos dibujados por curva (ver downsample). None para
+                       dibujar todos los pasos.
+    """
+    import matplotlib.pyplot as plt
+
+    if output_dir is not None:
+        plt.switch_backend('Agg')
+        os.makedirs(output_dir, exist_ok=True)
+    RENDER.update(output_dir=output_dir, format=fmt, dpi=dpi, max_points=max_points)
+
+
+def downsample(y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Índices de los puntos de una curva que se dibujan. Los pasos se agrupan en max_points / 2
+    cubetas (del orden de una por píxel) y de cada una se conservan el mínimo y el máximo, de
+    modo que la curva dibujada tiene la misma envolvente que la completa.
+
+    :param y: Valores de la curva.
+    :param max_points: Número máximo de puntos. None para conservarlos todos.
+    :return: Índices crecientes de los puntos conservados (incluidos el primero y el último).
+    """
+    n = len(y)
+    if max_points is None or n <= max_points:
+        return np.arange(n)
+
+    size = -(-n // (max_points // 2))  # Pasos por cubeta
+    full = n // size * size
+    buckets = np.asarray(y[:full]).reshape(-1, size)
+    offsets = np.arange(0, full, size)
+    indices = [[0, n - 1], offsets + np.argmin(buckets, axis=1), offsets + np.argmax(buckets, axis=1)]
+    if full < n:
+        tail = np.asarray(y[full:])
+        indices.append([full + np.argmin(tail), full + np.argmax(tail)])
+    return np.unique(np.concatenate(indices))
+
+
+def create_figure(name: str, **kwargs):
+    """
+    Crea la figura de una gráfica. En el modo de ficheros se reutiliza (vaciada) la figura del
+    mismo nombre de la llamada anterior.
+
+    :param name: Nombre de la gráfica.
+    :param kwargs: Argumentos de plt.subplots (figsize, nrows, ncols...).
+    :return: Figura y ejes, como plt.subplots.
+    """
+    import matplotlib.pyplot as plt
+
+    if RENDER['output_dir'] is None:
+        return plt.subplots(**kwargs)
+    return plt.subplots(num=name, clear=True, **kwargs)
+
+
+def render_figure(fig, name: str):
+    """
+    Muestra la figura o, en el modo de ficheros, la guarda en el directorio de salida.
+
+    :param fig: Figura a renderizar.
+    :param name: Nombre de la gráfica, usado como nombre del fichero.
+    :return: Ruta del fichero guardado, o None si la figura se ha mostrado.
+    """
+    import matplotlib.pyplot as plt
+
+    if RENDER['output_dir'] is None:
+        plt.show()
+        return None
+    path = os.path.join(RENDER['output_dir'], f"{name}.{RENDER['format']}")
+    fig.savefig(path, dpi=RENDER['dpi'])
+    return path
+
+
+def plot_metric(steps, data, idx: int, label: str):
+    """
+    Dibuja la curva de una métrica de un algoritmo. Si data es una serie con dispersión
+    (MetricSeries) se dibuja también el intervalo de confianza del 95% de la media.
+
+    :param steps: Número de pasos de tiempo o índices de los pasos registrados.
+    :param data: Matriz de la métrica (algoritmos x pasos) o MetricSeries.
+    :param idx: Índice del algoritmo.
+    :param label: Etiqueta de la curva.
+    """
+    import matplotlib.pyplot as plt
+
+    if hasattr(data, 'steps'):
+        x = data.steps
+    else:
+        x = np.arange(steps) if np.isscalar(steps) else np.asarray(steps)
+
+    # Solo se dibujan los puntos necesarios para la resolución de la figura
+    y = data[idx]
+    points = downsample(y, RENDER['max_points'])
+    plt.plot(x[points], y[points], label=label, linewidth=2)
+    if hasattr(data, 'half_width'):
+        half_width = data.half_width()[idx][points]
+        mean = data.mean[idx][points]
+        plt.fill_between(x[points], mean - half_width, mean + half_width, alpha=0.2)
+
+
 def plot_average_rewards(steps: int, rewards: np.ndarray, algorithms: List[Algorithm]):
     """
     Genera la gráfica de Recompensa Promedio vs Pasos de Tiempo.
 
-    :param steps: Número de pasos de tiempo.
-    :param rewards: Matriz de recompensas promedio.
+    :param steps: Número de pasos de tiempo o índices de los pasos registrados.
+    :param rewards: Matriz de recompensas promedio o MetricSeries.
     :param algorithms: Lista de instancias de algoritmos comparados.
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     sns.set_theme(style="whitegrid", palette="muted", font_scale=1.2)
 
-    plt.figure(figsize=(14, 7))
+    fig, _ = create_figure('average_rewards', figsize=(14, 7))
     for idx, algo in enumerate(algorithms):
         label = get_algorithm_label(algo)
-        plt.plot(range(steps), rewards[idx], label=label, linewidth=2)
+        plot_metric(steps, rewards, idx, label)
 
     plt.xlabel('Pasos de Tiempo', fontsize=14)
     plt.ylabel('Recompensa Promedio', fontsize=14)
     plt.title('Recompensa Promedio vs Pasos de Tiempo', fontsize=16)
     plt.legend(title='Algoritmos')
     plt.tight_layout()
-    plt.show()
+    return render_figure(fig, 'average_rewards')
 
 def plot_optimal_selections(steps: int, optimal_selections: np.ndarray, algorithms: List[Algorithm]):
     """
     Genera la gráfica de Porcentaje de Selección del Brazo Óptimo vs Pasos de Tiempo.
 
-    :param steps: Número de pasos de tiempo.
-    :param optimal_selections: Matriz de porcentaje de selecciones óptimas.
+    :param steps: Número de pasos de tiempo o índices de los pasos registrados.
+    :param optimal_selections: Matriz de porcentaje de selecciones óptimas o MetricSeries.
     :param algorithms: Lista de instancias de algoritmos comparados.
     """
+    import matplotlib.pyplot as plt
 
-    plt.figure(figsize=(10, 6))
+    fig, _ = create_figure('optimal_selections', figsize=(10, 6))
 
     for idx, algo in enumerate(algorithms):
         label = get_algorithm_label(algo)
-        plt.plot(range(steps), optimal_selections[idx], label=label, linewidth=2)
+        plot_metric(steps, optimal_selections, idx, label)
 
     plt.xlabel("Pasos de tiempo")
     plt.ylabel("Porcentaje de selecciones óptimas (%)")
     plt.title("Porcentaje de Selección del Brazo Óptimo vs Pasos de Tiempo")
     plt.legend()
     plt.grid()
-    plt.show()
+    return render_figure(fig, 'optimal_selections')
 
 def plot_regret(steps: int,
 regret_accumulated: np.ndarray,
 algorithms: List[Algorithm], *args):
     """
     Genera la gráfica de Regret Acumulado vs Pasos de Tiempo
-    :param steps: Número de pasos de tiempo.
-    :param regret_accumulated: Matriz de regret acumulado (algoritmos x pasos).
+    :param steps: Número de pasos de tiempo o índices de los pasos registrados.
+    :param regret_accumulated: Matriz de regret acumulado (algoritmos x pasos) o MetricSeries.
     :param algorithms: Lista de instancias de algoritmos comparados.
     :param args: Opcional. Parámetros que consideres. P.e. la cota teórica Cte * ln(T).
     """
+    import matplotlib.pyplot as plt
 
-    plt.figure(figsize=(10, 6))
+    fig, _ = create_figure('regret', figsize=(10, 6))
 
     for idx, algo in enumerate(algorithms):
         label = get_algorithm_label(algo)
-        plt.plot(range(steps), regret_accumulated[idx], label=label, linewidth=2)
+        plot_metric(steps, regret_accumulated, idx, label)
             
     plt.xlabel("Pasos de tiempo")
     plt.ylabel("Arrepentimiento acumulado")
     plt.title("Arrepentimiento acumulado vs Pasos de Tiempo")
     plt.legend()
     plt.grid()
-    plt.show()
+    return render_figure(fig, 'regret')
+
+def plot_sweep(sweep, metric: str = 'regret_accumulated', pattern: str = None, algo_class: type = None):
+    """
+    Genera la gráfica de una métrica de un barrido de hiperparámetros, con una curva por
+    configuración. Las configuraciones se pueden filtrar por su etiqueta (get_algorithm_label).
+
+    :param sweep: Resultado de run_sweep.
+    :param metric: Métrica a dibujar: 'rewards', 'optimal_selections' o 'regret_accumulated'.
+    :param pattern: Expresión regular que deben contener las etiquetas, p.e. 'UCB1' o 'c=0.1'.
+    :param algo_class: Clase de algoritmo de las configuraciones a dibujar.
+    """
+    import matplotlib.pyplot as plt
+
+    titles = {'rewards': 'Recompensa Promedio',
+              'optimal_selections': 'Porcentaje de selecciones óptimas (%)',
+              'regret_accumulated': 'Arrepentimiento acumulado'}
+    selected = sweep.select(pattern, algo_class)
+
+    fig, _ = create_figure('sweep', figsize=(10, 6))
+
+    for idx, label in enumerate(selected.labels):
+        plot_metric(selected.checkpoints, selected.series[metric], idx, label)
+
+    plt.xlabel("Pasos de tiempo")
+    plt.ylabel(titles[metric])
+    plt.title(f"{titles[metric]} vs Pasos de Tiempo")
+    plt.legend()
+    plt.grid()
+    return render_figure(fig, 'sweep')
 
 def plot_arm_statistics(arm_stats: List[Dict], algorithms: List, k: int, optimal_arm: int, *args):
     """
@@ -127,11 +279,13 @@ def plot_arm_statistics(arm_stats: List[Dict], algorithms: List, k: int, optimal
     :param k: Número de brazos.
     :param optimal_arm: Índice del brazo óptimo.
     """
+    import matplotlib.pyplot as plt
+
     num_algorithms = len(algorithms)
     cols = 2  # Número de columnas en la cuadrícula
     rows = (num_algorithms + 1) // cols  # Calculamos las filas necesarias
     
-    fig, axes = plt.subplots(rows, cols, figsize=(12, 6 * rows))
+    fig, axes = create_figure('arm_statistics', nrows=rows, ncols=cols, figsize=(12, 6 * rows))
     axes = axes.flatten() if num_algorithms > 1 else [axes]
     
     for idx, algo in enumerate(algorithms):
@@ -158,7 +312,7 @@ def plot_arm_statistics(arm_stats: List[Dict], algorithms: List, k: int, optimal
         fig.delaxes(axes[idx])
     
     plt.tight_layout()
-    plt.show()
+    return render_figure(fig, 'arm_statistics')
 
 def plot_arm_num_choices(num_choices_arm: np.ndarray,
                         algorithms: List[Algorithm], k, *args):
@@ -169,16 +323,17 @@ def plot_arm_num_choices(num_choices_arm: np.ndarray,
     :param algorithms: Lista de instancias de algoritmos comparados.
     :param args: Opcional. Parámetros que consideres
     """
+    import matplotlib.pyplot as plt
 
-    plt.figure(figsize=(10, 6))
+    fig, _ = create_figure('arm_num_choices', figsize=(10, 6))
         
     for idx, algo in enumerate(algorithms):
         label = get_algorithm_label(algo)
-        plt.plot(range(k), num_choices_arm[idx], label=label, linewidth=2)
+        plot_metric(k, num_choices_arm, idx, label)
 
     plt.xlabel("Brazos del bandido")
     plt.ylabel("Número de elecciones")
     plt.title("Número de elecciones por cada brazo")
     plt.legend()
     plt.grid()
-    plt.show()
+    return render_figure(fig, 'arm_num_choices')
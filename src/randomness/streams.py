@@ -0,0 +1,103 @@
+"""
+Module: randomness/streams.py
+Description: Utilidades para crear e inyectar generadores aleatorios (np.random.Generator) en
+             brazos, bandidos y algoritmos, con flujos de contador Philox reproducibles.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from functools import lru_cache
+from typing import List
+
+import numpy as np
+
+
+def make_rng(rng=None):
+    """
+    Normaliza el generador aleatorio que se inyecta a un objeto.
+
+    - None: se mantiene None, es decir, se usa el estado global de np.random (comportamiento original).
+    - Entero o SeedSequence: se crea un Generator con un flujo de contador Philox.
+    - Generator o RandomState: se utiliza tal cual.
+
+    :param rng: Generador, semilla o None.
+    :return: Generador aleatorio o None.
+    """
+    if rng is None or isinstance(rng, (np.random.Generator, np.random.RandomState)):
+        return rng
+    return np.random.Generator(np.random.Philox(rng))
+
+
+def get_rng(rng):
+    """
+    Devuelve el objeto sobre el que llamar a los métodos de muestreo.
+    :param rng: Generador aleatorio o None.
+    :return: El generador, o el módulo np.random (estado global) si es None.
+    """
+    return np.random if rng is None else rng
+
+
+def randint(rng, high: int, size=None):
+    """
+    Genera enteros uniformes en [0, high) con cualquier tipo de generador.
+    :param rng: Generador aleatorio o None para el estado global.
+    :param high: Límite superior (excluido).
+    :param size: Número de enteros. None para generar uno solo.
+    :return: Entero o array de enteros.
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng.integers(high, size=size)
+    return get_rng(rng).randint(high, size=size)
+
+
+@lru_cache(maxsize=64)
+def _stream_key(seed) -> np.ndarray:
+    """
+    Clave Philox derivada de una semilla. Se guarda en caché porque derivarla (SeedSequence) es
+    mucho más caro que crear el flujo, que se crea p.e. para cada bloque de recompensas comunes.
+    :param seed: Semilla (entera) del experimento.
+    :return: Clave de 128 bits como dos enteros de 64 bits (de solo lectura).
+    """
+    key = np.random.SeedSequence(seed).generate_state(2, dtype=np.uint64)
+    key.flags.writeable = False
+    return key
+
+
+def stream(seed, *indices: int, offset: int = 0) -> 'np.random.Generator':
+    """
+    Crea un flujo Philox de contador identificado por una semilla y hasta tres índices (p.e.
+    ejecución y brazo). La clave se deriva de la semilla y los índices ocupan las palabras altas
+    del contador, por lo que cada flujo es independiente y se puede regenerar por separado.
+
+    :param seed: Semilla del experimento.
+    :param indices: Índices no negativos que identifican el flujo.
+    :param offset: Número de bloques del contador (4 enteros de 64 bits cada uno) a saltar.
+    :return: Generador situado al principio (o en offset) del flujo.
+    """
+    assert len(indices) <= 3, "Un flujo se identifica con tres índices como máximo."
+
+    key = _stream_key(seed)
+    counter = np.zeros(4, dtype=np.uint64)
+    counter[1:1 + len(indices)] = indices
+
+    bit_generator = np.random.Philox(key=key, counter=counter)
+    if offset:
+        bit_generator.advance(offset)
+    return np.random.Generator(bit_generator)
+
+
+def jumped_streams(rng: 'np.random.Generator', n: int) -> 'List[np.random.Generator]':
+    """
+    Crea n flujos independientes saltando hacia delante el generador base.
+    :param rng: Generador base (Philox, PCG64 o MT19937).
+    :param n: Número de flujos.
+    :return: Lista de generadores, el i-ésimo saltado i + 1 veces.
+    """
+    return [np.random.Generator(rng.bit_generator.jumped(i + 1)) for i in range(n)]
@@ -0,0 +1,265 @@
+"""
+Module: serving/server.py
+Description: Servidor asíncrono (asyncio) de una política: atiende peticiones concurrentes de
+             decisión y recompensas que llegan más tarde y en cualquier orden, agrupándolas en
+             micro-lotes que se aplican al algoritmo desde una única tarea, de modo que su estado
+             es siempre consistente. Mantiene contadores de rendimiento y de latencia.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Union
+import asyncio
+import time
+
+import numpy as np
+
+from algorithms import Algorithm
+from experiments.profiling import LatencyHistogram
+
+
+@dataclass(frozen=True)
+class Decision:
+    """
+    Decisión tomada por el servidor. Su recompensa se registra con PolicyServer.update.
+    """
+    # Identificador de la decisión
+    id: int
+    # Brazo elegido
+    arm: int
+
+
+class ServerStats:
+    """
+    Contadores del servidor: decisiones, recompensas registradas y rechazadas y lotes procesados,
+    y latencias (desde la llamada hasta la respuesta) de select y update.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.decisions = 0
+        self.updates = 0
+        # Recompensas no registradas: decisión desconocida o ya recompensada, o error del algoritmo
+        self.rejected = 0
+        self.batches = 0
+        self.select_latency = LatencyHistogram()
+        self.update_latency = LatencyHistogram()
+
+    def snapshot(self) -> dict:
+        """
+        Resumen de los contadores: totales, rendimiento por segundo, tamaño medio de los lotes y
+        latencias p50/p99 en microsegundos.
+        """
+        elapsed = time.perf_counter() - self.start
+        return {
+            'decisions': self.decisions,
+            'updates': self.updates,
+            'rejected': self.rejected,
+            'batches': self.batches,
+            'decisions_per_second': self.decisions / elapsed,
+            'updates_per_second': self.updates / elapsed,
+            'mean_batch_size': ((self.decisions + self.updates + self.rejected) / self.batches
+                                if self.batches else 0.0),
+            'select_p50_us': self.select_latency.percentile(50) / 1e3,
+            'select_p99_us': self.select_latency.percentile(99) / 1e3,
+            'update_p50_us': self.update_latency.percentile(50) / 1e3,
+            'update_p99_us': self.update_latency.percentile(99) / 1e3,
+        }
+
+
+class PolicyServer:
+    """
+    Sirve las decisiones de un algoritmo a clientes concurrentes:
+
+        async with PolicyServer(UCB1(k=10)) as server:
+            decision = await server.select()
+            ...
+            await server.update(decision, reward)
+
+    select y update solo encolan la petición; una única tarea las procesa por lotes de hasta
+    max_batch peticiones, aplicando primero las recompensas pendientes y después las decisiones,
+    sin ceder el control en medio de un lote. Así el algoritmo, que no es seguro frente a accesos
+    concurrentes, nunca se usa desde dos sitios a la vez, y el coste de despertar la tarea se
+    reparte entre todas las peticiones del lote.
+
+    Las recompensas de cada lote se registran con una sola llamada a update_batch. El instante t
+    que recibe next_arm es el número de recompensas registradas, que con recompensas diferidas es
+    el número de observaciones en que se basa la decisión.
+    """
+
+    def __init__(self, algorithm: Algorithm, max_batch: int = 1024, max_delay: float = 0.0):
+        """
+        :param algorithm: Algoritmo que toma las decisiones.
+        :param max_batch: Número máximo de peticiones de cada tipo procesadas por lote.
+        :param max_delay: Tiempo (s) que se espera tras la primera petición para acumular más en
+                          el mismo lote. 0 para procesar en cuanto la tarea recupera el control.
+        """
+        assert max_batch > 0, "El tamaño máximo de los lotes debe ser mayor que 0."
+
+        self.algorithm = algorithm
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.stats = ServerStats()
+        # Peticiones pendientes: (futuro, instante de llegada) y (futuro, instante, id, recompensa)
+        self.pending_selects: List[tuple] = []
+        self.pending_updates: List[tuple] = []
+        # Decisiones cuya recompensa no se ha registrado todavía, por identificador
+        self.outstanding: Dict[int, Decision] = {}
+        self.next_id = 0
+        self.observed = 0
+        self.wakeup: asyncio.Event = None
+        self.task: asyncio.Task = None
+
+    async def start(self):
+        """
+        Inicia la tarea que procesa los lotes.
+        """
+        if self.task is None:
+            self.wakeup = asyncio.Event()
+            self.stats = ServerStats()
+            self.task = asyncio.create_task(self.serve())
+
+    async def stop(self):
+        """
+        Procesa las peticiones pendientes y detiene la tarea de los lotes.
+        """
+        if self.task is not None:
+            self.process_pending()
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def __aenter__(self) -> 'PolicyServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def select(self) -> Decision:
+        """
+        Solicita una decisión.
+        :return: Decisión con su identificador y el brazo elegido.
+        :raises RuntimeError: Si el servidor no está iniciado.
+        """
+        if self.task is None:
+            raise RuntimeError("El servidor no está iniciado (start o async with).")
+        future = asyncio.get_running_loop().create_future()
+        self.pending_selects.append((future, time.perf_counter_ns()))
+        self.wakeup.set()
+        return await future
+
+    async def update(self, decision: Union[Decision, int], reward: float):
+        """
+        Registra la recompensa de una decisión. Las recompensas pueden llegar en cualquier orden.
+        :param decision: Decisión o su identificador.
+        :param reward: Recompensa obtenida.
+        :raises KeyError: Si la decisión no existe o ya tiene recompensa.
+        :raises RuntimeError: Si el servidor no está iniciado.
+        :raises Exception: El error de update_batch si el algoritmo no puede registrar el lote; la
+                           decisión sigue pendiente y su recompensa se puede volver a enviar.
+        """
+        if self.task is None:
+            raise RuntimeError("El servidor no está iniciado (start o async with).")
+        decision_id = decision.id if isinstance(decision, Decision) else decision
+        future = asyncio.get_running_loop().create_future()
+        self.pending_updates.append((future, time.perf_counter_ns(), decision_id, reward))
+        self.wakeup.set()
+        await future
+
+    async def serve(self):
+        """
+        Tarea que procesa las peticiones pendientes por lotes cada vez que llega alguna.
+        """
+        while True:
+            await self.wakeup.wait()
+            self.wakeup.clear()
+            if self.max_delay > 0:
+                await asyncio.sleep(self.max_delay)
+            self.process_batch()
+            if self.pending_selects or self.pending_updates:
+                self.wakeup.set()
+
+    def process_pending(self):
+        """
+        Procesa todas las peticiones pendientes.
+        """
+        while self.pending_selects or self.pending_updates:
+            self.process_batch()
+
+    def process_batch(self):
+        """
+        Procesa un lote: hasta max_batch recompensas y después hasta max_batch decisiones.
+        """
+        updates = self.pending_updates[:self.max_batch]
+        del self.pending_updates[:len(updates)]
+        selects = self.pending_selects[:self.max_batch]
+        del self.pending_selects[:len(selects)]
+        if not updates and not selects:
+            return
+
+        clock = time.perf_counter_ns
+        # Las recompensas válidas del lote se registran con una sola actualización agregada
+        decisions, rewards, accepted = [], [], []
+        for future, start, decision_id, reward in updates:
+            # Se retira ya para rechazar una segunda recompensa de la misma decisión en el lote
+            decision = self.outstanding.pop(decision_id, None)
+            if decision is None:
+                self.resolve(future, KeyError(f"La decisión {decision_id} no existe o ya tiene recompensa."))
+                self.stats.update_latency.record(clock() - start)
+                self.stats.rejected += 1
+            else:
+                decisions.append(decision)
+                rewards.append(reward)
+                accepted.append((future, start))
+        if accepted:
+            try:
+                self.algorithm.update_batch(np.array([decision.arm for decision in decisions]),
+                                            np.array(rewards, dtype=float))
+                self.observed += len(accepted)
+                self.stats.updates += len(accepted)
+                result = None
+            except Exception as error:
+                # Ninguna recompensa del lote se ha registrado: las decisiones siguen pendientes
+                for decision in decisions:
+                    self.outstanding[decision.id] = decision
+                self.stats.rejected += len(accepted)
+                result = error
+            for future, start in accepted:
+                self.resolve(future, result)
+                self.stats.update_latency.record(clock() - start)
+
+        for future, start in selects:
+            try:
+                decision = Decision(self.next_id, int(self.algorithm.next_arm(self.observed)))
+                self.outstanding[decision.id] = decision
+                self.next_id += 1
+                self.resolve(future, decision)
+            except Exception as error:
+                self.resolve(future, error)
+            self.stats.select_latency.record(clock() - start)
+        self.stats.decisions += len(selects)
+        self.stats.batches += 1
+
+    @staticmethod
+    def resolve(future: asyncio.Future, result):
+        """
+        Entrega el resultado (o la excepción) de una petición, salvo que el cliente la haya cancelado.
+        """
+        if future.done():
+            return
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
@@ -0,0 +1,98 @@
+"""
+Module: serving/simulation.py
+Description: Fuente de recompensas simulada a partir de un bandido, con retrasos aleatorios para
+             que las recompensas lleguen desordenadas, y simulación de clientes concurrentes de un
+             PolicyServer para probarlo y medir su rendimiento sin un sistema real.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import asyncio
+
+from arms import Bandit
+from randomness import make_rng, get_rng
+from serving.server import Decision, PolicyServer
+
+
+class SimulatedRewardSource:
+    """
+    Recompensas de un bandido que llegan tras un retraso aleatorio uniforme en [0, max_delay).
+    """
+
+    def __init__(self, bandit: Bandit, max_delay: float = 0.01, rng=None):
+        """
+        :param bandit: Bandido que genera las recompensas.
+        :param max_delay: Retraso máximo (s) de cada recompensa.
+        :param rng: Generador aleatorio o semilla de los retrasos. Por defecto el estado global de np.random.
+        """
+        self.bandit = bandit
+        self.max_delay = max_delay
+        self.rng = make_rng(rng)
+        self.total_reward = 0.0
+        self.pulls = 0
+        self.optimal_pulls = 0
+
+    async def reward(self, arm: int) -> float:
+        """
+        Tira del brazo y devuelve la recompensa tras el retraso.
+        :param arm: Índice del brazo.
+        """
+        reward = float(self.bandit.pull_arm(arm))
+        self.total_reward += reward
+        self.pulls += 1
+        self.optimal_pulls += arm == self.bandit.optimal_arm
+        if self.max_delay > 0:
+            await asyncio.sleep(get_rng(self.rng).random() * self.max_delay)
+        return reward
+
+    @property
+    def regret(self) -> float:
+        """
+        Regret acumulado de las tiradas realizadas respecto al brazo óptimo.
+        """
+        return self.pulls * self.bandit.get_expected_value(self.bandit.optimal_arm) - self.total_reward
+
+
+async def simulate(server: PolicyServer, source: SimulatedRewardSource, requests: int,
+                   concurrency: int = 64) -> dict:
+    """
+    Simula concurrency clientes que piden decisiones al servidor hasta sumar requests decisiones.
+    La recompensa de cada decisión se registra en una tarea aparte cuando llega de la fuente, de
+    modo que las recompensas llegan más tarde y desordenadas.
+
+    :param server: Servidor iniciado.
+    :param source: Fuente de recompensas.
+    :param requests: Número total de decisiones.
+    :param concurrency: Número de clientes concurrentes.
+    :return: Contadores del servidor (ServerStats.snapshot) junto con el regret acumulado y el
+             porcentaje de selecciones del brazo óptimo.
+    """
+    feedback = set()
+    remaining = requests
+
+    async def send_reward(decision: Decision):
+        await server.update(decision, await source.reward(decision.arm))
+
+    async def client():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            decision = await server.select()
+            task = asyncio.create_task(send_reward(decision))
+            feedback.add(task)
+            task.add_done_callback(feedback.discard)
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    await asyncio.gather(*list(feedback))
+
+    summary = server.stats.snapshot()
+    summary['regret'] = source.regret
+    summary['optimal_selections'] = 100 * int(source.optimal_pulls) / max(source.pulls, 1)
+    return summary
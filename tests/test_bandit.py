@@ -0,0 +1,97 @@
+"""
+Module: tests/test_bandit.py
+Description: Comprueba que cada bandido trabaja sobre su propia copia de los brazos, de modo que
+             los bandidos creados a partir de los mismos brazos (o con with_rng) son independientes,
+             y que pull_total sirve primero las recompensas pendientes del búfer de los brazos.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import copy
+
+import numpy as np
+import pytest
+
+from arms import ArmNormal, ArmBernoulli, ArmBinomial, ArmNormalDrift, Bandit, NonStationaryBandit
+
+K = 3
+PULLS = 200
+
+ARMS = [
+    lambda: ArmNormal.generate_arms(K, rng=1),
+    lambda: ArmBernoulli.generate_arms(K, rng=1),
+    lambda: ArmBinomial.generate_arms(K, rng=1),
+]
+
+
+def pulls(bandit: Bandit) -> np.ndarray:
+    """
+    Recompensas de PULLS tiradas de cada brazo del bandido.
+    """
+    return np.array([[bandit.pull_arm(arm) for arm in range(bandit.k)] for _ in range(PULLS)])
+
+
+@pytest.mark.parametrize('make_arms', ARMS)
+def test_bandits_from_the_same_arms_are_independent(make_arms):
+    arms = make_arms()
+    reference = pulls(Bandit(make_arms(), rng=1))
+
+    first = Bandit(arms, rng=1)
+    second = Bandit(arms, rng=2)
+    # Crear el segundo bandido no vuelve a sembrar los brazos del primero
+    np.testing.assert_array_equal(pulls(first), reference)
+    assert np.any(pulls(second) != reference)
+    assert all(arm.rng is None for arm in arms)
+
+
+@pytest.mark.parametrize('make_arms', ARMS)
+def test_with_rng_does_not_reseed_the_bandit(make_arms):
+    bandit = Bandit(make_arms(), rng=1)
+    reference = pulls(Bandit(make_arms(), rng=1))
+
+    other = bandit.with_rng(2)
+    np.testing.assert_array_equal(pulls(bandit), reference)
+    np.testing.assert_array_equal(pulls(other), pulls(Bandit(make_arms(), rng=2)))
+    assert all(arm is not other_arm for arm, other_arm in zip(bandit.arms, other.arms))
+
+
+def test_nonstationary_bandit_moves_its_own_arms():
+    arms = ArmNormalDrift.generate_arms(K, drift=0.5, rng=1)
+    bandit = NonStationaryBandit(arms, rng=1)
+    other = bandit.with_rng(2)
+
+    for _ in range(PULLS):
+        bandit.pull_arm(0)
+
+    assert all(arm.t == 0 for arm in arms + other.arms)
+    assert all(arm in bandit.arms for arm in bandit.dynamic)
+    assert bandit.get_expected_rewards() != other.get_expected_rewards()
+
+
+@pytest.mark.parametrize('make_arms', ARMS)
+def test_pull_total_serves_the_buffer_first(make_arms):
+    arm = make_arms()[0]
+    arm.set_rng(3)
+    arm.set_block_size(100)
+    for _ in range(30):
+        arm.pull()
+
+    # Dentro del búfer la suma es la de las recompensas que serviría pull_many
+    twin = copy.deepcopy(arm)
+    assert arm.pull_total(50) == pytest.approx(float(np.sum(twin.pull_many(50))))
+    assert arm.pull() == twin.pull()
+
+    # Más allá del búfer se sirven las pendientes y el resto se extrae de su distribución
+    pending = arm._buffer[arm._buffer_pos:].copy()
+    twin = copy.deepcopy(arm)
+    total = arm.pull_total(100)
+    assert total == pytest.approx(float(np.sum(pending)) + twin.sample_total(100 - len(pending)))
+    arm.pull()
+    assert arm._buffer_pos == 1  # El búfer se rellena en la siguiente tirada
@@ -0,0 +1,54 @@
+"""
+Module: tests/test_batched.py
+Description: Comprueba que las versiones por lotes de los algoritmos eligen en cada ejecución los
+             mismos brazos que el algoritmo secuencial con las mismas recompensas.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+
+from algorithms import UCB2, BatchedUCB2
+
+K = 3
+STEPS = 3000
+
+
+def test_batched_ucb2_follows_ucb2():
+    # Un valor de alfa por ejecución; con alfa pequeño se superan las épocas de la tabla inicial
+    alfas = [0.01, 0.01, 0.3, 0.9]
+    rewards = np.random.default_rng(1).normal(np.arange(K) / K, 1, size=(STEPS, len(alfas), K))
+
+    batched = BatchedUCB2(K, len(alfas), alfa=alfas)
+    chosen = np.zeros((STEPS, len(alfas)), dtype=int)
+    for t in range(STEPS):
+        chosen[t] = batched.select_arms(t)
+        batched.update_batch(chosen[t], rewards[t, np.arange(len(alfas)), chosen[t]])
+
+    for run, alfa in enumerate(alfas):
+        algo = UCB2(K, alfa=alfa)
+        for t in range(STEPS):
+            arm = algo.next_arm(t)
+            assert arm == chosen[t, run]
+            algo.update(arm, rewards[t, run, arm])
+        np.testing.assert_array_equal(algo.kas, batched.kas[run])
+
+    assert batched.kas.max() >= 64
+
+
+def test_batched_ucb2_rebuilds_the_tables_when_alfa_changes():
+    # run_sweep asigna un valor de alfa por fila después de crear el algoritmo
+    batched = BatchedUCB2(K, 2, alfa=0.1)
+    batched.alfa = batched.per_run([0.01, 0.9])
+    expected = BatchedUCB2(K, 2, alfa=[0.01, 0.9])
+
+    np.testing.assert_array_equal(batched.ceil_taus, expected.ceil_taus)
+    np.testing.assert_array_equal(batched.epoch_lengths, expected.epoch_lengths)
+    np.testing.assert_array_equal(batched.alfa_rows, expected.alfa_rows)
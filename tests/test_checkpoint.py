@@ -0,0 +1,81 @@
+"""
+Module: tests/test_checkpoint.py
+Description: Comprueba que un experimento interrumpido y reanudado desde su punto de control da el
+             mismo resultado que sin interrupciones, con cada backend y con números aleatorios comunes.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import EpsilonGreedy, UCB1
+from arms import ArmNormal, Bandit
+from experiments import run_experiment
+from experiments.checkpoint import ExperimentCheckpoint
+
+K = 4
+STEPS = 150
+RUNS = 20
+BATCH_RUNS = 5
+
+
+class Interrupted(Exception):
+    pass
+
+
+def interrupt_after(calls: int):
+    """
+    Función de progreso que interrumpe el experimento en su llamada número calls.
+    """
+    count = [0]
+
+    def progress(completed: int):
+        count[0] += 1
+        if count[0] == calls:
+            raise Interrupted()
+    return progress
+
+
+def experiment(path: str, backend: str, seed, common_random_numbers: bool, progress=None):
+    bandit = Bandit(ArmNormal.generate_arms(K, rng=1))
+    options = {'n_workers': 2} if backend == 'parallel' else {}
+    return run_experiment(bandit, [UCB1(K, c=1), EpsilonGreedy(K, epsilon=0.1)], STEPS, RUNS, seed=seed,
+                          backend=backend, checkpoint=path, batch_runs=BATCH_RUNS,
+                          common_random_numbers=common_random_numbers, progress=progress, **options)
+
+
+@pytest.mark.parametrize('common_random_numbers', [False, True])
+@pytest.mark.parametrize('seed', [3, None])
+@pytest.mark.parametrize('backend', ['loop', 'vectorized', 'parallel'])
+def test_resumed_experiment_matches_uninterrupted_run(backend, seed, common_random_numbers, tmp_path):
+    # Sin semilla, el estado global de np.random (y la semilla de la tabla) es el mismo al empezar
+    np.random.seed(11)
+    reference = experiment(str(tmp_path / 'reference.npz'), backend, seed, common_random_numbers)
+
+    path = str(tmp_path / 'interrupted.npz')
+    np.random.seed(11)
+    # Cada bloque llama a progress una vez por algoritmo: se interrumpe en el tercer bloque
+    with pytest.raises(Interrupted):
+        experiment(path, backend, seed, common_random_numbers, progress=interrupt_after(5))
+    saved = ExperimentCheckpoint.load(path)
+    assert len(saved.completed_runs) == 2 * BATCH_RUNS
+
+    np.random.seed(99)  # El estado global se restaura desde el punto de control
+    resumed = experiment(path, backend, seed, common_random_numbers)
+
+    assert resumed.runs == reference.runs == RUNS
+    if common_random_numbers:
+        assert saved.config['table_seed'] == ExperimentCheckpoint.load(str(tmp_path / 'reference.npz')).config['table_seed']
+    np.testing.assert_array_equal(resumed.final_regret, reference.final_regret)
+    np.testing.assert_array_equal(resumed.regret_accumulated, reference.regret_accumulated)
+    np.testing.assert_array_equal(resumed.optimal_selections, reference.optimal_selections)
+    for resumed_stats, reference_stats in zip(resumed.arm_stats, reference.arm_stats):
+        np.testing.assert_array_equal(resumed_stats['selections'], reference_stats['selections'])
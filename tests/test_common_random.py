@@ -0,0 +1,68 @@
+"""
+Module: tests/test_common_random.py
+Description: Comprueba que la tabla de números aleatorios comunes (CommonRandomBandit) asigna la
+             misma recompensa a la n-ésima tirada de cada brazo en cada ejecución sea cual sea el
+             número de ejecuciones simuladas a la vez y el backend.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import UCB1, SlidingWindowUCB1
+from arms import ArmNormal, ArmBernoulli, Bandit, CommonRandomBandit
+from experiments import run_experiment
+
+K = 4
+PULLS = 5000  # Más que varios bloques de la tabla
+
+
+@pytest.mark.parametrize('arm_class', [ArmNormal, ArmBernoulli])
+@pytest.mark.parametrize('run', [0, 3])
+def test_table_does_not_depend_on_batch_width(arm_class, run):
+    bandit = CommonRandomBandit(arm_class.generate_arms(K, rng=1), seed=7)
+
+    # Una sola ejecución, como en el backend de referencia
+    bandit.start_runs(run, 1)
+    single = np.array([bandit.pull_arm(0) for _ in range(PULLS)])
+
+    # La misma ejecución dentro de un bloque de 500, como en el backend vectorizado
+    bandit.start_runs(0, 500)
+    wide = np.array([bandit.pull_arms(np.zeros(500, dtype=int))[run] for _ in range(PULLS)])
+
+    # Y dentro de un bloque que empieza en ella
+    bandit.start_runs(run, 7)
+    shifted = np.array([bandit.pull_arms(np.zeros(7, dtype=int))[0] for _ in range(PULLS)])
+
+    np.testing.assert_array_equal(single, wide)
+    np.testing.assert_array_equal(single, shifted)
+
+
+def test_equivalent_policies_get_identical_regret_across_backends():
+    # SlidingWindowUCB1 no tiene versión por lotes y se simula con el backend de referencia; con
+    # una ventana mayor que el horizonte elige los mismos brazos que UCB1 (vectorizado). Con muchas
+    # ejecuciones y muchos brazos el bloque vectorizado es muy ancho
+    k = 50
+    bandit = Bandit(ArmNormal.generate_arms(k, rng=2))
+    result = run_experiment(bandit, [UCB1(k, c=1), SlidingWindowUCB1(k, c=1, window=10 ** 6)], 1000, 200,
+                            seed=3, common_random_numbers=True)
+
+    np.testing.assert_array_equal(result.final_regret[0], result.final_regret[1])
+    assert np.isinf(result.variance_reduction[0, 1])
+
+
+def test_loop_and_vectorized_backends_share_the_table():
+    bandit = Bandit(ArmNormal.generate_arms(K, rng=2))
+    results = [run_experiment(bandit, [UCB1(K, c=1)], 800, 20, seed=3, backend=backend,
+                              common_random_numbers=True)
+               for backend in ('loop', 'vectorized')]
+
+    np.testing.assert_allclose(results[0].final_regret, results[1].final_regret, rtol=1e-12)
@@ -0,0 +1,88 @@
+"""
+Module: tests/test_engine.py
+Description: Comprueba que run_experiment da los mismos resultados con el backend de referencia y
+             con el vectorizado, y que admite la llamada de los notebooks.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import EpsilonGreedy, UCB1, UCB2
+from arms import ArmBernoulli, ArmNormal, Bandit
+from experiments import run_experiment
+
+K = 4
+STEPS = 200
+RUNS = 300
+
+
+def run_backends(bandit: Bandit, make_algorithms, steps: int, runs: int, seed: int):
+    """
+    Resultados del mismo experimento con el backend de referencia y con el vectorizado.
+    """
+    return [run_experiment(bandit, make_algorithms(), steps, runs, seed=seed, backend=backend)
+            for backend in ('loop', 'vectorized')]
+
+
+def test_deterministic_rewards_give_identical_results():
+    # Con recompensas deterministas (p = 0 o 1) las políticas UCB eligen los mismos brazos en los
+    # dos backends, por lo que todas las métricas coinciden
+    bandit = Bandit([ArmBernoulli(0.0), ArmBernoulli(1.0), ArmBernoulli(0.0), ArmBernoulli(1.0)])
+    loop, vectorized = run_backends(bandit, lambda: [UCB1(K, c=1), UCB2(K, alfa=0.5)], STEPS, 5, seed=1)
+
+    np.testing.assert_array_equal(loop.final_regret, vectorized.final_regret)
+    np.testing.assert_allclose(loop.regret_accumulated, vectorized.regret_accumulated)
+    np.testing.assert_allclose(loop.optimal_selections, vectorized.optimal_selections)
+    np.testing.assert_allclose(loop.rewards, vectorized.rewards)
+    for loop_stats, vectorized_stats in zip(loop.arm_stats, vectorized.arm_stats):
+        np.testing.assert_allclose(loop_stats['selections'], vectorized_stats['selections'])
+        np.testing.assert_allclose(loop_stats['mean_rewards'], vectorized_stats['mean_rewards'])
+
+
+def test_backends_agree_in_distribution():
+    bandit = Bandit(ArmNormal.generate_arms(K, rng=1))
+    loop, vectorized = run_backends(bandit, lambda: [UCB1(K, c=1), EpsilonGreedy(K, epsilon=0.1)],
+                                    STEPS, RUNS, seed=2)
+
+    # Medias del regret final dentro de 4 errores típicos de su diferencia
+    difference = loop.final_regret.mean(axis=1) - vectorized.final_regret.mean(axis=1)
+    error = np.sqrt((loop.final_regret.var(axis=1) + vectorized.final_regret.var(axis=1)) / RUNS)
+    assert np.all(np.abs(difference) < 4 * error)
+
+    np.testing.assert_allclose(loop.optimal_selections[:, -1], vectorized.optimal_selections[:, -1], atol=10)
+    for result in (loop, vectorized):
+        for stats in result.arm_stats:
+            assert stats['selections'].sum() == pytest.approx(STEPS)
+
+
+@pytest.mark.parametrize('backend', ['loop', 'vectorized'])
+def test_same_seed_gives_the_same_result(backend):
+    bandit = Bandit(ArmNormal.generate_arms(K, rng=1))
+    results = [run_experiment(bandit, [UCB1(K, c=1), EpsilonGreedy(K, epsilon=0.1)], STEPS, 20, seed=3,
+                              backend=backend) for _ in range(2)]
+
+    np.testing.assert_array_equal(results[0].final_regret, results[1].final_regret)
+    np.testing.assert_array_equal(results[0].optimal_selections, results[1].optimal_selections)
+
+
+def test_notebook_call_shape():
+    seed, steps, runs = 42, 100, 10
+    bandit = Bandit(arms=ArmNormal.generate_arms(K))
+    algorithms = [EpsilonGreedy(K, epsilon=0.1), UCB1(K, c=1)]
+
+    rewards, optimal_selections, regret_accumulated, arm_stats = run_experiment(bandit, algorithms, steps, runs,
+                                                                                seed=seed)
+
+    assert rewards.shape == optimal_selections.shape == regret_accumulated.shape == (len(algorithms), steps)
+    assert np.all((optimal_selections >= 0) & (optimal_selections <= 100))
+    assert len(arm_stats) == len(algorithms)
+    assert sum(arm_stats[0]['selections']) == pytest.approx(steps)
@@ -0,0 +1,69 @@
+"""
+Module: tests/test_lazy_ucb1.py
+Description: Comprueba que LazyUCB1 elige en cada paso el mismo brazo que UCB1 a lo largo de una
+             trayectoria completa, incluidas las reconstrucciones del montículo al alcanzar el
+             horizonte y la restauración de su estado.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import UCB1, LazyUCB1
+
+K = 20
+STEPS = 3000
+
+
+@pytest.fixture
+def rewards():
+    """
+    Recompensa de cada brazo en cada paso (continuas, de modo que no hay empates entre brazos).
+    """
+    rng = np.random.default_rng(4)
+    return rng.normal(rng.uniform(0, 1, size=K), 1, size=(STEPS, K))
+
+
+@pytest.mark.parametrize('c', [0.2, 1])
+@pytest.mark.parametrize('growth', [0.01, 0.5])
+def test_lazy_ucb1_follows_ucb1(c, growth, rewards):
+    lazy, reference = LazyUCB1(K, c=c, growth=growth), UCB1(K, c=c)
+    horizons = set()
+
+    for t in range(STEPS):
+        arm = lazy.select_arm(t)
+        assert arm == reference.select_arm(t)
+        lazy.update(arm, rewards[t, arm])
+        reference.update(arm, rewards[t, arm])
+        horizons.add(lazy.horizon)
+
+    # El horizonte se ha ampliado (y el montículo reconstruido) varias veces
+    assert len(horizons) > 5
+
+
+def test_lazy_ucb1_follows_ucb1_with_batches_and_restored_state(rewards):
+    lazy, reference = LazyUCB1(K, c=0.5, growth=0.05), UCB1(K, c=0.5)
+    t = 0
+    while t < STEPS:
+        # Épocas de varios pasos con la misma decisión, registradas con update_batch
+        arm = lazy.select_arm(t)
+        assert arm == reference.select_arm(t)
+        n = min(1 + t % 7, STEPS - t)
+        arms = np.full(n, arm)
+        lazy.update_batch(arms, rewards[t:t + n, arm])
+        reference.update_batch(arms, rewards[t:t + n, arm])
+        t += n
+
+        if t % 500 < 7:
+            # Un punto de control a mitad de la trayectoria restaura el montículo y la pila
+            restored = LazyUCB1(K, c=0.5, growth=0.05)
+            restored.set_state(lazy.get_state())
+            lazy = restored
@@ -0,0 +1,168 @@
+"""
+Module: tests/test_nonstationary.py
+Description: Comprueba los brazos no estacionarios (ArmNormalDrift, ArmBernoulliPiecewise), que su
+             evolución no depende de las tiradas y se repite en cada ejecución, el regret dinámico
+             de run_experiment y de las trayectorias, y las estadísticas de las políticas con
+             ventana deslizante y con descuento frente a su cálculo directo.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import (UCB1, EpsilonGreedy, SlidingWindowUCB1, DiscountedUCB1, SlidingWindowEpsilonGreedy,
+                        DiscountedEpsilonGreedy)
+from arms import ArmNormalDrift, ArmBernoulliPiecewise, NonStationaryBandit
+from experiments import run_experiment, run_sweep
+
+K = 4
+STEPS = 300
+
+# Brazos de cada tipo, con la semilla de su evolución generada a partir de rng
+ARMS = {
+    'ArmNormalDrift': lambda: ArmNormalDrift.generate_arms(K, drift=0.5, rng=1),
+    'ArmBernoulliPiecewise': lambda: ArmBernoulliPiecewise.generate_arms(K, hazard=0.05, rng=1),
+}
+
+
+def expected_path(bandit: NonStationaryBandit, pulls, run: int = 0) -> np.ndarray:
+    """
+    Recompensas esperadas de cada brazo en cada paso de una ejecución, tirando en cada paso el
+    brazo que indica pulls (None para no tirar ninguno y solo leer las recompensas esperadas).
+    """
+    bandit.start_runs(run, 1)
+    path = []
+    for step in range(STEPS):
+        path.append(bandit.get_expected_rewards())
+        if pulls is None:
+            bandit.tick()
+        else:
+            bandit.pull_arm(pulls(step))
+    return np.array(path)
+
+
+@pytest.mark.parametrize('name', list(ARMS))
+def test_evolution_does_not_depend_on_the_pulls(name):
+    bandit = NonStationaryBandit(ARMS[name](), rng=2)
+
+    untouched = expected_path(bandit, None)
+    first_arm = expected_path(bandit, lambda step: 0)
+    round_robin = expected_path(bandit, lambda step: step % K)
+
+    np.testing.assert_array_equal(untouched, first_arm)
+    np.testing.assert_array_equal(untouched, round_robin)
+    # Las recompensas esperadas cambian a lo largo de la ejecución
+    assert np.any(untouched != untouched[0])
+
+
+@pytest.mark.parametrize('name', list(ARMS))
+def test_each_run_repeats_its_own_evolution(name):
+    bandit = NonStationaryBandit(ARMS[name](), rng=2)
+
+    run_0, run_1 = expected_path(bandit, None, run=0), expected_path(bandit, None, run=1)
+
+    np.testing.assert_array_equal(run_0, expected_path(bandit, None, run=0))
+    np.testing.assert_array_equal(run_1, expected_path(bandit, None, run=1))
+    np.testing.assert_array_equal(run_0[0], run_1[0])
+    assert np.any(run_0 != run_1)
+
+
+def test_piecewise_hazard_extremes():
+    never = NonStationaryBandit(ArmBernoulliPiecewise.generate_arms(K, hazard=0, rng=1))
+    always = NonStationaryBandit(ArmBernoulliPiecewise.generate_arms(K, hazard=1, rng=1))
+
+    path = expected_path(never, None)
+    np.testing.assert_array_equal(path, np.broadcast_to(path[0], path.shape))
+
+    path = expected_path(always, None)
+    assert np.all((path >= 0) & (path <= 1))
+    assert len(np.unique(path[:, 0])) > 1
+
+
+@pytest.mark.parametrize('backend', ['loop', 'vectorized'])
+def test_equal_policies_are_scored_on_the_same_paths(backend, tmp_path):
+    # SlidingWindowUCB1 no tiene versión por lotes; con una ventana mayor que el horizonte elige
+    # los mismos brazos que UCB1. Con la misma semilla de las recompensas sus resultados coinciden
+    # solo si las dos se simulan sobre los mismos caminos de los brazos
+    runs = 6
+    results = []
+    for algo in (UCB1(K, c=1), SlidingWindowUCB1(K, c=1, window=10 ** 6)):
+        bandit = NonStationaryBandit(ARMS['ArmNormalDrift']())
+        results.append(run_experiment(bandit, [algo], STEPS, runs, seed=3, backend=backend,
+                                      trajectories=str(tmp_path / type(algo).__name__)))
+
+    np.testing.assert_array_equal(results[0].final_regret, results[1].final_regret)
+    np.testing.assert_array_equal(results[0].optimal_selections, results[1].optimal_selections)
+
+    # Regret dinámico de las trayectorias guardadas, respecto al brazo óptimo de cada paso
+    for result in results:
+        np.testing.assert_allclose(result.trajectories.regret_distribution(0), result.final_regret[0],
+                                   rtol=1e-4, atol=1e-2)
+
+
+def test_backends_agree_on_nonstationary_bandits():
+    algorithms = [UCB1(K, c=1), EpsilonGreedy(K, epsilon=0.1), DiscountedUCB1(K, gamma=0.95)]
+    results = [run_experiment(NonStationaryBandit(ARMS['ArmBernoulliPiecewise']()), algorithms, STEPS, 8,
+                              seed=4, backend=backend)
+               for backend in ('loop', 'vectorized')]
+
+    np.testing.assert_array_equal(results[0].final_regret, results[1].final_regret)
+    np.testing.assert_array_equal(results[0].regret_accumulated, results[1].regret_accumulated)
+
+
+def test_sweep_rejects_nonstationary_bandits():
+    bandit = NonStationaryBandit(ARMS['ArmNormalDrift']())
+    with pytest.raises(ValueError):
+        run_sweep(bandit, {UCB1: {'c': [0.5, 1]}}, STEPS, 2, seed=1)
+
+
+@pytest.fixture
+def observations():
+    """
+    Brazos y recompensas de una secuencia de observaciones, con brazos repetidos.
+    """
+    rng = np.random.default_rng(5)
+    return rng.integers(K, size=500), rng.normal(size=500)
+
+
+@pytest.mark.parametrize('algo_class', [SlidingWindowUCB1, SlidingWindowEpsilonGreedy])
+def test_sliding_window_statistics(algo_class, observations):
+    window = 37
+    algo = algo_class(K, window=window, rng=1)
+    arms, rewards = observations
+
+    for n, (arm, reward) in enumerate(zip(arms.tolist(), rewards.tolist()), start=1):
+        algo.update(arm, reward)
+        recent_arms, recent_rewards = arms[max(0, n - window):n], rewards[max(0, n - window):n]
+        counts = np.bincount(recent_arms, minlength=K)
+        sums = np.bincount(recent_arms, weights=recent_rewards, minlength=K)
+
+        np.testing.assert_array_equal(algo.counts, counts)
+        np.testing.assert_allclose(algo.values, np.divide(sums, counts, out=np.zeros(K), where=counts > 0),
+                                   rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize('algo_class', [DiscountedUCB1, DiscountedEpsilonGreedy])
+def test_discounted_statistics(algo_class, observations):
+    gamma = 0.5  # Renormaliza (MAX_SCALE) en las 500 observaciones
+    algo = algo_class(K, gamma=gamma, rng=1)
+    arms, rewards = observations
+
+    for n, (arm, reward) in enumerate(zip(arms.tolist(), rewards.tolist()), start=1):
+        algo.update(arm, reward)
+        weights = gamma ** np.arange(n - 1, -1, -1)
+        counts = np.bincount(arms[:n], weights=weights, minlength=K)
+        sums = np.bincount(arms[:n], weights=weights * rewards[:n], minlength=K)
+        pulled = np.bincount(arms[:n], minlength=K) > 0
+
+        np.testing.assert_array_equal(algo.counts, np.bincount(arms[:n], minlength=K))
+        np.testing.assert_allclose(algo.discounted_counts(), counts, rtol=1e-9, atol=1e-300)
+        np.testing.assert_allclose(algo.values[pulled], sums[pulled] / counts[pulled], rtol=1e-6)
@@ -0,0 +1,54 @@
+"""
+Module: tests/test_parallel.py
+Description: Comprueba que el backend paralelo es reproducible para cada pareja (seed, n_workers) y
+             que cada algoritmo de un fragmento usa su propio flujo aleatorio.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+
+from algorithms import EpsilonGreedy, UCB1
+from arms import ArmNormal, Bandit
+from experiments import run_experiment
+
+K = 4
+STEPS = 200
+RUNS = 24
+
+
+def run_parallel(algorithms, n_workers: int, seed: int, **options):
+    bandit = Bandit(ArmNormal.generate_arms(K, rng=1))
+    return run_experiment(bandit, algorithms, STEPS, RUNS, seed=seed, backend='parallel', n_workers=n_workers,
+                          **options)
+
+
+def test_same_seed_and_workers_give_the_same_result():
+    make_algorithms = lambda: [UCB1(K, c=1), EpsilonGreedy(K, epsilon=0.1, rng=5)]
+    first, second = (run_parallel(make_algorithms(), n_workers=3, seed=7) for _ in range(2))
+
+    np.testing.assert_array_equal(first.final_regret, second.final_regret)
+    np.testing.assert_array_equal(first.regret_accumulated, second.regret_accumulated)
+    np.testing.assert_array_equal(first.optimal_selections, second.optimal_selections)
+
+    # El reparto entre los procesos determina los flujos de cada ejecución
+    other = run_parallel(make_algorithms(), n_workers=2, seed=7)
+    assert np.any(other.final_regret != first.final_regret)
+
+
+def test_algorithms_do_not_share_the_shard_stream():
+    # Con números aleatorios comunes las recompensas no dependen de ningún generador, y cada
+    # algoritmo decide con su propio flujo: el resultado del segundo no depende del primero
+    results = [run_parallel([first, EpsilonGreedy(K, epsilon=0.1, rng=5)], n_workers=2, seed=7,
+                            common_random_numbers=True)
+               for first in (EpsilonGreedy(K, epsilon=0.5, rng=5), EpsilonGreedy(K, epsilon=0.05, rng=5))]
+
+    np.testing.assert_array_equal(results[0].final_regret[1], results[1].final_regret[1])
+    assert np.any(results[0].final_regret[0] != results[1].final_regret[0])
@@ -0,0 +1,116 @@
+"""
+Module: tests/test_pool.py
+Description: Comprueba que cada instancia de un conjunto de bandidos (BanditPool) con tipos compactos
+             elige los mismos brazos que el algoritmo escalar equivalente, y que el estado se
+             guarda y se carga proyectado en memoria sin cambios.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import EpsilonGreedy, UCB1, BanditPool, EpsilonGreedyPool, UCB1Pool
+
+N = 6
+K = 4
+STEPS = 300
+
+# Conjunto y algoritmo escalar equivalente. Con epsilon = 0 epsilon-greedy no usa el generador,
+# cuyo consumo es distinto en el conjunto (un sorteo por lote) y en el algoritmo escalar
+POOLS = {
+    'EpsilonGreedy': (lambda: EpsilonGreedyPool(N, K, epsilon=0.0), lambda: EpsilonGreedy(K, epsilon=0.0)),
+    'UCB1': (lambda: UCB1Pool(N, K, c=1), lambda: UCB1(K, c=1)),
+    'UCB1-c=0.3': (lambda: UCB1Pool(N, K, c=0.3), lambda: UCB1(K, c=0.3)),
+}
+
+
+def select(algo, t: int) -> int:
+    return int(algo.select_arm(t) if isinstance(algo, UCB1) else algo.select_arm())
+
+
+@pytest.fixture
+def rewards():
+    """
+    Recompensa de cada brazo de cada instancia en cada paso, con medias distintas por instancia.
+    """
+    rng = np.random.default_rng(3)
+    means = rng.normal(size=(N, K))
+    return rng.normal(means, 1, size=(STEPS, N, K))
+
+
+@pytest.mark.parametrize('name', list(POOLS))
+def test_pool_instances_follow_the_scalar_algorithm(name, rewards):
+    make_pool, make_algorithm = POOLS[name]
+    pool = make_pool()
+    assert pool.counts.dtype == np.uint32 and pool.values.dtype == np.float32
+
+    ids = np.arange(N)
+    chosen = np.zeros((STEPS, N), dtype=int)
+    for t in range(STEPS):
+        chosen[t] = pool.select(ids)
+        pool.update(ids, chosen[t], rewards[t, ids, chosen[t]])
+
+    for i in range(N):
+        algo = make_algorithm()
+        for t in range(STEPS):
+            arm = select(algo, t)
+            assert arm == chosen[t, i]
+            algo.update(arm, rewards[t, i, arm])
+
+        np.testing.assert_array_equal(pool.counts[i], algo.counts)
+        np.testing.assert_allclose(pool.values[i], algo.values, rtol=1e-5, atol=1e-5)
+
+
+def test_pool_batches_with_repeated_ids(rewards):
+    # Las observaciones repetidas de una instancia en el lote se agregan como en update_batch
+    pool, algo = UCB1Pool(N, K), UCB1(K)
+    arms = np.array([0, 1, 1, 2, 3, 3, 3])
+    pool.update(np.full(len(arms), 2), arms, rewards[0, 2, arms])
+    algo.update_batch(arms, rewards[0, 2, arms])
+
+    np.testing.assert_array_equal(pool.counts[2], algo.counts)
+    np.testing.assert_allclose(pool.values[2], algo.values, rtol=1e-6)
+    assert not pool.counts[[0, 1, 3, 4, 5]].any()
+
+
+@pytest.mark.parametrize('pool_class', [EpsilonGreedyPool, UCB1Pool])
+def test_save_and_load_with_mmap(pool_class, rewards, tmp_path):
+    pool = pool_class(N, K, count_dtype=np.uint16, value_dtype=np.float16, rng=1)
+    ids = np.arange(N)
+    for t in range(20):
+        arms = pool.select(ids)
+        pool.update(ids, arms, rewards[t, ids, arms])
+    pool.save(str(tmp_path))
+
+    loaded = BanditPool.load(str(tmp_path), mmap_mode='r+')
+    assert type(loaded) is pool_class and loaded.n == N and loaded.params() == pool.params()
+    assert isinstance(loaded.counts, np.memmap) and isinstance(loaded.values, np.memmap)
+    assert loaded.counts.dtype == np.uint16 and loaded.values.dtype == np.float16
+    np.testing.assert_array_equal(loaded.counts, pool.counts)
+    np.testing.assert_array_equal(loaded.values, pool.values)
+
+    # Con 'r+' las actualizaciones se escriben en los ficheros
+    loaded.update([4], [1], [2.0])
+    pool.update([4], [1], [2.0])
+    loaded.flush()
+    del loaded
+    reloaded = BanditPool.load(str(tmp_path), mmap_mode=None)
+    assert not isinstance(reloaded.counts, np.memmap)
+    np.testing.assert_array_equal(reloaded.counts, pool.counts)
+    np.testing.assert_array_equal(reloaded.values, pool.values)
+
+    # Con 'r' el conjunto se puede consultar pero no modificar
+    readonly = BanditPool.load(str(tmp_path), mmap_mode='r')
+    assert readonly.select(ids).shape == (N,)
+    if pool_class is UCB1Pool:
+        np.testing.assert_array_equal(readonly.select(ids), pool.select(ids))
+    with pytest.raises(ValueError):
+        readonly.update([0], [0], [1.0])
@@ -0,0 +1,82 @@
+"""
+Module: tests/test_server.py
+Description: Comprueba los contadores del servidor de políticas (PolicyServer) y que una recompensa
+             que el algoritmo no puede registrar deja su decisión pendiente para volver a enviarla.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from algorithms import UCB1
+from serving import PolicyServer
+
+K = 3
+
+
+class FlakyUCB1(UCB1):
+    """
+    UCB1 cuyo update_batch falla mientras fail es cierto.
+    """
+    fail = False
+
+    def update_batch(self, chosen_arms: np.ndarray, rewards: np.ndarray):
+        if self.fail:
+            raise RuntimeError("Fallo del almacenamiento del algoritmo.")
+        super().update_batch(chosen_arms, rewards)
+
+
+def test_failed_update_keeps_the_decision_outstanding():
+    async def scenario():
+        algorithm = FlakyUCB1(K)
+        async with PolicyServer(algorithm) as server:
+            decision = await server.select()
+
+            algorithm.fail = True
+            with pytest.raises(RuntimeError):
+                await server.update(decision, 1.0)
+            assert decision.id in server.outstanding
+            assert (server.stats.updates, server.stats.rejected) == (0, 1)
+
+            # La misma recompensa se acepta al reenviarla, y solo una vez
+            algorithm.fail = False
+            await server.update(decision, 1.0)
+            with pytest.raises(KeyError):
+                await server.update(decision, 1.0)
+
+        assert (server.stats.decisions, server.stats.updates, server.stats.rejected) == (1, 1, 2)
+        assert algorithm.counts.sum() == 1 and server.observed == 1
+        assert not server.outstanding
+
+    asyncio.run(scenario())
+
+
+def test_counters_with_duplicate_rewards_in_a_batch():
+    async def scenario():
+        algorithm = UCB1(K)
+        async with PolicyServer(algorithm) as server:
+            decisions = await asyncio.gather(*(server.select() for _ in range(4)))
+            # Dos recompensas de la primera decisión en el mismo lote: se rechaza la segunda
+            results = await asyncio.gather(*(server.update(decision, 0.5) for decision in decisions),
+                                           server.update(decisions[0], 0.5), server.update(99, 0.5),
+                                           return_exceptions=True)
+            snapshot = server.stats.snapshot()
+
+        assert results[:4] == [None] * 4
+        assert all(isinstance(result, KeyError) for result in results[4:])
+        assert (snapshot['decisions'], snapshot['updates'], snapshot['rejected']) == (4, 4, 2)
+        assert snapshot['batches'] == 2
+        assert snapshot['mean_batch_size'] == pytest.approx(10 / 2)
+        assert algorithm.counts.sum() == 4 and not server.outstanding
+
+    asyncio.run(scenario())
@@ -0,0 +1,55 @@
+"""
+Module: tests/test_sweep.py
+Description: Comprueba que cada configuración de un barrido (run_sweep) da el mismo resultado que
+             un experimento independiente (run_experiment) con los mismos parámetros y semilla.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+
+from algorithms import EpsilonGreedy, UCB1, UCB2
+from arms import ArmBernoulli, ArmNormal, Bandit
+from experiments import run_experiment, run_sweep
+
+K = 4
+STEPS = 200
+
+
+def test_deterministic_sweep_points_match_run_experiment():
+    # Con recompensas deterministas (p = 0 o 1) las políticas UCB no dependen de las recompensas
+    # que reciben las demás filas del barrido, por lo que cada punto coincide exactamente
+    bandit = Bandit([ArmBernoulli(0.0), ArmBernoulli(1.0), ArmBernoulli(0.0), ArmBernoulli(1.0)])
+    sweep = run_sweep(bandit, {UCB1: {'c': [0.1, 0.5, 1]}, UCB2: {'alfa': [0.1, 0.5]}}, STEPS, 5, seed=1)
+
+    for i, algo in enumerate(sweep.algorithms):
+        params = {'c': algo.c} if isinstance(algo, UCB1) else {'alfa': algo.alfa}
+        result = run_experiment(bandit, [type(algo)(K, **params)], STEPS, 5, seed=1)
+
+        np.testing.assert_allclose(sweep.regret_accumulated[i], result.regret_accumulated[0])
+        np.testing.assert_allclose(sweep.optimal_selections[i], result.optimal_selections[0])
+        np.testing.assert_allclose(sweep.rewards[i], result.rewards[0])
+        np.testing.assert_allclose(sweep.arm_selections[i], result.arm_stats[0]['selections'])
+        np.testing.assert_allclose(sweep.arm_rewards[i], result.arm_stats[0]['mean_rewards'])
+
+
+def test_random_sweep_points_agree_with_run_experiment():
+    runs = 400
+    bandit = Bandit(ArmNormal.generate_arms(K, rng=1))
+    sweep = run_sweep(bandit, {EpsilonGreedy: {'epsilon': [0.05, 0.3]}}, STEPS, runs, seed=2)
+    regret = sweep.series['regret_accumulated']
+
+    for i, epsilon in enumerate([0.05, 0.3]):
+        result = run_experiment(bandit, [EpsilonGreedy(K, epsilon=epsilon)], STEPS, runs, seed=2)
+        single = result.series['regret_accumulated']
+
+        # Regret final medio dentro de 4 errores típicos de la diferencia
+        error = np.sqrt((regret.std[i, -1] ** 2 + single.std[0, -1] ** 2) / runs)
+        assert abs(regret.mean[i, -1] - single.mean[0, -1]) < 4 * error
@@ -0,0 +1,113 @@
+"""
+Module: tests/test_update_batch.py
+Description: Comprueba que registrar un lote de observaciones con update_batch deja cada algoritmo
+             en el mismo estado que registrarlas una a una con update, en el mismo orden.
+
+Author: Jesús Verdú Chacón & Jorge López Abad
+Email: jesus.v.c@um.es & jorge.lopeza@um.es
+Date: 2025/03/10
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import inspect
+
+import numpy as np
+import pytest
+
+from algorithms import (EpsilonGreedy, UCB1, LazyUCB1, UCB2, Softmax, Gradiente, SlidingWindowUCB1,
+                        DiscountedUCB1, SlidingWindowEpsilonGreedy, DiscountedEpsilonGreedy)
+
+K = 5
+WARMUP = 40  # Pasos secuenciales antes del lote, para partir de un estado no trivial
+BATCH = 60
+
+# Constructores de cada algoritmo; las dos copias de cada prueba usan la misma semilla
+ALGORITHMS = {
+    'EpsilonGreedy': lambda: EpsilonGreedy(K, epsilon=0.2, rng=1),
+    'UCB1': lambda: UCB1(K, rng=1),
+    'LazyUCB1': lambda: LazyUCB1(K, rng=1),
+    'UCB2': lambda: UCB2(K, alfa=0.5, rng=1),
+    'Softmax': lambda: Softmax(K, tau=0.5, rng=1),
+    'Gradiente': lambda: Gradiente(K, alfa=0.1, rng=1),
+    'SlidingWindowUCB1': lambda: SlidingWindowUCB1(K, window=30, rng=1),
+    'DiscountedUCB1': lambda: DiscountedUCB1(K, gamma=0.95, rng=1),
+    'SlidingWindowEpsilonGreedy': lambda: SlidingWindowEpsilonGreedy(K, epsilon=0.2, window=30, rng=1),
+    'DiscountedEpsilonGreedy': lambda: DiscountedEpsilonGreedy(K, epsilon=0.2, gamma=0.95, rng=1),
+}
+
+
+def select(algo, t: int) -> int:
+    """
+    Selecciona un brazo con select_arm, que en UCB1 y UCB2 depende del instante t.
+    """
+    if 't' not in inspect.signature(algo.select_arm).parameters:
+        return algo.select_arm()
+    chosen = algo.select_arm(t)
+    # UCB2 devuelve además la longitud de la época
+    return int(chosen[0]) if isinstance(chosen, tuple) else int(chosen)
+
+
+def update(algo, chosen_arm: int, reward: float, t: int):
+    """
+    Registra una observación con update; Gradiente necesita además el instante t.
+    """
+    if isinstance(algo, Gradiente):
+        algo.update(chosen_arm, reward, t)
+    else:
+        algo.update(chosen_arm, reward)
+
+
+def live_entries(algo) -> list:
+    """
+    Entradas vigentes (versión actual del brazo) del montículo perezoso, como (brazo, cota).
+    Las entradas obsoletas se descartan al seleccionar, por lo que no forman parte del estado.
+    """
+    return sorted((arm, -neg_bound) for neg_bound, arm, version in algo.heap if version == algo.versions[arm])
+
+
+@pytest.fixture
+def history():
+    """
+    Brazos y recompensas del calentamiento y del lote (con brazos repetidos).
+    """
+    rng = np.random.default_rng(7)
+    return rng.normal(size=WARMUP), rng.integers(K, size=BATCH), rng.normal(size=BATCH)
+
+
+@pytest.mark.parametrize('name', list(ALGORITHMS))
+def test_update_batch_matches_sequential_updates(name, history):
+    warmup_rewards, batch_arms, batch_rewards = history
+    batched, sequential = ALGORITHMS[name](), ALGORITHMS[name]()
+
+    # Mismo historial secuencial en las dos copias (next_arm respeta las épocas de UCB2)
+    for algo in (batched, sequential):
+        for t, reward in enumerate(warmup_rewards):
+            update(algo, algo.next_arm(t), reward, t)
+
+    batched.update_batch(batch_arms, batch_rewards)
+    for i, (arm, reward) in enumerate(zip(batch_arms.tolist(), batch_rewards.tolist())):
+        update(sequential, arm, reward, WARMUP + i)
+
+    np.testing.assert_array_equal(batched.counts, sequential.counts)
+    np.testing.assert_allclose(batched.values, sequential.values, rtol=1e-12, atol=1e-12)
+
+    if isinstance(batched, Gradiente):
+        np.testing.assert_allclose(batched.hs, sequential.hs, rtol=1e-12, atol=1e-12)
+        assert batched.average_rewards == pytest.approx(sequential.average_rewards, rel=1e-12, abs=1e-12)
+
+    if hasattr(batched, 'heap'):
+        # Índices perezosos de EpsilonGreedy y LazyUCB1
+        batched_entries, sequential_entries = live_entries(batched), live_entries(sequential)
+        assert [arm for arm, _ in batched_entries] == [arm for arm, _ in sequential_entries] == list(range(K))
+        np.testing.assert_allclose([bound for _, bound in batched_entries],
+                                   [bound for _, bound in sequential_entries], rtol=1e-12, atol=1e-12)
+    if isinstance(batched, LazyUCB1):
+        assert batched.unpulled == sequential.unpulled
+        assert batched.horizon == sequential.horizon
+
+    t = WARMUP + BATCH
+    assert select(batched, t) == select(sequential, t)